@@ -7,7 +7,10 @@ import streamlit as st
 from pathlib import Path
 import sys
 from datetime import datetime
-import traceback
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+import hashlib
+import time
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -20,22 +23,21 @@ from config.settings import (
     OUTPUT_DIR,
     TEMP_DIR,
     ENABLE_MULTI_AGENT,
-    NUM_WORKER_AGENTS
+    NUM_WORKER_AGENTS,
+    ENABLE_SUMMARY_CACHE,
+    ENABLE_SUMMARY_SIMILARITY_CACHE,
+    COST_LOG_PATH,
+    ensure_directories
 )
-from src.pdf_processor import process_multiple_pdfs
-from src.rag_system import RAGSystem
-from src.comprehensive_analyzer import ComprehensiveAnalyzer
-from src.multi_agent_system import MultiAgentOrchestrator
-from src.multi_agent_integration import create_comprehensive_summary_with_routing, should_use_multi_agent
-from src.cost_tracker import CostTracker
+# Heavy modules (PyMuPDF, torch/sentence-transformers, reportlab, Anthropic clients)
+# are imported inside the functions that use them to keep app start-up fast
+from src.local_llm_handler import get_available_models
 from src.citation_manager import CitationManager
-from src.summary_report_generator import SummaryReportGenerator
-from src.document_session import DocumentSession, SessionManager
-from src.chatbot import DocumentChatbot
-from chatbot_ui import display_chatbot_tab, save_session_after_processing
+from src.summary_cache import SummaryCache
+from chatbot_ui import display_chatbot_tab, save_session_after_processing, get_shared_embeddings
 from src.ui.social_media_ui import social_media_automation_page
 from src.ui.resume_ui import resume_maker_page
-from utils.file_utils import save_uploaded_file, cleanup_temp_files, get_file_info
+from utils.file_utils import save_uploaded_file_with_digest, cleanup_temp_files, get_file_info
 from utils.logger import get_logger
 from utils.exceptions import (
     ResearchAssistantError,
@@ -57,8 +59,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (module constant; emitted by inject_styles() each run)
+STYLES_HTML = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -98,7 +100,42 @@ st.markdown("""
         background-color: #3498db;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+
+def inject_styles():
+    """Emit the app stylesheet (Streamlit drops elements not re-sent on a rerun)"""
+    st.markdown(STYLES_HTML, unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_cost_tracker():
+    """Shared cost tracker; logged costs are appended to disk, not held in memory"""
+    from src.cost_tracker import CostTracker
+    return CostTracker(log_path=COST_LOG_PATH)
+
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer(model_mode, local_model_name):
+    """Shared analyzer per (model_mode, local model) so clients are built once per process"""
+    from src.comprehensive_analyzer import ComprehensiveAnalyzer
+    return ComprehensiveAnalyzer(
+        model_mode=model_mode,
+        local_model_name=local_model_name
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_orchestrator(num_workers):
+    """Shared multi-agent orchestrator per worker count"""
+    from src.multi_agent_system import MultiAgentOrchestrator
+    return MultiAgentOrchestrator(num_workers=num_workers)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_available_models():
+    """Ollama model list, cached briefly so sidebar reruns don't hit the server"""
+    return get_available_models()
 
 
 def initialize_session_state():
@@ -114,7 +151,7 @@ def initialize_session_state():
     if 'multi_agent_orchestrator' not in st.session_state:
         st.session_state.multi_agent_orchestrator = None
     if 'cost_tracker' not in st.session_state:
-        st.session_state.cost_tracker = CostTracker()
+        st.session_state.cost_tracker = get_cost_tracker()
     if 'citation_manager' not in st.session_state:
         st.session_state.citation_manager = None
     if 'analysis_complete' not in st.session_state:
@@ -143,6 +180,7 @@ def reset_session():
     st.session_state.processed_files = []
     st.session_state.pdf_data = None
     st.session_state.rag_system = None
+    st.session_state.rag_batch_digest = None
     st.session_state.analysis_complete = False
     st.session_state.report_path = None
     # Keep analyzer and citation_manager to avoid re-initialization
@@ -187,7 +225,8 @@ def display_sidebar():
         # Store model mode in session state
         if 'model_mode' not in st.session_state or st.session_state.model_mode != model_mode:
             st.session_state.model_mode = model_mode
-            # Clear analyzer to force re-initialization with new mode
+            # Release cached analyzers so the new mode gets a fresh client
+            get_analyzer.clear()
             st.session_state.comprehensive_analyzer = None
 
         # Show model-specific info
@@ -201,12 +240,12 @@ def display_sidebar():
 
             # Try to get available models
             try:
-                from src.local_llm_handler import get_available_models
-                available_models = get_available_models()
+                available_models = _cached_available_models()
 
                 if available_models:
-                    # Extract model names
+                    # Extract model names, plus a name -> (position, model) index
                     model_names = [model.get('name', 'unknown') for model in available_models]
+                    models_by_name = {name: (i, model) for i, (name, model) in enumerate(zip(model_names, available_models))}
 
                     # Get model sizes for display
                     model_info = {
@@ -221,23 +260,30 @@ def display_sidebar():
                     current_model = st.session_state.get('selected_local_model', model_names[0] if model_names else 'llama3.1:latest')
 
                     # Ensure current model is in the list
-                    if current_model not in model_names and model_names:
+                    if current_model not in models_by_name and model_names:
                         current_model = model_names[0]
 
                     # Model selector with size info
-                    selected_model = st.selectbox(
-                        "Available Models:",
-                        options=model_names,
-                        index=model_names.index(current_model) if current_model in model_names else 0,
-                        format_func=lambda x: f"{x} ({model_info.get(x, 'unknown size')})",
-                        help="Select which local model to use for analysis"
-                    )
+                    select_col, refresh_col = st.columns([4, 1])
+                    with select_col:
+                        selected_model = st.selectbox(
+                            "Available Models:",
+                            options=model_names,
+                            index=models_by_name[current_model][0] if current_model in models_by_name else 0,
+                            format_func=lambda x: f"{x} ({model_info.get(x, 'unknown size')})",
+                            help="Select which local model to use for analysis"
+                        )
+                    with refresh_col:
+                        if st.button("🔄", help="Refresh models", key="refresh_local_models"):
+                            _cached_available_models.clear()
+                            st.rerun()
 
                     # Store selection
                     previous_model = st.session_state.get('selected_local_model')
                     if selected_model != previous_model:
                         st.session_state.selected_local_model = selected_model
-                        # Clear analyzer to force re-initialization with new model
+                        # Release cached analyzers so the new model is loaded
+                        get_analyzer.clear()
                         st.session_state.comprehensive_analyzer = None
 
                         # Only show "switched" message if there was a previous model
@@ -247,7 +293,7 @@ def display_sidebar():
                             st.info(f"📦 Selected model: {selected_model}")
 
                     # Show model details
-                    selected_model_data = next((m for m in available_models if m.get('name') == selected_model), None)
+                    selected_model_data = models_by_name.get(selected_model, (None, None))[1]
                     if selected_model_data:
                         with st.expander("ℹ️ Model Details", expanded=False):
                             st.write(f"**Name:** {selected_model}")
@@ -258,7 +304,10 @@ def display_sidebar():
                 else:
                     st.warning("⚠️ No models found. Please install a model:")
                     st.code("ollama pull llama3.1", language="bash")
-                    st.caption("Then restart or refresh the page")
+                    st.caption("Then restart or refresh the model list")
+                    if st.button("🔄 Refresh models", key="refresh_local_models_empty"):
+                        _cached_available_models.clear()
+                        st.rerun()
                     # Set default
                     if 'selected_local_model' not in st.session_state:
                         st.session_state.selected_local_model = 'llama3.1:latest'
@@ -322,6 +371,15 @@ def display_sidebar():
             st.success("✅ Analysis complete")
 
 
+def _persist_upload(uploaded_file):
+    """Save one uploaded file, returning (name, path, info, digest, error)"""
+    try:
+        file_path, digest = save_uploaded_file_with_digest(uploaded_file, UPLOAD_DIR)
+        return uploaded_file.name, file_path, get_file_info(file_path), digest, None
+    except (FileSizeError, FileFormatError) as e:
+        return uploaded_file.name, None, None, None, str(e)
+
+
 def upload_documents():
     """Handle document upload"""
     st.header("📤 Upload Research Papers")
@@ -344,31 +402,41 @@ def upload_documents():
         saved_paths = []
         errors = []
 
-        for uploaded_file in uploaded_files:
-            try:
-                # Save file
-                file_path = save_uploaded_file(uploaded_file, UPLOAD_DIR)
-                file_info = get_file_info(file_path)
+        # Save files concurrently; map() preserves upload order for display
+        with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+            results = list(executor.map(_persist_upload, uploaded_files))
+
+        # Identical content uploaded twice (e.g. a renamed copy) is only processed once;
+        # maps digest -> (name, path) of the copy that is kept
+        seen_digests = {}
+
+        for name, file_path, file_info, digest, error in results:
+            col1, col2, col3 = st.columns([3, 1, 1])
+            with col1:
+                st.text(f"📄 {name}")
 
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.text(f"📄 {uploaded_file.name}")
+            if error is None and digest in seen_digests:
+                kept_name, kept_path = seen_digests[digest]
+                if file_path != kept_path:
+                    file_path.unlink(missing_ok=True)
+                with col2:
+                    st.text(f"duplicate of {kept_name}")
+                with col3:
+                    st.text("⚠️ skipped")
+            elif error is None:
+                seen_digests[digest] = (name, file_path)
                 with col2:
                     st.text(f"{file_info['size_mb']:.2f} MB")
                 with col3:
                     st.text("✅")
 
                 saved_paths.append(file_path)
-
-            except (FileSizeError, FileFormatError) as e:
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.text(f"📄 {uploaded_file.name}")
+            else:
                 with col2:
                     st.text("")
                 with col3:
                     st.text("❌")
-                errors.append(f"{uploaded_file.name}: {str(e)}")
+                errors.append(f"{name}: {error}")
 
         if errors:
             st.error("**Errors:**\n" + "\n".join(f"- {err}" for err in errors))
@@ -380,16 +448,63 @@ def upload_documents():
     return None
 
 
+def _render_sections_preview(sections):
+    """Render completed summary sections as markdown while analysis is still running"""
+    return "\n\n---\n\n".join(
+        f"### 📌 {section.get('title', 'Section')}\n\n{section.get('content', '')}"
+        for section in sections
+    )
+
+
+def _pdf_batch_digest(pdf_data):
+    """Digest identifying the exact set of documents indexed into the RAG system"""
+    hasher = hashlib.sha256()
+    for entry in sorted(f"{d.get('content_hash', '')}:{d.get('doc_name', '')}" for d in pdf_data):
+        hasher.update(entry.encode())
+    return hasher.hexdigest()
+
+
+def _document_set_fingerprint(rag_system, pdf_data):
+    """Embed each document's content fingerprint for the summary cache similarity tier"""
+    texts = SummaryCache.fingerprint_texts(pdf_data)
+    if not texts:
+        return None
+    try:
+        return [[float(x) for x in e] for e in rag_system.embeddings.embed_documents(texts)]
+    except Exception as e:
+        logger.debug(f"Could not fingerprint document set: {str(e)}")
+        return None
+
+
+class ThrottledProgress:
+    """Wraps st.progress and drops updates that arrive within min_interval of the last one"""
+
+    def __init__(self, bar, min_interval=0.1):
+        self.bar = bar
+        self.min_interval = min_interval
+        self._last_update = 0.0
+
+    def progress(self, value):
+        """Update the bar unless the last update was too recent (100% always goes through)"""
+        now = time.monotonic()
+        if value >= 100 or now - self._last_update >= self.min_interval:
+            self.bar.progress(value)
+            self._last_update = now
+
+
 def process_documents(file_paths):
     """Process uploaded PDF documents"""
     st.header("⚙️ Processing Documents")
 
     try:
-        import time
+        from src.pdf_processor import process_multiple_pdfs
+        from src.rag_system import RAGSystem
+        from src.multi_agent_integration import create_comprehensive_summary_with_routing_stream, should_use_multi_agent
+
         start_time = time.time()
 
-        # Progress tracking
-        progress_bar = st.progress(0)
+        # Progress tracking (updates closer than 100 ms apart are coalesced)
+        progress_bar = ThrottledProgress(st.progress(0))
         status_text = st.empty()
         timing_text = st.empty()
 
@@ -398,7 +513,15 @@ def process_documents(file_paths):
         status_text.text("📖 Extracting text and images from PDFs...")
         progress_bar.progress(10)
 
-        pdf_data = process_multiple_pdfs(file_paths, extract_images=True)
+        def _on_pdf_extracted(done, total):
+            progress_bar.progress(10 + int(20 * done / total))
+            status_text.text(f"📖 {done}/{total} PDFs extracted")
+
+        pdf_data = process_multiple_pdfs(
+            file_paths,
+            extract_images=True,
+            progress_callback=_on_pdf_extracted
+        )
 
         if not pdf_data:
             st.error("❌ Failed to process any documents")
@@ -407,8 +530,10 @@ def process_documents(file_paths):
         st.session_state.pdf_data = pdf_data
 
         # Display extraction summary
-        total_pages = sum(d.get('total_pages', 0) for d in pdf_data)
-        total_images = sum(d.get('total_images', 0) for d in pdf_data)
+        total_pages = total_images = 0
+        for d in pdf_data:
+            total_pages += d.get('total_pages', 0)
+            total_images += d.get('total_images', 0)
 
         step_time = time.time() - step_start
         status_text.success(
@@ -422,11 +547,20 @@ def process_documents(file_paths):
         status_text.text("🔍 Initializing document analysis system...")
 
         if not st.session_state.rag_system:
-            st.session_state.rag_system = RAGSystem()
-
-        # Process documents for RAG
-        chunk_count = st.session_state.rag_system.process_documents(pdf_data)
-        status_text.success(f"✅ Created {chunk_count} searchable chunks")
+            st.session_state.rag_system = RAGSystem(embeddings=get_shared_embeddings())
+            st.session_state.rag_batch_digest = None
+
+        # Process documents for RAG (skipped when this exact batch is already indexed)
+        batch_digest = _pdf_batch_digest(pdf_data)
+        if (st.session_state.get('rag_batch_digest') == batch_digest
+                and len(st.session_state.rag_system.chunks_metadata) == st.session_state.get('rag_chunk_count')):
+            chunk_count = st.session_state.rag_chunk_count
+            status_text.success(f"✅ Reusing {chunk_count} searchable chunks")
+        else:
+            chunk_count = st.session_state.rag_system.process_documents(pdf_data)
+            st.session_state.rag_batch_digest = batch_digest
+            st.session_state.rag_chunk_count = chunk_count
+            status_text.success(f"✅ Created {chunk_count} searchable chunks")
         progress_bar.progress(50)
 
         # Step 3: Initialize comprehensive analyzer
@@ -451,22 +585,22 @@ def process_documents(file_paths):
         if not st.session_state.comprehensive_analyzer:
             try:
                 # Pass selected model name for local mode
-                st.session_state.comprehensive_analyzer = ComprehensiveAnalyzer(
-                    model_mode=model_mode,
-                    local_model_name=selected_local_model if model_mode == "local" else None
+                st.session_state.comprehensive_analyzer = get_analyzer(
+                    model_mode,
+                    selected_local_model if model_mode == "local" else None
                 )
             except ClaudeAPIError as e:
                 st.error(f"❌ Failed to initialize analyzer: {str(e)}")
                 logger.error(f"Analyzer initialization failed: {str(e)}")
                 return False
 
-        # Initialize multi-agent orchestrator (if using API mode)
-        if model_mode == "api" and should_use_multi_agent(model_mode):
+        # Initialize multi-agent orchestrator (if using API mode); the routing
+        # decision is made once here and reused for the rest of the run
+        use_multi_agent = should_use_multi_agent(model_mode)
+        if use_multi_agent:
             if not st.session_state.multi_agent_orchestrator:
                 try:
-                    st.session_state.multi_agent_orchestrator = MultiAgentOrchestrator(
-                        num_workers=NUM_WORKER_AGENTS
-                    )
+                    st.session_state.multi_agent_orchestrator = get_orchestrator(NUM_WORKER_AGENTS)
                     logger.info(f"🚀 Multi-Agent Orchestrator initialized ({NUM_WORKER_AGENTS} workers)")
                 except Exception as e:
                     st.warning(f"⚠️  Multi-agent initialization failed, falling back to single-agent: {str(e)}")
@@ -477,7 +611,7 @@ def process_documents(file_paths):
             st.session_state.citation_manager = CitationManager()
 
         # Display which system is being used
-        if should_use_multi_agent(model_mode) and st.session_state.multi_agent_orchestrator:
+        if use_multi_agent and st.session_state.multi_agent_orchestrator:
             status_text.success(f"✅ Multi-Agent Research System ready (1 Lead + {NUM_WORKER_AGENTS} Workers)")
             st.info("🚀 **Using Multi-Agent Architecture** (Opus 4 for planning + Sonnet 4 for execution)")
         else:
@@ -486,7 +620,7 @@ def process_documents(file_paths):
         progress_bar.progress(60)
 
         # Step 4: Create comprehensive summary with cross-document synthesis
-        if should_use_multi_agent(model_mode) and st.session_state.multi_agent_orchestrator:
+        if use_multi_agent and st.session_state.multi_agent_orchestrator:
             status_text.text("🚀 Multi-Agent Research: Planning and executing parallel analysis...")
             status_text.info("⏳ Lead Agent is decomposing research into subtasks and coordinating worker agents...")
         else:
@@ -496,22 +630,61 @@ def process_documents(file_paths):
         # Get report mode from session state
         report_mode = st.session_state.get('report_mode', 'quick')
 
-        # Create comprehensive summary using routing (multi-agent or single-agent)
-        summary_data = create_comprehensive_summary_with_routing(
-            model_mode=model_mode,
-            comprehensive_analyzer=st.session_state.comprehensive_analyzer,
-            multi_agent_orchestrator=st.session_state.multi_agent_orchestrator,
-            rag_system=st.session_state.rag_system,
-            documents_data=pdf_data,
-            focus_areas=None,  # Use default focus areas
-            report_mode=report_mode
-        )
+        # Reuse a cached summary when this exact (or, if enabled, a near-identical) document
+        # set was already analyzed with the same settings
+        cache_model_key = f"local:{selected_local_model}" if model_mode == "local" else model_mode
+        summary_cache = SummaryCache() if ENABLE_SUMMARY_CACHE else None
+        cache_key = settings_key = fingerprint = None
+        page_counts = SummaryCache.page_counts(pdf_data)
+        summary_data = None
+        if summary_cache:
+            cache_key = SummaryCache.make_key(pdf_data, cache_model_key, report_mode, None)
+            settings_key = SummaryCache.settings_key(cache_model_key, report_mode, None)
+            summary_data = summary_cache.get(cache_key)
+            if summary_data is None and ENABLE_SUMMARY_SIMILARITY_CACHE:
+                fingerprint = _document_set_fingerprint(st.session_state.rag_system, pdf_data)
+                if fingerprint is not None:
+                    summary_data = summary_cache.find_similar(settings_key, fingerprint, page_counts)
+
+        from_cache = summary_data is not None
+        if from_cache:
+            st.info("♻️ Reusing cached summary for this document set")
+        else:
+            # Create comprehensive summary using routing (multi-agent or single-agent),
+            # rendering each section as soon as it is ready
+            summary_data = {}
+            completed_sections = []
+            section_slot = st.empty()
+            for event in create_comprehensive_summary_with_routing_stream(
+                model_mode=model_mode,
+                comprehensive_analyzer=st.session_state.comprehensive_analyzer,
+                multi_agent_orchestrator=st.session_state.multi_agent_orchestrator,
+                rag_system=st.session_state.rag_system,
+                documents_data=pdf_data,
+                focus_areas=None,  # Use default focus areas
+                report_mode=report_mode
+            ):
+                if event['kind'] == 'section':
+                    completed_sections.append(event['data'])
+                    section_slot.markdown(_render_sections_preview(completed_sections))
+                    status_text.text(f"🔬 Completed {len(completed_sections)} section(s)...")
+                    progress_bar.progress(min(85, 60 + 5 * len(completed_sections)))
+                elif event['kind'] == 'summary':
+                    summary_data = event['data']
+            section_slot.empty()
+
+            if summary_cache and summary_data.get('detailed_sections'):
+                summary_cache.set(cache_key, summary_data, settings_key, fingerprint, page_counts)
 
         status_text.success(f"✅ Comprehensive summary complete!")
 
         # Display cost information if multi-agent was used
-        if 'total_cost' in summary_data and summary_data.get('total_cost', 0) > 0:
+        if not from_cache and summary_data.get('total_cost', 0) > 0:
             st.session_state.cost_tracker.display_research_cost(summary_data)
+            st.session_state.cost_tracker.log_cost(
+                "Summary: " + ", ".join(d.get('doc_name', '') for d in pdf_data),
+                summary_data
+            )
 
         # Display source diversity information if multi-agent with web search was used
         if 'source_diversity' in summary_data and summary_data['source_diversity']:
@@ -532,6 +705,10 @@ def process_documents(file_paths):
 
         progress_bar.progress(90)
 
+        # Build each section's markdown once so display_results only emits it
+        for section in summary_data.get('detailed_sections', []):
+            section['_body_md'] = _render_section_markdown(section)
+
         # Store results
         st.session_state.summary_data = summary_data
         st.session_state.analysis_results = {
@@ -570,10 +747,67 @@ def process_documents(file_paths):
 
     except Exception as e:
         st.error(f"❌ **Unexpected Error**: {str(e)}")
-        logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+        logger.exception(f"Unexpected error: {str(e)}")
         return False
 
 
+def _canonicalize_sources(sources):
+    """Group section sources into {doc_name: sorted unique pages}"""
+    pages_by_doc = defaultdict(set)
+    for source in sources:
+        # Handle both string format ("doc.pdf, p.1") and dict format
+        if isinstance(source, str):
+            # Parse string format like "research_paper.pdf, p.1"
+            parts = source.split(',')
+            doc_name = parts[0].strip() if parts else 'Unknown'
+            page = parts[1].strip().replace('p.', '').strip() if len(parts) > 1 else '?'
+        elif isinstance(source, dict):
+            # Handle dictionary format
+            doc_name = source.get('doc_name', 'Unknown')
+            page = source.get('page', '?')
+        else:
+            doc_name = 'Unknown'
+            page = '?'
+
+        # Store digit pages as ints so "p.10" sorts after "p.2"
+        if isinstance(page, str) and page.isdigit():
+            page = int(page)
+
+        pages_by_doc[doc_name].add(page)
+
+    return {doc_name: sorted(pages, key=_page_sort_key) for doc_name, pages in pages_by_doc.items()}
+
+
+def _page_sort_key(page):
+    """Numeric pages first in order, then anything else ("?", ranges) as text"""
+    if isinstance(page, int):
+        return (0, page, '')
+    return (1, 0, str(page))
+
+
+def _render_section_markdown(section):
+    """Section content, image note and sources as a single markdown payload"""
+    parts = [section.get('content', '')]
+
+    # Show image count
+    images = section.get('images', [])
+    if images:
+        parts.append(f"> 📸 {len(images)} images included from source documents")
+
+    # Show sources
+    sources_by_doc = _canonicalize_sources(section.get('sources', []))
+    if sources_by_doc:
+        source_lines = ["**📚 Sources Referenced:**"]
+        for doc_name, pages in sources_by_doc.items():
+            pages_str = ', '.join(map(str, pages[:5]))
+            if len(pages) > 5:
+                pages_str += "..."
+            source_lines.append(f"- **{doc_name}**: Pages {pages_str}")
+        parts.append("\n".join(source_lines))
+
+    return "\n\n".join(parts)
+
+
 def display_results():
     """Display comprehensive summary results"""
     if not st.session_state.analysis_complete:
@@ -592,46 +826,12 @@ def display_results():
 
     for i, section in enumerate(detailed_sections, 1):
         title = section.get('title', f'Section {i}')
-        content = section.get('content', '')
-        sources = section.get('sources', [])
-        images = section.get('images', [])
+        body_md = section.get('_body_md')
+        if body_md is None:
+            body_md = _render_section_markdown(section)
 
         with st.expander(f"📌 {title}", expanded=False):
-            st.markdown(content)
-
-            # Show image count
-            if images:
-                st.info(f"📸 {len(images)} images included from source documents")
-
-            # Show sources
-            if sources:
-                st.markdown("**📚 Sources Referenced:**")
-                # Show unique sources
-                unique_docs = {}
-                for source in sources:
-                    # Handle both string format ("doc.pdf, p.1") and dict format
-                    if isinstance(source, str):
-                        # Parse string format like "research_paper.pdf, p.1"
-                        parts = source.split(',')
-                        doc_name = parts[0].strip() if parts else 'Unknown'
-                        page = parts[1].strip().replace('p.', '').strip() if len(parts) > 1 else '?'
-                    elif isinstance(source, dict):
-                        # Handle dictionary format
-                        doc_name = source.get('doc_name', 'Unknown')
-                        page = source.get('page', '?')
-                    else:
-                        doc_name = 'Unknown'
-                        page = '?'
-
-                    if doc_name not in unique_docs:
-                        unique_docs[doc_name] = []
-                    unique_docs[doc_name].append(page)
-
-                for doc_name, pages in unique_docs.items():
-                    pages_str = ', '.join(map(str, sorted(set(pages))[:5]))
-                    if len(set(pages)) > 5:
-                        pages_str += "..."
-                    st.markdown(f"- **{doc_name}**: Pages {pages_str}")
+            st.markdown(body_md)
 
     # Statistics
     st.subheader("📈 Summary Statistics")
@@ -647,6 +847,12 @@ def display_results():
         st.metric("Summary Sections", len(detailed_sections))
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_report_bytes(path_str, mtime, size):
+    """Report PDF bytes, keyed on (path, mtime, size) so a regenerated file is re-read"""
+    return Path(path_str).read_bytes()
+
+
 def generate_report():
     """Generate and download comprehensive summary PDF"""
     if not st.session_state.analysis_complete:
@@ -663,6 +869,8 @@ def generate_report():
     if st.button("🚀 Generate PDF Summary", type="primary", use_container_width=True):
         try:
             with st.spinner("📄 Creating comprehensive summary document with images and citations..."):
+                from src.summary_report_generator import SummaryReportGenerator
+
                 # Initialize summary report generator
                 report_gen = SummaryReportGenerator()
 
@@ -682,25 +890,32 @@ def generate_report():
                 st.success(f"✅ Summary document generated: {report_path.name}")
 
                 # Show what's included
-                total_sections = len(summary_data.get('detailed_sections', []))
-                total_images = sum(len(s.get('images', [])) for s in summary_data.get('detailed_sections', []))
+                detailed_sections = summary_data.get('detailed_sections', [])
+                total_sections = len(detailed_sections)
+                total_images = 0
+                for section in detailed_sections:
+                    total_images += len(section.get('images', []))
                 st.info(f"✨ Your summary includes:\n- {total_sections} detailed sections\n- {total_images} images from source documents\n- Complete citations and references")
 
         except Exception as e:
             st.error(f"❌ Failed to generate summary document: {str(e)}")
-            logger.error(f"Report generation failed: {str(e)}\n{traceback.format_exc()}")
+            logger.exception(f"Report generation failed: {str(e)}")
 
     # Download button
     if st.session_state.report_path and st.session_state.report_path.exists():
-        with open(st.session_state.report_path, "rb") as f:
-            st.download_button(
-                label="⬇️ Download Summary Document (PDF)",
-                data=f,
-                file_name=st.session_state.report_path.name,
-                mime="application/pdf",
-                use_container_width=True,
-                type="primary"
-            )
+        report_stat = st.session_state.report_path.stat()
+        st.download_button(
+            label="⬇️ Download Summary Document (PDF)",
+            data=_read_report_bytes(
+                str(st.session_state.report_path),
+                report_stat.st_mtime,
+                report_stat.st_size
+            ),
+            file_name=st.session_state.report_path.name,
+            mime="application/pdf",
+            use_container_width=True,
+            type="primary"
+        )
 
     # Return report path for session saving
     return st.session_state.report_path if st.session_state.report_path else None
@@ -710,6 +925,8 @@ def main():
     """Main application with tabbed interface"""
     try:
         # Initialize
+        ensure_directories()
+        inject_styles()
         initialize_session_state()
 
         # Display UI
@@ -775,7 +992,7 @@ def main():
 
     except Exception as e:
         st.error(f"❌ Application Error: {str(e)}")
-        logger.error(f"Application error: {str(e)}\n{traceback.format_exc()}")
+        logger.exception(f"Application error: {str(e)}")
 
         if st.button("🔄 Restart Application"):
             reset_session()
@@ -3,20 +3,102 @@ Chatbot UI Components
 Add these functions to app.py to enable the chatbot feature
 """
 
+import html
+import logging
+import time
+
 import streamlit as st
 from src.document_session import SessionManager
-from src.chatbot import DocumentChatbot
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@st.cache_resource(show_spinner=False)
+def get_shared_embeddings():
+    """Embedding model loaded once per process and shared by every RAGSystem"""
+    from src.rag_system import create_embeddings
+    return create_embeddings()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_sessions_cached():
+    """Session listing, re-read from disk at most every 30 s (cleared on save)"""
+    return SessionManager.list_sessions()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_session_cached(session_id):
+    """Loaded DocumentSession per session_id (cleared when a session is saved or fixed)"""
+    return SessionManager.get_session(session_id)
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _load_session_rag(session_id):
+    """RAG store of a session, loaded once for status checks"""
+    from src.rag_system import RAGSystem
+    session = _get_session_cached(session_id)
+    rag_system = RAGSystem(embeddings=get_shared_embeddings())
+    session.load_rag_system(rag_system, mmap=True)
+    return rag_system
+
+
+@st.cache_data(show_spinner=False)
+def _count_summary_chunks(session_id, summary_pdf_name):
+    """Number of RAG chunks that come from the session's summary PDF"""
+    return len(_load_session_rag(session_id).get_chunk_ids_by_doc_name(summary_pdf_name, partial=True))
+
+
+_SEARCH_STAGE_CAPTIONS = {
+    "summary": "🔍 Answer from: Summary PDF",
+    "sources": "🔍 Answer from: Summary PDF + Source PDFs",
+}
+
+
+def _render_chat_turn(message):
+    """
+    Markdown for one finished chat turn, built once when the turn is stored
+
+    Returns (text, sources_html). The question and answer are drawn without
+    unsafe_allow_html, so model output cannot inject HTML; only the sources
+    list, a collapsed <details> block built here from escaped text in place
+    of an st.expander, is drawn as HTML.
+    """
+    parts = [
+        f"**🧑 You:** {message.get('question', '')}",
+        message.get("answer", "")
+    ]
+
+    caption = _SEARCH_STAGE_CAPTIONS.get(message.get("search_stage"))
+    if caption:
+        parts.append(f"*{caption}*")
+
+    sources_html = ""
+    sources = message.get("sources") or []
+    if sources:
+        lines = "<br>".join(
+            f"<b>{i}.</b> {html.escape(str(source.get('source', '')))} - {html.escape(str(source.get('section', '')))}"
+            for i, source in enumerate(sources, 1)
+        )
+        sources_html = f"<details><summary>📚 Sources ({len(sources)} references)</summary>{lines}</details>"
+
+    return "\n\n".join(parts), sources_html
+
+
+def _invalidate_session_caches():
+    """Drop cached session listings, session objects and RAG status after a session changes"""
+    _list_sessions_cached.clear()
+    _get_session_cached.clear()
+    _load_session_rag.clear()
+    _count_summary_chunks.clear()
+
+
 def display_chatbot_tab():
     """Display the chatbot interface tab"""
     st.header("💬 Chat with Your Documents")
 
     # Load available sessions
-    sessions = SessionManager.list_sessions()
+    sessions = _list_sessions_cached()
 
     if not sessions:
         st.info("""
@@ -35,16 +117,19 @@ def display_chatbot_tab():
         for s in sessions
     }
 
-    selected_session_display = st.selectbox(
-        "Choose a session to chat with:",
-        options=list(session_options.keys()),
-        help="Select which set of documents you want to ask questions about"
-    )
+    # Inside a form, changing the selection only reruns the tab on "Load Session"
+    with st.form("session_controls"):
+        selected_session_display = st.selectbox(
+            "Choose a session to chat with:",
+            options=list(session_options.keys()),
+            help="Select which set of documents you want to ask questions about"
+        )
+        st.form_submit_button("📂 Load Session")
 
     selected_session_id = session_options[selected_session_display]
 
     # Load session
-    session = SessionManager.get_session(selected_session_id)
+    session = _get_session_cached(selected_session_id)
     if not session:
         st.error("Failed to load session")
         return
@@ -70,25 +155,16 @@ def display_chatbot_tab():
             st.write("**Generated Summary:**")
             st.write(f"- ✅ {summary_pdf_name}")
 
-            # Check if summary is in RAG system
-            try:
-                # Load RAG to check if summary chunks exist
-                from src.rag_system import RAGSystem
-                temp_rag = RAGSystem()
-                session.load_rag_system(temp_rag)
-
-                # Count chunks from summary PDF
-                summary_chunks = [
-                    chunk for chunk in temp_rag.chunks_metadata
-                    if summary_pdf_name in chunk.get("doc_name", "")
-                ]
-
-                if summary_chunks:
-                    st.write(f"- 🟢 **RAG Status**: In RAG system ({len(summary_chunks)} chunks)")
-                else:
-                    st.write(f"- 🟡 **RAG Status**: Not in RAG (click 'Fix Session' below)")
-            except Exception as e:
-                st.write(f"- ⚠️ **RAG Status**: Unable to check")
+            if "summary_in_rag" in session.metadata:
+                # Recorded when the summary was added to the RAG store
+                _write_rag_status(session.metadata.get("summary_chunk_count", 0))
+
+            # Legacy sessions: check the RAG store itself (loads it, so on request)
+            elif st.checkbox("Show RAG status", key=f"show_rag_status_{selected_session_id}"):
+                try:
+                    _write_rag_status(_count_summary_chunks(selected_session_id, summary_pdf_name))
+                except Exception as e:
+                    st.write(f"- ⚠️ **RAG Status**: Unable to check")
         else:
             st.write("**Generated Summary:**")
             st.write("- ❌ No summary generated for this session")
@@ -130,39 +206,31 @@ def display_chatbot_tab():
         selected_local_model = st.session_state.get('selected_local_model', None)
 
         try:
+            from src.chatbot import DocumentChatbot
+
             st.session_state.chatbot = DocumentChatbot(
                 session=session,
                 model_mode=model_mode,
-                local_model_name=selected_local_model if model_mode == "local" else None
+                local_model_name=selected_local_model if model_mode == "local" else None,
+                embeddings=get_shared_embeddings()
             )
             logger.info(f"Initialized chatbot for session: {selected_session_id}")
         except Exception as e:
             st.error(f"❌ Failed to initialize chatbot: {str(e)}")
-            logger.error(f"Chatbot initialization error: {str(e)}")
+            logger.exception(f"Chatbot initialization error: {str(e)}")
             return
 
     # Chat interface
     st.subheader("💭 Ask Questions")
 
-    # Display chat history
-    for message in st.session_state.chat_messages:
-        with st.chat_message("user"):
-            st.write(message["question"])
-
-        with st.chat_message("assistant"):
-            st.write(message["answer"])
-
-            # Show search stage indicator
-            search_stage = message.get("search_stage", "unknown")
-            if search_stage == "summary":
-                st.caption("🔍 Answer from: Summary PDF")
-            elif search_stage == "sources":
-                st.caption("🔍 Answer from: Summary PDF + Source PDFs")
-
-            if message.get("sources"):
-                with st.expander(f"📚 Sources ({len(message['sources'])} references)", expanded=False):
-                    for i, source in enumerate(message["sources"], 1):
-                        st.write(f"**{i}.** {source['source']} - {source['section']}")
+    # Display chat history: finished turns are pre-rendered, one text and one sources element each
+    if st.session_state.chat_messages:
+        history = st.container()
+        for i, message in enumerate(st.session_state.chat_messages):
+            text, sources_html = message.get("rendered") or _render_chat_turn(message)
+            history.markdown(f"---\n\n{text}" if i else text)
+            if sources_html:
+                history.markdown(sources_html, unsafe_allow_html=True)
 
     # Chat input
     question = st.chat_input("Ask a question about your documents...")
@@ -172,40 +240,58 @@ def display_chatbot_tab():
         with st.chat_message("user"):
             st.write(question)
 
-        # Get answer from chatbot
+        # Stream answer from chatbot (retrieval and first token under the spinner)
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
-                    result = st.session_state.chatbot.ask_question(question)
-
-                    if result["context_found"]:
-                        st.write(result["answer"])
-
-                        # Show search stage indicator
-                        search_stage = result.get("search_stage", "unknown")
-                        if search_stage == "summary":
-                            st.caption("🔍 Answer from: Summary PDF")
-                        elif search_stage == "sources":
-                            st.caption("🔍 Answer from: Summary PDF + Source PDFs")
-
-                        if result["sources"]:
-                            with st.expander(f"📚 Sources ({len(result['sources'])} references)", expanded=False):
-                                for i, source in enumerate(result["sources"], 1):
-                                    st.write(f"**{i}.** {source['source']} - {source['section']}")
-                    else:
-                        st.write(result["answer"])
-
-                    # Store in chat history
-                    st.session_state.chat_messages.append({
-                        "question": question,
-                        "answer": result["answer"],
-                        "sources": result.get("sources", []),
-                        "search_stage": result.get("search_stage", "unknown")
-                    })
+            try:
+                answer_slot = st.empty()
+                with st.spinner("Thinking..."):
+                    chunks = st.session_state.chatbot.ask_question_stream(question)
+                    answer = next(chunks, "")
+
+                # Redraw at most every 50 ms to keep websocket traffic down
+                last_render = time.monotonic()
+                answer_slot.markdown(answer + "▌")
+                for text in chunks:
+                    answer += text
+                    if time.monotonic() - last_render >= 0.05:
+                        answer_slot.markdown(answer + "▌")
+                        last_render = time.monotonic()
+                answer_slot.markdown(answer)
+
+                result = st.session_state.chatbot.last_metadata() or {
+                    "answer": answer,
+                    "sources": [],
+                    "context_found": False,
+                    "search_stage": "unknown"
+                }
+
+                if result["context_found"]:
+                    # Show search stage indicator
+                    caption = _SEARCH_STAGE_CAPTIONS.get(result.get("search_stage"))
+                    if caption:
+                        st.caption(caption)
+
+                    if result["sources"]:
+                        with st.expander(f"📚 Sources ({len(result['sources'])} references)", expanded=False):
+                            for i, source in enumerate(result["sources"], 1):
+                                st.write(f"**{i}.** {source['source']} - {source['section']}")
+
+                # Store in chat history: the streamed text is what the user saw,
+                # including a partial answer followed by an error
+                message = {
+                    "question": question,
+                    "answer": answer,
+                    "sources": result.get("sources", []),
+                    "search_stage": result.get("search_stage", "unknown")
+                }
+                message["rendered"] = _render_chat_turn(message)
+                st.session_state.chat_messages.append(message)
 
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
-                    logger.error(f"Chatbot error: {str(e)}")
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+                # Question failures are often repeated upstream errors (rate limits);
+                # only pay for the traceback when debugging
+                logger.error(f"Chatbot error: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
 
     # Clear chat button
     col1, col2 = st.columns([6, 1])
@@ -217,6 +303,14 @@ def display_chatbot_tab():
             st.rerun()
 
 
+def _write_rag_status(summary_chunk_count):
+    """Status line for whether the summary PDF is searchable by the chatbot"""
+    if summary_chunk_count:
+        st.write(f"- 🟢 **RAG Status**: In RAG system ({summary_chunk_count} chunks)")
+    else:
+        st.write(f"- 🟡 **RAG Status**: Not in RAG (click 'Fix Session' below)")
+
+
 def regenerate_session_rag(session_id: str) -> bool:
     """
     Regenerate a session's RAG system by adding the saved summary PDF
@@ -257,7 +351,7 @@ def regenerate_session_rag(session_id: str) -> bool:
 
         # Initialize RAG system
         from src.rag_system import RAGSystem
-        rag_system = RAGSystem()
+        rag_system = RAGSystem(embeddings=get_shared_embeddings())
 
         # Load existing RAG store
         try:
@@ -268,46 +362,41 @@ def regenerate_session_rag(session_id: str) -> bool:
             return False
 
         # Check if summary PDF is already in RAG
-        summary_chunks = [
-            chunk for chunk in rag_system.chunks_metadata
-            if summary_pdf_name in chunk.get("doc_name", "")
-        ]
+        summary_chunks = rag_system.get_chunk_ids_by_doc_name(summary_pdf_name, partial=True)
 
         if summary_chunks:
+            session.record_summary_in_rag(len(summary_chunks))
+            _invalidate_session_caches()
             st.info(f"ℹ️ Summary PDF is already in RAG system ({len(summary_chunks)} chunks)")
             return True
 
-        # Process the summary PDF
-        from src.pdf_processor import process_multiple_pdfs
-        logger.info(f"Processing summary PDF: {summary_pdf_name}")
+        # Stream the summary PDF into the RAG system page by page
+        from src.pdf_processor import process_pdfs_iter
+        chunks_before = len(rag_system.chunks_metadata)
+        logger.info(f"Adding summary PDF to RAG: {summary_pdf_name} (current chunks: {chunks_before})")
 
-        with st.spinner("Processing summary PDF..."):
-            summary_pdf_data = process_multiple_pdfs([summary_pdf_path])
+        with st.spinner("Adding summary PDF to RAG system..."):
+            new_chunks = rag_system.add_documents_iter(process_pdfs_iter([summary_pdf_path]))
 
-        if not summary_pdf_data:
+        if not new_chunks:
             st.error("❌ Failed to process summary PDF")
             return False
 
-        # Add summary to RAG system
-        chunks_before = len(rag_system.chunks_metadata)
-        logger.info(f"Adding summary PDF to RAG (current chunks: {chunks_before})")
-
-        with st.spinner("Adding summary to RAG system..."):
-            new_chunks = rag_system.add_documents(summary_pdf_data)
-
         chunks_after = len(rag_system.chunks_metadata)
         logger.info(f"✓ Added {new_chunks} chunks (total: {chunks_before} → {chunks_after})")
 
         # Re-save the session with updated RAG
         with st.spinner("Saving updated session..."):
             session.store_rag_system(rag_system)
+            session.record_summary_in_rag(new_chunks)
+        _invalidate_session_caches()
 
         st.success(f"✅ Successfully added summary PDF to session! ({new_chunks} new chunks)")
         logger.info(f"Session RAG regeneration complete for {session_id}")
         return True
 
     except Exception as e:
-        logger.error(f"Failed to regenerate session RAG: {str(e)}")
+        logger.exception(f"Failed to regenerate session RAG: {str(e)}")
         st.error(f"❌ Regeneration failed: {str(e)}")
         return False
 
@@ -340,22 +429,20 @@ def save_session_after_processing(pdf_paths, summary_pdf_path, session_name=None
 
         # CRITICAL FIX: Add summary PDF to RAG system before saving
         # This ensures the chatbot can search the generated summary
+        new_chunks = 0
         if st.session_state.rag_system and summary_pdf_path and summary_pdf_path.exists():
             try:
-                from src.pdf_processor import process_multiple_pdfs
                 logger.info(f"Processing summary PDF for RAG system: {summary_pdf_path.name}")
 
-                # Process the summary PDF
-                summary_pdf_data = process_multiple_pdfs([summary_pdf_path])
+                # Get current chunk count before adding summary
+                chunks_before = len(st.session_state.rag_system.chunks_metadata)
 
-                if summary_pdf_data:
-                    # Get current chunk count before adding summary
-                    chunks_before = len(st.session_state.rag_system.chunks_metadata)
-
-                    # Add summary PDF chunks to existing RAG system (APPEND, not replace!)
-                    # This uses the new add_documents() method which preserves existing chunks
-                    new_chunks = st.session_state.rag_system.add_documents(summary_pdf_data)
+                # Stream summary PDF chunks into the existing RAG system (APPEND, not replace!)
+                # page by page, so the parsed PDF is never held in memory as a whole
+                from src.pdf_processor import process_pdfs_iter
+                new_chunks = st.session_state.rag_system.add_documents_iter(process_pdfs_iter([summary_pdf_path]))
 
+                if new_chunks:
                     chunks_after = len(st.session_state.rag_system.chunks_metadata)
                     logger.info(f"✓ Added summary PDF to RAG: {new_chunks} new chunks (total: {chunks_before} → {chunks_after})")
                 else:
@@ -364,12 +451,14 @@ def save_session_after_processing(pdf_paths, summary_pdf_path, session_name=None
             except Exception as e:
                 # Don't fail the entire session save if summary processing fails
                 # Just log and continue with source PDFs only
-                logger.error(f"Failed to process summary PDF for RAG: {str(e)}")
+                logger.exception(f"Failed to process summary PDF for RAG: {str(e)}")
                 logger.warning("Session will be saved with source PDFs only (summary PDF file saved but not in RAG)")
 
         # Store RAG system (now includes both source PDFs AND summary PDF)
         if st.session_state.rag_system:
             session.store_rag_system(st.session_state.rag_system)
+            # Lets the chat tab show the RAG status without loading the store
+            session.record_summary_in_rag(new_chunks)
 
         # Update statistics
         if st.session_state.analysis_results:
@@ -378,11 +467,13 @@ def save_session_after_processing(pdf_paths, summary_pdf_path, session_name=None
                 total_images=st.session_state.analysis_results.get('total_images', 0)
             )
 
+        _invalidate_session_caches()
+
         logger.info(f"Session saved successfully: {session.session_id}")
         return session
 
     except Exception as e:
-        logger.error(f"Failed to save session: {str(e)}")
+        logger.exception(f"Failed to save session: {str(e)}")
         st.warning(f"⚠️ Session save failed: {str(e)}")
         return None
 
@@ -463,7 +554,7 @@ def main_with_tabs():
 
     except Exception as e:
         st.error(f"❌ Application Error: {str(e)}")
-        logger.error(f"Application error: {str(e)}")
+        logger.exception(f"Application error: {str(e)}")
 
         if st.button("🔄 Restart Application"):
             reset_session()
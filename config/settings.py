@@ -4,12 +4,12 @@ Handles environment variables and application constants
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
+from typing import Callable, Optional
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 # Base Paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -17,10 +17,16 @@ UPLOAD_DIR = DATA_DIR / "uploads"
 OUTPUT_DIR = DATA_DIR / "outputs"
 TEMP_DIR = DATA_DIR / "temp"
 
-# Ensure directories exist
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-TEMP_DIR.mkdir(parents=True, exist_ok=True)
+# Load environment variables (explicit path, no find_dotenv directory walk)
+load_dotenv(BASE_DIR / ".env")
+
+
+@lru_cache(maxsize=1)
+def ensure_directories():
+    """Create the upload, output and temp directories (once per process)"""
+    for directory in (UPLOAD_DIR, OUTPUT_DIR, TEMP_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+
 
 # Model Selection Configuration
 # Options: "api" (Claude API), "grok" (xAI Grok API), or "local" (Local LLM)
@@ -28,16 +34,36 @@ MODEL_MODE = os.getenv("MODEL_MODE", "api")  # Default to API mode
 
 # API Configuration (for Cloud API mode)
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
-# API key is only required if using API mode
-if MODEL_MODE == "api" and not ANTHROPIC_API_KEY:
-    raise ValueError("ANTHROPIC_API_KEY required when MODEL_MODE='api'")
 
 # Grok API Configuration (for xAI Grok mode)
 # Support both XAI_API (Streamlit Cloud) and GROK_API_KEY (local) for compatibility
 GROK_API_KEY = os.getenv("XAI_API", "") or os.getenv("GROK_API_KEY", "")
-# API key is only required if using Grok mode
-if MODEL_MODE == "grok" and not GROK_API_KEY:
-    raise ValueError("XAI_API or GROK_API_KEY required when MODEL_MODE='grok'")
+
+
+def get_api_key(mode: Optional[str] = None) -> str:
+    """
+    API key for a model mode, checked when a client for that mode is created
+
+    Args:
+        mode: "api" or "grok" (default: MODEL_MODE)
+
+    Returns:
+        The configured API key
+
+    Raises:
+        ValueError: If the key for the mode is not configured
+    """
+    mode = mode or MODEL_MODE
+    if mode == "api":
+        if not ANTHROPIC_API_KEY:
+            raise ValueError("ANTHROPIC_API_KEY required when MODEL_MODE='api'")
+        return ANTHROPIC_API_KEY
+    if mode == "grok":
+        if not GROK_API_KEY:
+            raise ValueError("XAI_API or GROK_API_KEY required when MODEL_MODE='grok'")
+        return GROK_API_KEY
+    raise ValueError(f"No API key for model mode '{mode}'")
+
 
 # Tavily API Configuration (for Web Search)
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "")
@@ -55,7 +81,9 @@ CLAUDE_MAX_TOKENS = 4096
 CLAUDE_TEMPERATURE = 0.7
 CLAUDE_REQUEST_TIMEOUT = 120  # seconds
 CLAUDE_MAX_RETRIES = 3
-CLAUDE_RETRY_DELAY = 2  # seconds
+CLAUDE_RETRY_DELAY = 2  # seconds, base of the exponential retry backoff
+CLAUDE_RETRY_MAX_DELAY = 30  # seconds, cap on a single retry backoff
+CLAUDE_MAX_CONCURRENT_REQUESTS = 4  # in-flight calls when analyzing queries in parallel
 
 # Grok API Settings (for Grok mode)
 GROK_MODEL = os.getenv("GROK_MODEL", "grok-4-fast-reasoning")  # Grok 4 Fast with reasoning
@@ -69,6 +97,7 @@ GROK_RETRY_DELAY = 2  # seconds
 ENABLE_PROMPT_CACHING = os.getenv("ENABLE_PROMPT_CACHING", "true").lower() == "true"  # 60-70% cost savings
 ENABLE_BATCH_MODE = os.getenv("ENABLE_BATCH_MODE", "false").lower() == "true"  # 50% cost savings (24h delivery)
 BATCH_CHECK_INTERVAL = int(os.getenv("BATCH_CHECK_INTERVAL", "60"))  # seconds between batch status checks
+API_MAX_CONCURRENT_REQUESTS = int(os.getenv("API_MAX_CONCURRENT_REQUESTS", "8"))  # In-flight Claude/Grok calls per process
 
 # Local LLM Settings (for Local mode)
 LOCAL_MODEL_URL = os.getenv("LOCAL_MODEL_URL", "http://localhost:11434")  # Ollama default
@@ -77,18 +106,43 @@ LOCAL_MODEL_MAX_TOKENS = int(os.getenv("LOCAL_MODEL_MAX_TOKENS", "8000"))
 LOCAL_MODEL_TEMPERATURE = float(os.getenv("LOCAL_MODEL_TEMPERATURE", "0.7"))
 LOCAL_MODEL_TIMEOUT = int(os.getenv("LOCAL_MODEL_TIMEOUT", "900"))  # 15 minutes (increased from 5)
 LOCAL_VISION_CAPABLE = os.getenv("LOCAL_VISION_CAPABLE", "false").lower() == "true"
+LOCAL_MAX_CONCURRENT_REQUESTS = int(os.getenv("LOCAL_MAX_CONCURRENT_REQUESTS", "4"))  # Match OLLAMA_NUM_PARALLEL
 
 # RAG System Settings
 CHUNK_SIZE = 1000
 CHUNK_OVERLAP = 200
 EMBEDDING_MODEL = "sentence-transformers/all-mpnet-base-v2"
 EMBEDDING_CACHE_FOLDER = BASE_DIR / "data" / "embedding_cache"  # Cache for faster loading
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))  # Chunks per encoder forward pass
+ENABLE_EMBEDDING_CACHE = os.getenv("ENABLE_EMBEDDING_CACHE", "true").lower() == "true"  # Reuse chunk/query embeddings
+EMBEDDING_VECTOR_CACHE_PATH = EMBEDDING_CACHE_FOLDER / "chunk_embeddings.sqlite3"
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "4096"))
 TOP_K_RETRIEVAL = 5
+IVF_MIN_VECTORS = int(os.getenv("IVF_MIN_VECTORS", "10000"))  # Switch from exact flat index to IVF-PQ above this
+IVF_MAX_LISTS = 1024  # Upper bound on IVF inverted lists (nlist)
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", "16"))  # Lists scanned per query
+VECTOR_STORE_FP16 = os.getenv("VECTOR_STORE_FP16", "true").lower() == "true"  # Half-precision vectors below IVF_MIN_VECTORS
 SIMILARITY_THRESHOLD = 0.2  # Lowered from 0.7 - FAISS distance-based similarity works best with lower thresholds
 
 # Performance Settings
 ENABLE_TIMING_METRICS = os.getenv("ENABLE_TIMING_METRICS", "true").lower() == "true"  # Track performance
 SHOW_DETAILED_PROGRESS = os.getenv("SHOW_DETAILED_PROGRESS", "true").lower() == "true"  # Detailed UI progress
+ENABLE_SUMMARY_CACHE = os.getenv("ENABLE_SUMMARY_CACHE", "true").lower() == "true"  # Reuse summaries for identical PDF sets
+SUMMARY_CACHE_DIR = OUTPUT_DIR / ".summary_cache"
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "50"))  # Oldest entries culled beyond this
+# Near-duplicate reuse can serve a revised paper the summary of its earlier version; off unless enabled
+ENABLE_SUMMARY_SIMILARITY_CACHE = os.getenv("ENABLE_SUMMARY_SIMILARITY_CACHE", "false").lower() == "true"
+SUMMARY_CACHE_SIMILARITY_THRESHOLD = 0.97  # Per-document cosine similarity for near-identical document sets
+SUMMARY_CACHE_FINGERPRINT_CHARS = 1000  # First-page characters embedded per document for the similarity tier
+ENABLE_PDF_CACHE = os.getenv("ENABLE_PDF_CACHE", "true").lower() == "true"  # Reuse extraction for re-uploaded PDFs
+PDF_CACHE_DIR = OUTPUT_DIR / ".pdf_cache"
+PDF_CACHE_MAX_ENTRIES = int(os.getenv("PDF_CACHE_MAX_ENTRIES", "100"))
+ENABLE_RESPONSE_CACHE = os.getenv("ENABLE_RESPONSE_CACHE", "true").lower() == "true"  # Reuse Claude responses for identical prompts
+RESPONSE_CACHE_PATH = OUTPUT_DIR / ".response_cache.sqlite3"
+RESPONSE_CACHE_TTL_HOURS = int(os.getenv("RESPONSE_CACHE_TTL_HOURS", "168"))  # Cached responses expire after a week
+COST_LOG_PATH = OUTPUT_DIR / ".cost_log.jsonl"  # Append-only research cost log
+CHATBOT_SPECULATIVE_RETRIEVAL = os.getenv("CHATBOT_SPECULATIVE_RETRIEVAL", "false").lower() == "true"  # Overlap chatbot search stages (wasted when the summary suffices)
+CHATBOT_HISTORY_LIMIT = int(os.getenv("CHATBOT_HISTORY_LIMIT", "200"))  # In-memory chat turns; older ones spill to disk
 
 # Multi-Agent System Settings
 ENABLE_MULTI_AGENT = os.getenv("ENABLE_MULTI_AGENT", "true").lower() == "true"  # Use multi-agent architecture
@@ -216,3 +270,38 @@ Continue with additional comprehensive paragraphs that dive deeper into the tech
 
 Make this SO DETAILED and well-written that someone could understand the research deeply by reading your comprehensive notes.
 """
+
+
+def compile_prompt_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format prompt template once into a renderer
+
+    The template is split into (literal, field) pairs at import, so each call
+    only joins strings instead of re-parsing the multi-KB template.
+
+    Args:
+        template: Template using plain {field} placeholders
+
+    Returns:
+        Function taking the fields as keyword arguments and returning the prompt
+
+    Raises:
+        ValueError: If a placeholder uses a conversion or format spec
+    """
+    parts = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {{{field}}}")
+        parts.append((literal, field))
+
+    def render(**fields) -> str:
+        return "".join(
+            literal if field is None else literal + str(fields[field])
+            for literal, field in parts
+        )
+
+    return render
+
+
+render_analysis_prompt = compile_prompt_template(ANALYSIS_PROMPT_TEMPLATE)
+render_synthesis_prompt = compile_prompt_template(SYNTHESIS_PROMPT_TEMPLATE)
@@ -8,19 +8,84 @@ Usage:
     python examples/analytics_usage_example.py
 """
 
+import io
 import os
-from datetime import datetime, timedelta
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from src.social_media.models import DatabaseManager, User, Post, PostStatus, Platform, ContentType
-from src.social_media.analytics import AnalyticsCollector
+from src.social_media.analytics import AnalyticsCollector, _utcnow
 from src.social_media.twitter_handler import TwitterHandler
 
 
+EXAMPLE_DB_URL = "sqlite:///example_analytics.db"
+
+# Number formatters reused by the report printing loops
+format_count = "{:,}".format
+format_pct = "{:.2f}".format
+
+
+@lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    """Shared database manager for all examples (one engine and pool)"""
+    return DatabaseManager(EXAMPLE_DB_URL)
+
+
+class _SectionOutput(io.TextIOBase):
+    """stdout proxy that buffers output per thread while a section runs"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def capture(self, section):
+        """Run section and return (output, exception or None)"""
+        self._local.buffer = io.StringIO()
+        try:
+            section()
+            return self._local.buffer.getvalue(), None
+        except Exception as e:
+            return self._local.buffer.getvalue(), e
+        finally:
+            self._local.buffer = None
+
+
+def run_sections_concurrently(sections, max_workers=4):
+    """
+    Run independent example sections on a thread pool
+
+    Each section's output is buffered and printed in the original
+    order, so the result reads the same as a sequential run.
+    """
+    output = _SectionOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(output.capture, sections))
+    finally:
+        sys.stdout = output._stream
+
+    for text, error in results:
+        sys.stdout.write(text)
+        if error is not None:
+            raise error
+
+
 def example_basic_analytics():
     """Example: Basic analytics collection"""
     print("=== Basic Analytics Collection ===\n")
 
     # Initialize database and analytics collector
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     db_manager.create_tables()
 
     # Initialize with Twitter handler (requires credentials)
@@ -48,7 +113,7 @@ def example_post_metrics():
     """Example: Collect metrics for a specific post"""
     print("=== Post Metrics Collection ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
 
     # In production, initialize with real Twitter handler
     # twitter_handler = TwitterHandler(
@@ -82,7 +147,7 @@ def example_engagement_rate():
     """Example: Calculate engagement rate"""
     print("=== Engagement Rate Calculation ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     post_id = 123
@@ -96,13 +161,13 @@ def example_user_summary():
     """Example: Get user analytics summary"""
     print("=== User Analytics Summary ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     user_id = 1
 
     # Get summary for last 30 days
-    end_date = datetime.utcnow()
+    end_date = _utcnow()
     start_date = end_date - timedelta(days=30)
 
     summary = collector.get_user_analytics_summary(
@@ -125,10 +190,12 @@ def example_user_summary():
 
     if summary.get('engagement_by_type'):
         print("Performance by Content Type:")
+        lines = []
         for content_type, data in summary['engagement_by_type'].items():
-            print(f"  {content_type}:")
-            print(f"    Posts: {data['posts']}")
-            print(f"    Avg Engagement: {data.get('engagement_rate', 0):.2f}%")
+            lines.append(f"  {content_type}:")
+            lines.append(f"    Posts: {data['posts']}")
+            lines.append("    Avg Engagement: " + format_pct(data.get('engagement_rate', 0)) + "%")
+        print("\n".join(lines))
         print()
 
 
@@ -136,18 +203,21 @@ def example_best_posting_times():
     """Example: Identify optimal posting times"""
     print("=== Best Posting Times Analysis ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     user_id = 1
     best_times = collector.identify_best_posting_times(user_id)
 
     print(f"Top {min(5, len(best_times))} Posting Times for User {user_id}:")
+    lines = []
     for i, time_slot in enumerate(best_times[:5], 1):
-        print(f"\n{i}. {time_slot['day_name']} at {time_slot['hour']:02d}:00 UTC")
-        print(f"   Avg Engagement Rate: {time_slot['avg_engagement_rate']:.2f}%")
-        print(f"   Posts Analyzed: {time_slot['posts_count']}")
-        print(f"   Total Impressions: {time_slot['total_impressions']:,}")
+        lines.append(f"\n{i}. {time_slot['day_name']} at {time_slot['hour']:02d}:00 UTC")
+        lines.append("   Avg Engagement Rate: " + format_pct(time_slot['avg_engagement_rate']) + "%")
+        lines.append(f"   Posts Analyzed: {time_slot['posts_count']}")
+        lines.append("   Total Impressions: " + format_count(time_slot['total_impressions']))
+    if lines:
+        print("\n".join(lines))
     print()
 
 
@@ -155,7 +225,7 @@ def example_recruiter_tracking():
     """Example: Track recruiter engagement"""
     print("=== Recruiter Engagement Tracking ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     user_id = 1
@@ -178,7 +248,7 @@ def example_weekly_report():
     """Example: Generate comprehensive weekly report"""
     print("=== Weekly Performance Report ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     user_id = 1
@@ -197,11 +267,13 @@ def example_weekly_report():
     if report['top_posts']:
         print("TOP PERFORMING POSTS")
         print("=" * 50)
+        lines = []
         for i, post in enumerate(report['top_posts'][:3], 1):
-            print(f"\n{i}. {post['content'][:70]}...")
-            print(f"   Type: {post['content_type']}")
-            print(f"   Impressions: {post['impressions']:,}")
-            print(f"   Engagement Rate: {post['engagement_rate']:.2f}%")
+            lines.append(f"\n{i}. {post['content'][:70]}...")
+            lines.append(f"   Type: {post['content_type']}")
+            lines.append("   Impressions: " + format_count(post['impressions']))
+            lines.append("   Engagement Rate: " + format_pct(post['engagement_rate']) + "%")
+        print("\n".join(lines))
         print()
 
     # Trends
@@ -251,24 +323,31 @@ def example_scheduled_collection():
 
     from apscheduler.schedulers.background import BackgroundScheduler
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     def collect_recent_analytics():
         """Collect analytics for posts from last 24 hours"""
         session = db_manager.get_session()
 
-        recent_posts = session.query(Post).filter(
-            Post.status == PostStatus.PUBLISHED,
-            Post.published_time >= datetime.utcnow() - timedelta(days=1)
-        ).all()
+        now = _utcnow()
+        cutoff = now - timedelta(days=1)
+
+        # Only ids are needed; the bulk update loads the posts itself
+        recent_post_ids = [
+            post_id for (post_id,) in session.query(Post.id).filter(
+                Post.status == PostStatus.PUBLISHED,
+                Post.published_time >= cutoff
+            )
+        ]
 
-        print(f"[{datetime.now()}] Collecting analytics for {len(recent_posts)} posts")
+        print(f"[{now} UTC] Collecting analytics for {len(recent_post_ids)} posts")
 
-        for post in recent_posts:
-            result = collector.update_post_analytics(post.id)
-            if result:
-                print(f"  Updated analytics for post {post.id}")
+        updated = collector.update_post_analytics_bulk(recent_post_ids)
+        print(f"  Updated analytics for {updated} posts")
+
+        rollup_rows = collector.refresh_daily_rollup()
+        print(f"  Refreshed {rollup_rows} daily rollup rows")
 
         session.close()
 
@@ -305,7 +384,7 @@ def example_error_handling():
     """Example: Proper error handling"""
     print("=== Error Handling Examples ===\n")
 
-    db_manager = DatabaseManager("sqlite:///example_analytics.db")
+    db_manager = get_db_manager()
     collector = AnalyticsCollector(db_manager)
 
     # Example 1: Handle failed metrics collection
@@ -338,13 +417,20 @@ def main():
     print("=" * 60 + "\n")
 
     try:
+        # Creates the tables and sample user the other sections read
         example_basic_analytics()
-        example_post_metrics()
-        example_engagement_rate()
-        example_user_summary()
-        example_best_posting_times()
-        example_recruiter_tracking()
-        example_weekly_report()
+
+        # Read-only sections are independent of each other
+        run_sections_concurrently([
+            example_post_metrics,
+            example_engagement_rate,
+            example_user_summary,
+            example_best_posting_times,
+            example_recruiter_tracking,
+            example_weekly_report,
+        ])
+
+        # APScheduler manages its own threads; keep it on the main thread
         example_scheduled_collection()
         example_error_handling()
 
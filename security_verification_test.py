@@ -3,9 +3,15 @@ Comprehensive Security Verification Test
 Tests all security fixes and checks for additional vulnerabilities
 """
 
+import ast
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Repository root; source paths below are relative to it, not to the cwd
+ROOT = Path(__file__).resolve().parent
+
 # Test results storage
 test_results = {
     "passed": 0,
@@ -14,8 +20,18 @@ test_results = {
     "tests": []
 }
 
+# Output prefix per status
+STATUS_PREFIXES = {
+    "PASS": "✅ PASS:",
+    "FAIL": "❌ FAIL:",
+    "WARN": "⚠️  WARN:",
+}
+
+# Formatted result lines waiting to be written by flush_log()
+_pending_lines = []
+
 def log_test(test_name, status, message=""):
-    """Log test result"""
+    """Log test result (output is buffered until flush_log)"""
     test_results["tests"].append({
         "name": test_name,
         "status": status,
@@ -23,15 +39,93 @@ def log_test(test_name, status, message=""):
     })
     if status == "PASS":
         test_results["passed"] += 1
-        print(f"✅ PASS: {test_name}")
-    elif status == "FAIL":
-        test_results["failed"] += 1
-        print(f"❌ FAIL: {test_name} - {message}")
-    elif status == "WARN":
-        test_results["warnings"] += 1
-        print(f"⚠️  WARN: {test_name} - {message}")
+        _pending_lines.append(f"{STATUS_PREFIXES[status]} {test_name}")
+    elif status in STATUS_PREFIXES:
+        test_results["failed" if status == "FAIL" else "warnings"] += 1
+        _pending_lines.append(f"{STATUS_PREFIXES[status]} {test_name} - {message}")
     if message:
-        print(f"   → {message}")
+        _pending_lines.append(f"   → {message}")
+
+def flush_log():
+    """Write buffered test result lines in a single write"""
+    if _pending_lines:
+        sys.stdout.write("\n".join(_pending_lines) + "\n")
+        sys.stdout.flush()
+        _pending_lines.clear()
+
+# =============================================================================
+# SOURCE INSPECTION HELPERS
+# =============================================================================
+@lru_cache(maxsize=None)
+def read_source(path):
+    """Read a source file (relative to the repository root) once and cache its text"""
+    return (ROOT / path).read_text(encoding="utf-8")
+
+@lru_cache(maxsize=None)
+def module_tree(path):
+    """Parse a source file once and cache its AST"""
+    return ast.parse(read_source(path), filename=str(path))
+
+@lru_cache(maxsize=None)
+def find_method(path, class_name, method_name):
+    """Return the FunctionDef for class_name.method_name in path, or None"""
+    for node in module_tree(path).body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == method_name:
+                    return item
+    return None
+
+def _walk(node):
+    return ast.walk(node) if node is not None else ()
+
+def _dotted_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted_name(node.value)
+        return f"{base}.{node.attr}" if base else node.attr
+    return None
+
+def has_call(node, *names):
+    """True if node calls any of names (matched on the dotted name's suffix)"""
+    for child in _walk(node):
+        if isinstance(child, ast.Call):
+            called = _dotted_name(child.func) or ""
+            if any(called == name or called.endswith("." + name) for name in names):
+                return True
+    return False
+
+def has_compare(node, left_fn, op, const):
+    """True if node contains `left_fn(...) <op> const`"""
+    for child in _walk(node):
+        if (isinstance(child, ast.Compare)
+                and isinstance(child.left, ast.Call)
+                and _dotted_name(child.left.func) == left_fn
+                and isinstance(child.ops[0], op)
+                and isinstance(child.comparators[0], ast.Constant)
+                and child.comparators[0].value == const):
+            return True
+    return False
+
+def has_string(node, needle):
+    """True if node contains a string literal including needle (case-insensitive)"""
+    needle = needle.lower()
+    return any(
+        isinstance(child, ast.Constant) and isinstance(child.value, str)
+        and needle in child.value.lower()
+        for child in _walk(node)
+    )
+
+def has_identifier(node, fragment):
+    """True if node references a name or attribute containing fragment"""
+    fragment = fragment.lower()
+    for child in _walk(node):
+        if isinstance(child, ast.Name) and fragment in child.id.lower():
+            return True
+        if isinstance(child, ast.Attribute) and fragment in child.attr.lower():
+            return True
+    return False
 
 print("=" * 80)
 print("COMPREHENSIVE SECURITY VERIFICATION TEST")
@@ -84,6 +178,7 @@ try:
 except Exception as e:
     log_test("1.x - Path Traversal Tests", "FAIL", f"Import or execution error: {str(e)}")
 
+flush_log()
 print()
 
 # =============================================================================
@@ -93,37 +188,34 @@ print("💬 TEST CATEGORY 2: Prompt Injection Protection")
 print("-" * 80)
 
 try:
-    from src.chatbot import DocumentChatbot
+    validate_question = find_method("src/chatbot.py", "DocumentChatbot", "_validate_question")
 
     # Test 2.1: Validation method exists
-    if hasattr(DocumentChatbot, '_validate_question'):
+    if validate_question is not None:
         log_test("2.1 - Validation method exists", "PASS")
     else:
         log_test("2.1 - Validation method exists", "FAIL", "Method not found")
 
     # Test 2.2: Length validation (simulated)
     # Cannot test without full initialization, check code structure
-    import inspect
-    source = inspect.getsource(DocumentChatbot._validate_question)
-
-    if "len(question) > 2000" in source:
+    if has_compare(validate_question, "len", ast.Gt, 2000):
         log_test("2.2 - Max length check present", "PASS")
     else:
         log_test("2.2 - Max length check present", "FAIL")
 
-    if "len(question.strip()) < 3" in source:
+    if has_compare(validate_question, "len", ast.Lt, 3):
         log_test("2.3 - Min length check present", "PASS")
     else:
         log_test("2.3 - Min length check present", "FAIL")
 
     # Test 2.4: Suspicious pattern detection
-    if "suspicious_patterns" in source:
+    if has_identifier(validate_question, "suspicious"):
         log_test("2.4 - Suspicious pattern detection", "PASS")
     else:
         log_test("2.4 - Suspicious pattern detection", "FAIL")
 
     # Test 2.5: Whitespace trimming
-    if "strip()" in source:
+    if has_call(validate_question, "strip"):
         log_test("2.5 - Whitespace trimming", "PASS")
     else:
         log_test("2.5 - Whitespace trimming", "FAIL")
@@ -131,6 +223,7 @@ try:
 except Exception as e:
     log_test("2.x - Prompt Injection Tests", "FAIL", f"Import or execution error: {str(e)}")
 
+flush_log()
 print()
 
 # =============================================================================
@@ -140,31 +233,31 @@ print("🔒 TEST CATEGORY 3: Safe Deserialization (JSON vs Pickle)")
 print("-" * 80)
 
 try:
-    from src.rag_system import RAGSystem
-    import inspect
+    save_vector_store = find_method("src/rag_system.py", "RAGSystem", "save_vector_store")
+    load_vector_store = find_method("src/rag_system.py", "RAGSystem", "load_vector_store")
 
     # Test 3.1: Save uses JSON
-    save_source = inspect.getsource(RAGSystem.save_vector_store)
-    if "chunks_metadata.json" in save_source and "json.dump" in save_source:
+    if (has_string(save_vector_store, "chunks_metadata.json")
+            and has_call(save_vector_store, "json.dump", "json.dumps", "_dump_json")):
         log_test("3.1 - Save uses JSON format", "PASS")
     else:
         log_test("3.1 - Save uses JSON format", "FAIL", "Still using pickle for save")
 
     # Test 3.2: Load tries JSON first
-    load_source = inspect.getsource(RAGSystem.load_vector_store)
-    if "chunks_metadata.json" in load_source and "json.load" in load_source:
+    if (has_string(load_vector_store, "chunks_metadata.json")
+            and has_call(load_vector_store, "json.load", "json.loads", "_load_json")):
         log_test("3.2 - Load tries JSON first", "PASS")
     else:
         log_test("3.2 - Load tries JSON first", "FAIL")
 
     # Test 3.3: Backward compatibility for pickle
-    if "chunks_metadata.pkl" in load_source and "pickle.load" in load_source:
+    if has_string(load_vector_store, "chunks_metadata.pkl") and has_call(load_vector_store, "pickle.load"):
         log_test("3.3 - Backward compatibility present", "PASS")
     else:
         log_test("3.3 - Backward compatibility present", "WARN", "Old sessions may not load")
 
     # Test 3.4: Warning for legacy format
-    if "logger.warning" in load_source and "legacy pickle" in load_source.lower():
+    if has_call(load_vector_store, "logger.warning") and has_string(load_vector_store, "legacy pickle"):
         log_test("3.4 - Legacy format warning", "PASS")
     else:
         log_test("3.4 - Legacy format warning", "WARN", "No warning for pickle loading")
@@ -172,6 +265,7 @@ try:
 except Exception as e:
     log_test("3.x - Deserialization Tests", "FAIL", f"Import or execution error: {str(e)}")
 
+flush_log()
 print()
 
 # =============================================================================
@@ -197,25 +291,21 @@ except Exception as e:
 
 # Test 4.2: Environment variable usage
 try:
-    config_file = Path("config/settings.py")
+    config_file = ROOT / "config" / "settings.py"
     if config_file.exists():
-        with open(config_file, 'r') as f:
-            content = f.read()
-            if "os.getenv" in content or "os.environ" in content:
-                log_test("4.2 - Uses environment variables", "PASS")
-            else:
-                log_test("4.2 - Uses environment variables", "WARN", "Consider using env vars")
+        content = read_source("config/settings.py")
+        if "os.getenv" in content or "os.environ" in content:
+            log_test("4.2 - Uses environment variables", "PASS")
+        else:
+            log_test("4.2 - Uses environment variables", "WARN", "Consider using env vars")
 except Exception as e:
     log_test("4.2 - Environment variable check", "WARN", str(e))
 
 # Test 4.3: PDF file validation
 try:
-    from src.pdf_processor import PDFProcessor
-    import inspect
-
     # Check if there's file extension validation
-    init_source = inspect.getsource(PDFProcessor.__init__)
-    if ".pdf" in init_source.lower():
+    pdf_init = find_method("src/pdf_processor.py", "PDFProcessor", "__init__")
+    if has_string(pdf_init, ".pdf"):
         log_test("4.3 - PDF extension validation", "PASS")
     else:
         log_test("4.3 - PDF extension validation", "WARN", "No explicit PDF validation found")
@@ -238,7 +328,7 @@ except ImportError:
 
 # Test 4.6: File permissions
 try:
-    data_dir = Path("data")
+    data_dir = ROOT / "data"
     if data_dir.exists():
         import stat
         mode = data_dir.stat().st_mode
@@ -252,44 +342,47 @@ try:
 except Exception as e:
     log_test("4.6 - File permissions check", "WARN", str(e))
 
-# Test 4.7: SQL Injection (if any DB queries)
+# Tests 4.7 / 4.8: single pass over src/ for SQL injection and hardcoded secrets
+SQLI_RE = re.compile(rb"""execute\(\s*(?:f["']|["'][^"']*["']\s*%|[^)]*\.format\()""")
+SECRET_RE = re.compile(rb"""(?:password|api_key|secret|token)\s*=\s*["'][^"']""", re.IGNORECASE)
+
+def scan_src():
+    """Read each src/*.py file once; return (sql_hits, secret_hits)"""
+    sql_hits = []
+    secret_hits = []
+    for file in sorted((ROOT / "src").glob("*.py")):
+        content = file.read_bytes()
+        name = file.relative_to(ROOT)
+        if SQLI_RE.search(content):
+            sql_hits.append(str(name))
+        match = SECRET_RE.search(content)
+        if match:
+            secret_hits.append(f"{name}: {match.group().decode(errors='replace')}")
+    return sql_hits, secret_hits
+
 try:
-    # Check for raw SQL queries in codebase
-    code_files = list(Path("src").glob("*.py"))
-    sql_vulnerable = False
-    for file in code_files:
-        with open(file, 'r') as f:
-            content = f.read()
-            if "execute(" in content and ("%" % "f\"" in content or ".format(" in content):
-                sql_vulnerable = True
-                break
-
-    if sql_vulnerable:
-        log_test("4.7 - SQL injection check", "WARN", "Potential SQL injection found")
-    else:
-        log_test("4.7 - SQL injection check", "PASS", "No SQL vulnerabilities detected")
+    sql_hits, secret_hits = scan_src()
+    scan_error = None
 except Exception as e:
-    log_test("4.7 - SQL injection check", "WARN", str(e))
+    scan_error = e
+
+# Test 4.7: SQL Injection (if any DB queries)
+if scan_error:
+    log_test("4.7 - SQL injection check", "WARN", str(scan_error))
+elif sql_hits:
+    log_test("4.7 - SQL injection check", "WARN", f"Potential SQL injection found: {', '.join(sql_hits)}")
+else:
+    log_test("4.7 - SQL injection check", "PASS", "No SQL vulnerabilities detected")
 
 # Test 4.8: Secrets in code
-try:
-    sensitive_patterns = ["password =", "api_key =", "secret =", "token ="]
-    found_secrets = []
-
-    for file in Path("src").glob("*.py"):
-        with open(file, 'r') as f:
-            content = f.read().lower()
-            for pattern in sensitive_patterns:
-                if pattern in content and "getenv" not in content:
-                    found_secrets.append(f"{file}: {pattern}")
-
-    if found_secrets:
-        log_test("4.8 - Hardcoded secrets check", "WARN", f"Found: {', '.join(found_secrets)}")
-    else:
-        log_test("4.8 - Hardcoded secrets check", "PASS")
-except Exception as e:
-    log_test("4.8 - Hardcoded secrets check", "WARN", str(e))
+if scan_error:
+    log_test("4.8 - Hardcoded secrets check", "WARN", str(scan_error))
+elif secret_hits:
+    log_test("4.8 - Hardcoded secrets check", "WARN", f"Found: {', '.join(secret_hits)}")
+else:
+    log_test("4.8 - Hardcoded secrets check", "PASS")
 
+flush_log()
 print()
 
 # =============================================================================
@@ -300,11 +393,9 @@ print("-" * 80)
 
 # Test 5.1: Type hints usage
 try:
-    from src.chatbot import DocumentChatbot
-    import inspect
+    ask_question = find_method("src/chatbot.py", "DocumentChatbot", "ask_question")
 
-    sig = inspect.signature(DocumentChatbot.ask_question)
-    if any(param.annotation != inspect.Parameter.empty for param in sig.parameters.values()):
+    if any(arg.annotation is not None for arg in ask_question.args.args):
         log_test("5.1 - Type hints present", "PASS")
     else:
         log_test("5.1 - Type hints present", "WARN", "Consider adding type hints")
@@ -313,8 +404,8 @@ except Exception as e:
 
 # Test 5.2: Docstrings
 try:
-    from src.chatbot import DocumentChatbot
-    if DocumentChatbot.ask_question.__doc__:
+    ask_question = find_method("src/chatbot.py", "DocumentChatbot", "ask_question")
+    if ast.get_docstring(ask_question):
         log_test("5.2 - Docstrings present", "PASS")
     else:
         log_test("5.2 - Docstrings present", "WARN")
@@ -323,8 +414,8 @@ except Exception as e:
 
 # Test 5.3: Context managers for file operations
 try:
-    from src.pdf_processor import PDFProcessor
-    if hasattr(PDFProcessor, '__enter__') and hasattr(PDFProcessor, '__exit__'):
+    if (find_method("src/pdf_processor.py", "PDFProcessor", "__enter__")
+            and find_method("src/pdf_processor.py", "PDFProcessor", "__exit__")):
         log_test("5.3 - PDF context manager", "PASS")
     else:
         log_test("5.3 - PDF context manager", "WARN", "Consider adding context manager")
@@ -339,6 +430,7 @@ try:
 except Exception as e:
     log_test("5.4 - Safe error messages", "WARN", str(e))
 
+flush_log()
 print()
 
 # =============================================================================
@@ -0,0 +1,35 @@
+"""
+Shared API Clients
+Process-wide Anthropic clients so analyzers, chatbots and batch jobs reuse
+one HTTP connection pool instead of opening their own
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import anthropic
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: str, timeout: Optional[float] = None) -> anthropic.Anthropic:
+    """
+    Get the shared Anthropic client for an API key and timeout
+
+    Clients are thread-safe, so one instance (and its keep-alive connection
+    pool) serves every caller with the same settings.
+
+    Args:
+        api_key: Anthropic API key
+        timeout: Request timeout in seconds (None for the SDK default)
+
+    Returns:
+        Shared anthropic.Anthropic client
+    """
+    logger.info("Creating shared Anthropic client")
+    if timeout is None:
+        return anthropic.Anthropic(api_key=api_key)
+    return anthropic.Anthropic(api_key=api_key, timeout=timeout)
@@ -3,14 +3,20 @@ Batch API Processor
 Handles asynchronous batch processing with Claude API for 50% cost savings
 """
 
+import hashlib
+import random
+import tempfile
 import time
-import json
-from typing import List, Dict, Optional
+import warnings
+from contextlib import ExitStack
+from typing import Iterable, Iterator, List, Dict, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import anthropic
+import orjson
 
-from config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL, DATA_DIR
+from config.settings import CLAUDE_MODEL, DATA_DIR, get_api_key
+from src.api_clients import get_anthropic_client
 from utils.logger import get_logger
 from utils.exceptions import ClaudeAPIError
 
@@ -36,20 +42,23 @@ class BatchProcessor:
 
     def __init__(self):
         """Initialize batch processor"""
-        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_anthropic_client(get_api_key("api"))
         self.model = CLAUDE_MODEL
+        # Final statuses of ended batches; these never change, so no re-fetch
+        self._ended_status_cache: Dict[str, Dict] = {}
+        self.status_cache_stats = {"hits": 0, "misses": 0}
         logger.info("Batch processor initialized")
 
     def create_batch(
         self,
-        requests: List[Dict],
+        requests: Iterable[Dict],
         batch_description: str = "Batch processing job"
     ) -> str:
         """
         Create a batch job with multiple requests
 
         Args:
-            requests: List of request dictionaries with format:
+            requests: Iterable (list or generator) of request dictionaries with format:
                 {
                     "custom_id": "unique_id",
                     "params": {
@@ -77,39 +86,60 @@ class BatchProcessor:
             batch_id = processor.create_batch(requests, "PDF batch summary")
         """
         try:
-            logger.info(f"Creating batch job with {len(requests)} requests: {batch_description}")
-
-            # Save requests to JSONL file (required format for batch API)
-            batch_file_path = BATCH_DIR / f"batch_requests_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
-
-            with open(batch_file_path, 'w') as f:
-                for request in requests:
-                    f.write(json.dumps(request) + '\n')
-
-            logger.info(f"Saved batch requests to {batch_file_path}")
+            logger.info(f"Creating batch job: {batch_description}")
+
+            # Save requests to JSONL file (required format for batch API),
+            # consuming the iterable once; the SDK call needs a list. Files
+            # are named by content hash so resubmitting identical requests
+            # reuses the existing file.
+            api_requests = []
+            content_hash = hashlib.blake2b(digest_size=16)
+            with tempfile.NamedTemporaryFile(dir=BATCH_DIR, suffix=".jsonl.tmp", delete=False) as f:
+                tmp_path = Path(f.name)
+                try:
+                    for request in requests:
+                        line = orjson.dumps(request, option=orjson.OPT_APPEND_NEWLINE)
+                        f.write(line)
+                        content_hash.update(line)
+                        api_requests.append(request)
+                except BaseException:
+                    # Don't leave a partial request file behind
+                    f.close()
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+            content_hash = content_hash.hexdigest()
+            batch_file_path = BATCH_DIR / f"batch_requests_{content_hash}.jsonl"
+            if batch_file_path.exists():
+                tmp_path.unlink()
+                logger.info(f"Reusing saved batch requests {batch_file_path}")
+            else:
+                tmp_path.replace(batch_file_path)
+                logger.info(f"Saved {len(api_requests)} batch requests to {batch_file_path}")
 
             # Create the batch job via API
             batch = self.client.messages.batches.create(
-                requests=requests
+                requests=api_requests
             )
 
             batch_id = batch.id
             logger.info(f"✅ Batch job created: {batch_id}")
-            logger.info(f"💰 Expected savings: 50% on {len(requests)} requests")
+            logger.info(f"💰 Expected savings: 50% on {len(api_requests)} requests")
 
             # Save batch metadata
             metadata = {
                 "batch_id": batch_id,
                 "description": batch_description,
-                "num_requests": len(requests),
+                "num_requests": len(api_requests),
                 "created_at": datetime.now().isoformat(),
                 "status": "in_progress",
-                "requests_file": str(batch_file_path)
+                "requests_file": str(batch_file_path),
+                "content_hash": content_hash
             }
 
             metadata_path = BATCH_DIR / f"batch_metadata_{batch_id}.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            with open(metadata_path, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
             return batch_id
 
@@ -140,7 +170,13 @@ class BatchProcessor:
                 "ended_at": "timestamp" (if complete)
             }
         """
+        cached = self._ended_status_cache.get(batch_id)
+        if cached is not None:
+            self.status_cache_stats["hits"] += 1
+            return {**cached, "request_counts": dict(cached["request_counts"])}
+
         try:
+            self.status_cache_stats["misses"] += 1
             batch = self.client.messages.batches.retrieve(batch_id)
 
             status = {
@@ -161,22 +197,40 @@ class BatchProcessor:
                        f"Processing: {status['request_counts']['processing']}, "
                        f"Errored: {status['request_counts']['errored']}")
 
+            if status["status"] == "ended":
+                self._ended_status_cache[batch_id] = {
+                    **status, "request_counts": dict(status["request_counts"])
+                }
+                logger.info(f"Batch status cache: {self.status_cache_stats['hits']} hits, "
+                            f"{self.status_cache_stats['misses']} API calls")
+
             return status
 
         except Exception as e:
             logger.error(f"Failed to get batch status: {str(e)}")
             raise ClaudeAPIError(f"Status check failed: {str(e)}")
 
-    def get_batch_results(self, batch_id: str, save_to_file: bool = True) -> List[Dict]:
+    def get_batch_results(
+        self,
+        batch_id: str,
+        save_to_file: bool = True,
+        stream: bool = False,
+        skip_status_check: bool = False
+    ) -> Union[List[Dict], Iterator[Dict]]:
         """
         Get results from a completed batch job
 
         Args:
             batch_id: Batch ID from create_batch
-            save_to_file: Whether to save results to a JSON file (default: True)
+            save_to_file: Whether to save results to a JSONL file (default: True)
+            stream: Return a generator that yields results as they are read
+                instead of a list (default: False)
+            skip_status_check: Fetch results without checking the status first,
+                e.g. right after wait_for_completion; a batch that has not ended
+                yields no results (default: False)
 
         Returns:
-            List of result dictionaries:
+            List (or iterator, if stream=True) of result dictionaries:
             [{
                 "custom_id": "unique_id",
                 "result": {
@@ -190,32 +244,65 @@ class BatchProcessor:
             logger.info(f"Fetching results for batch {batch_id}...")
 
             # Check if batch is complete
-            status = self.get_batch_status(batch_id)
+            if not skip_status_check:
+                status = self.get_batch_status(batch_id)
+
+                if status["status"] != "ended":
+                    logger.warning(f"Batch {batch_id} not yet complete (status: {status['status']})")
+                    return iter(()) if stream else []
+
+            results = self._iter_batch_results(batch_id, save_to_file)
+            if stream:
+                return results
+
+            return list(results)
 
-            if status["status"] != "ended":
-                logger.warning(f"Batch {batch_id} not yet complete (status: {status['status']})")
-                return []
+        except Exception as e:
+            logger.error(f"Failed to get batch results: {str(e)}")
+            raise ClaudeAPIError(f"Results retrieval failed: {str(e)}")
 
-            # Get results
-            results = []
-            for result in self.client.messages.batches.results(batch_id):
-                results.append(result.model_dump())
+    def _iter_batch_results(self, batch_id: str, save_to_file: bool) -> Iterator[Dict]:
+        """
+        Yield batch results one at a time, appending each to the results file
 
-            logger.info(f"Retrieved {len(results)} results from batch {batch_id}")
+        Args:
+            batch_id: Batch ID of an ended batch
+            save_to_file: Whether to write results to batch_results_<id>.jsonl
 
-            # Save to file if requested
-            if save_to_file:
-                results_file = BATCH_DIR / f"batch_results_{batch_id}.json"
-                with open(results_file, 'w') as f:
-                    json.dump(results, f, indent=2)
-                logger.info(f"Saved results to {results_file}")
+        Yields:
+            Result dictionaries
+        """
+        results_file = BATCH_DIR / f"batch_results_{batch_id}.jsonl"
+        count = 0
 
-            return results
+        try:
+            try:
+                batch_results = self.client.messages.batches.results(batch_id)
+            except anthropic.AnthropicError as e:
+                # The SDK raises this when the batch has no results URL yet
+                if "results_url" not in str(e):
+                    raise
+                logger.warning(f"Batch {batch_id} not yet complete: {str(e)}")
+                return
+
+            with ExitStack() as stack:
+                f = stack.enter_context(open(results_file, 'wb')) if save_to_file else None
+
+                for result in batch_results:
+                    result = result.model_dump()
+                    if f is not None:
+                        f.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+                    count += 1
+                    yield result
 
         except Exception as e:
             logger.error(f"Failed to get batch results: {str(e)}")
             raise ClaudeAPIError(f"Results retrieval failed: {str(e)}")
 
+        logger.info(f"Retrieved {count} results from batch {batch_id}")
+        if save_to_file:
+            logger.info(f"Saved results to {results_file}")
+
     def cancel_batch(self, batch_id: str) -> bool:
         """
         Cancel a batch job
@@ -236,19 +323,52 @@ class BatchProcessor:
             logger.error(f"Failed to cancel batch: {str(e)}")
             return False
 
+    def _load_num_requests(self, batch_id: str) -> Optional[int]:
+        """
+        Read the request count saved by create_batch
+
+        Args:
+            batch_id: Batch ID from create_batch
+
+        Returns:
+            Number of requests in the batch, or None if no metadata is saved
+        """
+        metadata_path = BATCH_DIR / f"batch_metadata_{batch_id}.json"
+        try:
+            with open(metadata_path, 'rb') as f:
+                return orjson.loads(f.read()).get("num_requests")
+        except (OSError, ValueError):
+            return None
+
     def wait_for_completion(
         self,
         batch_id: str,
-        check_interval: int = 60,
-        max_wait_hours: int = 24
+        check_interval: Optional[float] = None,
+        max_wait_hours: int = 24,
+        min_interval: float = 5,
+        max_interval: float = 300,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.2
     ) -> Dict:
         """
-        Wait for batch to complete (polling)
+        Wait for batch to complete (polling with adaptive backoff)
+
+        Polls quickly at first, backs off while no requests finish and
+        drops back to min_interval as soon as the finished count advances.
+        Once the request counts show nothing left processing, it keeps
+        polling at min_interval until processing_status switches to "ended",
+        since results can only be fetched after that.
 
         Args:
             batch_id: Batch ID to wait for
-            check_interval: Seconds between status checks (default: 60)
+            check_interval: Deprecated alias for min_interval, kept for
+                existing callers
             max_wait_hours: Maximum hours to wait (default: 24)
+            min_interval: Shortest delay between status checks in seconds (default: 5)
+            max_interval: Longest delay between status checks in seconds (default: 300)
+            backoff_factor: Delay multiplier while nothing finishes (default: 2.0)
+            jitter: Random +/- fraction applied to each delay so concurrent
+                pollers spread out (default: 0.2)
 
         Returns:
             Final status dictionary
@@ -256,21 +376,53 @@ class BatchProcessor:
         Note: This is a blocking operation. For production, consider using
         webhooks or checking status asynchronously.
         """
-        max_checks = (max_wait_hours * 3600) // check_interval
+        if check_interval is not None:
+            warnings.warn(
+                "check_interval is deprecated; use min_interval",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            min_interval = check_interval
+            max_interval = max(max_interval, min_interval)
+
+        deadline = time.monotonic() + max_wait_hours * 3600
+        interval = min_interval
+        finished = None
         checks = 0
+        num_requests = self._load_num_requests(batch_id)
 
-        logger.info(f"Waiting for batch {batch_id} to complete (checking every {check_interval}s)...")
+        logger.info(f"Waiting for batch {batch_id} to complete (polling every {min_interval}-{max_interval}s)...")
 
-        while checks < max_checks:
+        while time.monotonic() < deadline:
             status = self.get_batch_status(batch_id)
 
             if status["status"] == "ended":
+                if status.get("request_counts", {}).get("succeeded", 0) == 0:
+                    logger.warning(f"Batch {batch_id} finished without any successful requests")
                 logger.info(f"✅ Batch {batch_id} completed!")
                 return status
 
+            counts = status.get("request_counts", {})
+            processing = counts.get("processing", 0)
+            done = sum(counts.values()) - processing
+            all_done = (num_requests and done >= num_requests) or (processing == 0 and done > 0)
+
+            current = counts.get("succeeded", 0) + counts.get("errored", 0)
+            if all_done:
+                # processing_status lags the counts; "ended" should follow shortly
+                interval = min_interval
+            elif finished is not None and current > finished:
+                interval = min_interval
+            elif finished is not None:
+                interval = min(interval * backoff_factor, max_interval)
+            finished = current
+
             checks += 1
-            logger.info(f"Batch still processing... (check {checks}/{max_checks})")
-            time.sleep(check_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            logger.info(f"Batch still processing... (check {checks}, next in {interval:.0f}s)")
+            time.sleep(min(interval * random.uniform(1 - jitter, 1 + jitter), remaining))
 
         logger.warning(f"Batch {batch_id} did not complete within {max_wait_hours} hours")
         return self.get_batch_status(batch_id)
@@ -3,18 +3,71 @@ Interactive Chatbot for Document Q&A
 Answers questions using RAG system across summary and source PDFs
 """
 
-from typing import List, Dict, Optional, Tuple
+import math
+import re
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, List, Dict, Optional, Tuple, Iterator
 from pathlib import Path
 
+import orjson
+
 from src.document_session import DocumentSession
 from src.rag_system import RAGSystem
 from src.comprehensive_analyzer import ComprehensiveAnalyzer
-from config.settings import EXPERT_SYSTEM_PROMPT
+from src.llm_queue import PRIORITY_INTERACTIVE
+from config.settings import (
+    EXPERT_SYSTEM_PROMPT, CHATBOT_SPECULATIVE_RETRIEVAL, CHATBOT_HISTORY_LIMIT, ENABLE_TIMING_METRICS
+)
 from utils.logger import get_logger
 from utils.exceptions import ClaudeAPIError
 
 logger = get_logger(__name__)
 
+# Strict document-grounding instructions, identical on every chat turn
+CHATBOT_SYSTEM_PROMPT = """You are an expert research assistant helping users understand academic papers.
+
+CRITICAL INSTRUCTIONS:
+- Answer ONLY using the provided context from research documents
+- DO NOT use your general knowledge or training data
+- If the context doesn't contain the answer, explicitly say "The provided documents do not contain information about this"
+- Never make assumptions or inferences beyond what's explicitly stated in the context
+- Every claim must be supported by the provided context
+
+Guidelines:
+- Provide clear, detailed answers in 2-3 paragraphs
+- Reference specific sources with page numbers
+- Use natural, flowing language (not bullet points)
+- Include relevant details, data, and findings from the context
+- Be precise and accurate
+"""
+
+# Per-question user prompt; filled with str.format(question=..., context=...)
+CHATBOT_USER_PROMPT_TEMPLATE = """Based on the following excerpts from research documents, please answer this question:
+
+**Question**: {question}
+
+**Context from Documents**:
+{context}
+
+**STRICT INSTRUCTIONS**:
+- Answer ONLY using the provided context above
+- DO NOT use any external knowledge or general AI knowledge
+- If the context doesn't contain enough information, clearly state: "The provided documents do not contain sufficient information about [specific aspect]"
+- Reference specific documents and page numbers when making claims
+- Write in clear, professional paragraphs (not bullet points)
+"""
+
+# Prompt-injection phrases that are logged (not blocked) for monitoring
+SUSPICIOUS_PATTERNS = (
+    "ignore previous", "ignore all previous", "ignore instructions",
+    "disregard", "bypass", "override system", "act as", "pretend to be",
+    "forget everything", "new instructions"
+)
+# One alternation scans a question once instead of once per pattern
+_SUSPICIOUS_RE = re.compile("|".join(map(re.escape, SUSPICIOUS_PATTERNS)), re.IGNORECASE)
+
 
 class DocumentChatbot:
     """Interactive chatbot for document Q&A"""
@@ -23,7 +76,9 @@ class DocumentChatbot:
         self,
         session: DocumentSession,
         model_mode: str = "api",
-        local_model_name: Optional[str] = None
+        local_model_name: Optional[str] = None,
+        embeddings=None,
+        history_limit: int = CHATBOT_HISTORY_LIMIT
     ):
         """
         Initialize chatbot
@@ -32,18 +87,22 @@ class DocumentChatbot:
             session: DocumentSession to chat about
             model_mode: "api" or "local"
             local_model_name: Local model name if using local mode
+            embeddings: Optional shared embeddings for the RAG system
+            history_limit: Chat turns kept in memory; older turns are
+                appended to the session's chat_history.jsonl
         """
         self.session = session
         self.model_mode = model_mode
         self.local_model_name = local_model_name
 
         # Initialize RAG system
-        self.rag_system = RAGSystem()
+        self.rag_system = RAGSystem(embeddings=embeddings)
 
         # Load session's RAG store
         try:
-            self.session.load_rag_system(self.rag_system)
+            self.session.load_rag_system(self.rag_system, mmap=True)
             logger.info(f"Loaded RAG store for session: {session.session_id}")
+            self.reload_session_metadata()
 
             # Log session details for debugging
             logger.info(f"Session metadata: source_pdf_count={session.metadata.get('source_pdf_count')}, has_summary={session.metadata.get('has_summary')}")
@@ -56,13 +115,25 @@ class DocumentChatbot:
             raise ClaudeAPIError(f"Failed to load session data: {str(e)}")
 
         # Initialize analyzer for API calls
+        # Chat answers are queued ahead of report generation on a shared backend
         self.analyzer = ComprehensiveAnalyzer(
             model_mode=model_mode,
-            local_model_name=local_model_name
+            local_model_name=local_model_name,
+            request_priority=PRIORITY_INTERACTIVE
         )
 
-        # Chat history
-        self.chat_history: List[Dict] = []
+        # Chat history (most recent turns only)
+        self.chat_history: Deque[Dict] = deque(maxlen=history_limit)
+
+        # Result of the most recent ask_question_stream call
+        self._last_result: Optional[Dict] = None
+
+        # Runs the all-documents search (stage 2) alongside the summary search (stage 1)
+        # when speculation is enabled; created on first use
+        self._retrieval_executor: Optional[ThreadPoolExecutor] = None
+        self._stage2_future: Optional[Future] = None
+        # Stage that answered the previous question; summary answers tend to repeat
+        self._last_search_stage: Optional[str] = None
 
     def ask_question(self, question: str, max_context_chunks: int = 5) -> Dict:
         """
@@ -83,140 +154,267 @@ class DocumentChatbot:
 
             logger.info(f"Processing question: {question[:100]}...")
 
-            # Get summary PDF name from session metadata
-            summary_pdf_name = self.session.metadata.get("summary_pdf_name", "")
+            context, metadata_list, search_stage = self._retrieve_context(question, max_context_chunks)
 
-            # Get list of source PDF names for filtering
-            source_pdf_names = self.session.metadata.get("source_pdf_names", [])
+            if not context:
+                return self._no_context_result()
 
-            # STAGE 1: Search summary PDF first (if it exists)
-            context = ""
-            metadata_list = []
-            search_stage = "sources"  # Default to sources if no summary
+            system_prompt, user_prompt = self._build_prompts(question, context, metadata_list)
 
-            if summary_pdf_name:
-                logger.info(f"Stage 1: Searching summary PDF: {summary_pdf_name}...")
+            # Get answer from LLM
+            answer = self._generate_answer(system_prompt, user_prompt)
 
-                # Use RAG system's search method to get chunks with scores
-                search_results = self.rag_system.search(
-                    question,
-                    k=max_context_chunks * 2  # Get more to filter from
-                )
+            return self._record_answer(question, answer, metadata_list, search_stage)
+
+        except Exception as e:
+            logger.error(f"Failed to answer question: {str(e)}")
+            return self._error_result(e)
+
+    def ask_question_stream(self, question: str, max_context_chunks: int = 5) -> Iterator[str]:
+        """
+        Ask a question and yield the answer as it is generated
+
+        Uses the same two-stage search as ask_question. Once the generator is
+        exhausted, last_metadata() returns the dictionary ask_question would
+        have returned (answer, sources, context_found, search_stage).
+
+        Args:
+            question: User's question
+            max_context_chunks: Maximum number of context chunks to retrieve
+
+        Yields:
+            Answer text chunks
+        """
+        self._last_result = None
+        answer_parts = []
+
+        try:
+            # Validate input to prevent prompt injection
+            question = self._validate_question(question)
+
+            logger.info(f"Processing question (streaming): {question[:100]}...")
+
+            context, metadata_list, search_stage = self._retrieve_context(question, max_context_chunks)
+
+            if not context:
+                self._last_result = self._no_context_result()
+                yield self._last_result["answer"]
+                return
+
+            system_prompt, user_prompt = self._build_prompts(question, context, metadata_list)
+
+            for text in self._generate_answer_stream(system_prompt, user_prompt):
+                answer_parts.append(text)
+                yield text
+
+            self._last_result = self._record_answer(
+                question, "".join(answer_parts), metadata_list, search_stage
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to answer question: {str(e)}")
+            self._last_result = self._error_result(e)
+            # Keep the error off the end of an answer that was partly streamed
+            separator = "\n\n" if answer_parts else ""
+            yield separator + self._last_result["answer"]
+
+    def last_metadata(self) -> Optional[Dict]:
+        """Result dictionary of the last ask_question_stream call (None while streaming)"""
+        return self._last_result
+
+    def reload_session_metadata(self):
+        """Re-read the session metadata used on every question"""
+        self._summary_pdf_name = self.session.metadata.get("summary_pdf_name", "")
+
+    def _retrieve_context(self, question: str, max_context_chunks: int) -> Tuple[str, List[Dict], str]:
+        """
+        Two-stage retrieval: summary PDF first, then all source PDFs
 
-                # Filter for summary PDF only
-                summary_results = [
-                    result for result in search_results
-                    if summary_pdf_name in result["metadata"].get("doc_name", "")
-                ]
-
-                if len(summary_results) >= 3:
-                    # Found enough in summary, use only summary results
-                    logger.info(f"✓ Stage 1 found {len(summary_results)} chunks from summary PDF")
-                    summary_results = summary_results[:max_context_chunks]
-
-                    # Build context and metadata from filtered results
-                    context_parts = []
-                    metadata_list = []
-
-                    for i, result in enumerate(summary_results):
-                        text = result["text"]
-                        meta = result["metadata"]
-                        source = meta.get("source", f"{meta.get('doc_name')}, p.{meta.get('page')}")
-                        section = meta.get("section", "Unknown Section")
-
-                        context_part = f"[Source {i+1}: {source}, §{section}]\n{text}\n"
-                        context_parts.append(context_part)
-                        metadata_list.append(meta)
-
-                    context = "\n".join(context_parts)
-                    search_stage = "summary"
-                else:
-                    logger.info(f"Stage 1 found only {len(summary_results)} chunks from summary. Proceeding to Stage 2...")
-
-            # STAGE 2: If insufficient information in summary, search source PDFs
-            if len(metadata_list) < 3:
-                logger.info("Stage 2: Searching all documents (source PDFs)...")
+        Returns:
+            Tuple of (context, metadata_list, search_stage)
+        """
+        max_context_chunks = self._effective_top_k(max_context_chunks)
+
+        # Summary PDF name, cached from session metadata
+        summary_pdf_name = self._summary_pdf_name
+
+        # STAGE 1: Search summary PDF first (if it exists)
+        context = ""
+        metadata_list = []
+        search_stage = "sources"  # Default to sources if no summary
+
+        # Without hybrid retrieval, stage 2 is a plain vector search, so the
+        # stage 1 search results can answer it without a second query
+        fused = bool(summary_pdf_name) and not self.rag_system.hybrid_enabled
+        search_results = []
+
+        # Start stage 2 speculatively so its hybrid search/rerank overlaps stage 1;
+        # the result is dropped if the summary alone is enough. Skipped after a
+        # summary answer, when the speculative search would most likely be wasted
+        stage2_future = None
+        if (summary_pdf_name and CHATBOT_SPECULATIVE_RETRIEVAL and not fused
+                and self._last_search_stage != "summary"):
+            stage2_future = self._submit_stage2(question, max_context_chunks)
+
+        if summary_pdf_name:
+            logger.info(f"Stage 1: Searching summary PDF: {summary_pdf_name}...")
+
+            # Use RAG system's search method to get chunks with scores,
+            # ranking summary chunks ahead of source chunks
+            search_results = self.rag_system.search(
+                question,
+                k=max_context_chunks * 3,  # Get more to filter from
+                boost_doc=summary_pdf_name
+            )
+
+            # Filter for summary PDF only
+            summary_results = [
+                result for result in search_results
+                if summary_pdf_name in result["metadata"].get("doc_name", "")
+            ]
+
+            if len(summary_results) >= 3:
+                # Found enough in summary, use only summary results
+                logger.info(f"✓ Stage 1 found {len(summary_results)} chunks from summary PDF")
+                summary_results = summary_results[:max_context_chunks]
+
+                # Build context and metadata from filtered results
+                context_parts = []
+                metadata_list = []
+
+                for i, result in enumerate(summary_results):
+                    text = result["text"]
+                    meta = result["metadata"]
+                    source = meta.get("source", f"{meta.get('doc_name')}, p.{meta.get('page')}")
+                    section = meta.get("section", "Unknown Section")
+
+                    context_part = f"[Source {i+1}: {source}, §{section}]\n{text}\n"
+                    context_parts.append(context_part)
+                    metadata_list.append(meta)
+
+                context = "\n".join(context_parts)
+                search_stage = "summary"
+            else:
+                logger.info(f"Stage 1 found only {len(summary_results)} chunks from summary. Proceeding to Stage 2...")
+
+        # STAGE 2: If insufficient information in summary, search source PDFs
+        if len(metadata_list) < 3:
+            logger.info("Stage 2: Searching all documents (source PDFs)...")
+            if stage2_future is not None:
+                context, metadata_list = stage2_future.result()
+            elif fused:
+                # Unboosted order is what a separate all-documents search returns
+                top_results = sorted(
+                    search_results, key=lambda r: r["similarity"], reverse=True
+                )[:max_context_chunks]
+                context, metadata_list = self.rag_system.format_context(top_results)
+            else:
                 context, metadata_list = self.rag_system.get_relevant_context(
                     question,
                     max_chunks=max_context_chunks
                 )
-                search_stage = "sources"
-                logger.info(f"✓ Stage 2 found {len(metadata_list)} chunks from all documents")
-
-            if not context:
-                return {
-                    "answer": "I couldn't find relevant information in the documents to answer your question. The question may be outside the scope of the provided documents.",
-                    "sources": [],
-                    "context_found": False,
-                    "search_stage": "none"
-                }
+            search_stage = "sources"
+            logger.info(f"✓ Stage 2 found {len(metadata_list)} chunks from all documents")
+        elif stage2_future is not None:
+            stage2_future.cancel()
+            logger.info("Stage 2 not needed; discarded the speculative all-documents search")
+
+        self._last_search_stage = search_stage
+        return context, metadata_list, search_stage
+
+    def _submit_stage2(self, question: str, max_context_chunks: int) -> Future:
+        """Queue the all-documents search, dropping a stale one that has not started yet"""
+        if self._stage2_future is not None:
+            self._stage2_future.cancel()
+
+        if self._retrieval_executor is None:
+            self._retrieval_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chatbot-retrieval")
+            # Chatbots live in per-browser session state; release the thread with the chatbot
+            weakref.finalize(self, self._retrieval_executor.shutdown, wait=False, cancel_futures=True)
+
+        self._stage2_future = self._retrieval_executor.submit(
+            self.rag_system.get_relevant_context,
+            question,
+            max_chunks=max_context_chunks
+        )
+        return self._stage2_future
 
-            # Build prompt for LLM with STRICT document grounding
-            system_prompt = """You are an expert research assistant helping users understand academic papers.
+    def _effective_top_k(self, max_context_chunks: int) -> int:
+        """
+        Scale the number of context chunks to the session size
 
-CRITICAL INSTRUCTIONS:
-- Answer ONLY using the provided context from research documents
-- DO NOT use your general knowledge or training data
-- If the context doesn't contain the answer, explicitly say "The provided documents do not contain information about this"
-- Never make assumptions or inferences beyond what's explicitly stated in the context
-- Every claim must be supported by the provided context
+        Small sessions get about sqrt(chunks) (at least 3, the stage-1
+        sufficiency bar) instead of the full max_context_chunks, so the LLM
+        is not sent near-duplicate context from a handful of pages.
+        """
+        total_chunks = len(self.rag_system.chunks_metadata)
+        effective_k = min(max_context_chunks, max(3, math.isqrt(total_chunks)))
 
-Guidelines:
-- Provide clear, detailed answers in 2-3 paragraphs
-- Reference specific sources with page numbers
-- Use natural, flowing language (not bullet points)
-- Include relevant details, data, and findings from the context
-- Be precise and accurate
-"""
+        if ENABLE_TIMING_METRICS:
+            logger.info(f"Retrieval top-k: {effective_k} (requested {max_context_chunks}, {total_chunks} chunks)")
 
-            # Format context with sources
-            formatted_context = self._format_context_with_sources(context, metadata_list)
+        return effective_k
 
-            # Create user prompt
-            user_prompt = f"""Based on the following excerpts from research documents, please answer this question:
+    def _build_prompts(self, question: str, context: str, metadata_list: List[Dict]) -> Tuple[str, str]:
+        """Build the grounded system and user prompts for a question"""
+        # Same text every turn, so the system block is a stable prompt-cache prefix
+        system_prompt = CHATBOT_SYSTEM_PROMPT
 
-**Question**: {question}
+        # Create user prompt; context is already labelled with sources by retrieval
+        user_prompt = CHATBOT_USER_PROMPT_TEMPLATE.format(
+            question=question,
+            context=context
+        )
 
-**Context from Documents**:
-{formatted_context}
+        return system_prompt, user_prompt
 
-**STRICT INSTRUCTIONS**:
-- Answer ONLY using the provided context above
-- DO NOT use any external knowledge or general AI knowledge
-- If the context doesn't contain enough information, clearly state: "The provided documents do not contain sufficient information about [specific aspect]"
-- Reference specific documents and page numbers when making claims
-- Write in clear, professional paragraphs (not bullet points)
-"""
+    def _record_answer(self, question: str, answer: str, metadata_list: List[Dict], search_stage: str) -> Dict:
+        """Store an answer in chat history and build the result dictionary"""
+        # Extract unique sources
+        sources = self._extract_unique_sources(metadata_list)
 
-            # Get answer from LLM
-            answer = self._generate_answer(system_prompt, user_prompt)
+        # Store in chat history, spilling the turn about to be evicted
+        if len(self.chat_history) == self.chat_history.maxlen:
+            self._spill_history_entry(self.chat_history[0])
+        self.chat_history.append({
+            "question": question,
+            "answer": answer,
+            "sources": sources,
+            "search_stage": search_stage
+        })
 
-            # Extract unique sources
-            sources = self._extract_unique_sources(metadata_list)
+        return {
+            "answer": answer,
+            "sources": sources,
+            "context_found": True,
+            "search_stage": search_stage
+        }
 
-            # Store in chat history
-            self.chat_history.append({
-                "question": question,
-                "answer": answer,
-                "sources": sources,
-                "search_stage": search_stage
-            })
+    def _spill_history_entry(self, entry: Dict):
+        """Append a chat turn evicted from memory to the session's history file"""
+        try:
+            with open(self.session.session_dir / "chat_history.jsonl", 'ab') as f:
+                f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to persist evicted chat turn: {str(e)}")
 
-            return {
-                "answer": answer,
-                "sources": sources,
-                "context_found": True,
-                "search_stage": search_stage
-            }
+    def _no_context_result(self) -> Dict:
+        """Result returned when retrieval finds nothing relevant"""
+        return {
+            "answer": "I couldn't find relevant information in the documents to answer your question. The question may be outside the scope of the provided documents.",
+            "sources": [],
+            "context_found": False,
+            "search_stage": "none"
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to answer question: {str(e)}")
-            return {
-                "answer": f"Error processing question: {str(e)}",
-                "sources": [],
-                "context_found": False,
-                "search_stage": "error"
-            }
+    def _error_result(self, error: Exception) -> Dict:
+        """Result returned when answering fails"""
+        return {
+            "answer": f"Error processing question: {str(error)}",
+            "sources": [],
+            "context_found": False,
+            "search_stage": "error"
+        }
 
     def _validate_question(self, question: str) -> str:
         """
@@ -235,54 +433,40 @@ Guidelines:
         if len(question) > 2000:
             raise ValueError("Question too long (max 2000 characters)")
 
-        # Check minimum length
-        if len(question.strip()) < 3:
-            raise ValueError("Question too short (min 3 characters)")
-
         # Strip whitespace
         question = question.strip()
 
-        # Log suspicious patterns (but don't block - Claude has built-in safety)
-        suspicious_patterns = [
-            "ignore previous", "ignore all previous", "ignore instructions",
-            "disregard", "bypass", "override system", "act as", "pretend to be",
-            "forget everything", "new instructions"
-        ]
+        # Check minimum length
+        if len(question) < 3:
+            raise ValueError("Question too short (min 3 characters)")
 
-        question_lower = question.lower()
-        for pattern in suspicious_patterns:
-            if pattern in question_lower:
+        # Log suspicious patterns (but don't block - Claude has built-in safety)
+        detected = {match.lower() for match in _SUSPICIOUS_RE.findall(question)}
+        for pattern in SUSPICIOUS_PATTERNS:
+            if pattern in detected:
                 logger.warning(f"Suspicious prompt pattern detected: {pattern}")
                 # Don't block - just log for monitoring
 
         return question
 
-    def _format_context_with_sources(self, context: str, metadata_list: List[Dict]) -> str:
-        """Format context with source attribution"""
-        # Context already formatted by RAG system with sources
-        return context
-
     def _extract_unique_sources(self, metadata_list: List[Dict]) -> List[Dict]:
-        """Extract unique sources from metadata"""
-        seen = set()
-        unique_sources = []
+        """Extract unique sources from metadata, in first-seen order"""
+        unique_sources = {}
 
         for metadata in metadata_list:
             doc_name = metadata.get("doc_name", "Unknown")
             page = metadata.get("page", 0)
-            section = metadata.get("section", "Unknown Section")
 
-            source_key = f"{doc_name}_{page}"
-            if source_key not in seen:
-                seen.add(source_key)
-                unique_sources.append({
+            source_key = (doc_name, page)
+            if source_key not in unique_sources:
+                unique_sources[source_key] = {
                     "doc_name": doc_name,
                     "page": page,
-                    "section": section,
+                    "section": metadata.get("section", "Unknown Section"),
                     "source": metadata.get("source", f"{doc_name}, p.{page}")
-                })
+                }
 
-        return unique_sources
+        return list(unique_sources.values())
 
     def _generate_answer(self, system_prompt: str, user_prompt: str) -> str:
         """Generate answer using LLM"""
@@ -304,13 +488,30 @@ Guidelines:
             logger.error(f"Failed to generate answer: {str(e)}")
             raise ClaudeAPIError(f"Failed to generate answer: {str(e)}")
 
+    def _generate_answer_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """Generate answer using LLM, yielding text as it arrives"""
+        messages = [
+            {"role": "user", "content": user_prompt}
+        ]
+
+        try:
+            yield from self.analyzer._stream_api_call(
+                messages=messages,
+                system_prompt=system_prompt,
+                max_tokens=2000
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to generate answer: {str(e)}")
+            raise ClaudeAPIError(f"Failed to generate answer: {str(e)}")
+
     def get_chat_history(self) -> List[Dict]:
-        """Get full chat history"""
-        return self.chat_history
+        """Get in-memory chat history (the most recent history_limit turns)"""
+        return list(self.chat_history)
 
     def clear_history(self):
         """Clear chat history"""
-        self.chat_history = []
+        self.chat_history.clear()
         logger.info("Chat history cleared")
 
     def get_session_info(self) -> Dict:
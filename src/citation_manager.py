@@ -3,26 +3,46 @@ Citation Manager
 Handles citation tracking and formatting for research analysis
 """
 
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from collections import defaultdict
+from functools import lru_cache
 import json
+import sys
+
+import orjson
 
 from utils.logger import get_logger
 from utils.exceptions import CitationError
 
 logger = get_logger(__name__)
 
+# Maximum number of formatted citation strings memoized per manager
+FORMAT_CACHE_SIZE = 4096
+
+
+def _intern(value):
+    """Intern strings so repeated document and section names share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class CitationManager:
     """
     Manages citations and references throughout the analysis
     """
 
-    def __init__(self):
-        """Initialize citation manager"""
+    def __init__(self, dedupe: bool = False):
+        """
+        Initialize citation manager
+
+        Args:
+            dedupe: Return the existing ID instead of adding a citation when the
+                same (doc_id, page, section, quote) was already cited
+        """
+        self.dedupe = dedupe
         self.citations = []
-        self.citation_map = {}  # Maps unique citation keys to citation IDs
+        self.citation_map = {}  # Maps (doc_id, page, section, quote) to the first citation ID
         self.next_id = 1  # Start from 1, not 0
+        self._reset_indexes()
 
         logger.info("Citation manager initialized")
 
@@ -50,20 +70,17 @@ class CitationManager:
             Citation ID
         """
         try:
-            # Create new citation (always create, no deduplication)
-            citation = {
-                "id": self.next_id,
-                "doc_id": doc_id,
-                "doc_name": doc_name,
-                "page": page_num,
-                "page_num": page_num,  # Include both for compatibility
-                "section": section_name,
-                "section_name": section_name,  # Include both for compatibility
-                "quote": quote,
-                "context": context
-            }
+            citation_key = (doc_id, page_num, section_name, quote)
+            if self.dedupe and citation_key in self.citation_map:
+                return self.citation_map[citation_key]
+
+            citation = self._make_citation(
+                self.next_id, doc_id, doc_name, page_num, section_name, quote, context
+            )
 
             self.citations.append(citation)
+            self.citation_map.setdefault(citation_key, self.next_id)
+            self._index_citation(citation)
 
             logger.debug(f"Added citation: {doc_name}, p.{page_num}, §{section_name}")
 
@@ -76,6 +93,31 @@ class CitationManager:
             logger.error(f"Failed to add citation: {str(e)}")
             raise CitationError(f"Failed to add citation: {str(e)}")
 
+    @staticmethod
+    def _make_citation(
+        citation_id: int,
+        doc_id: int,
+        doc_name: str,
+        page_num: int,
+        section_name: Optional[str] = None,
+        quote: Optional[str] = None,
+        context: Optional[str] = None
+    ) -> Dict:
+        """Build a citation dictionary"""
+        doc_name = _intern(doc_name)
+        section_name = _intern(section_name)
+        return {
+            "id": citation_id,
+            "doc_id": doc_id,
+            "doc_name": doc_name,
+            "page": page_num,
+            "page_num": page_num,  # Include both for compatibility
+            "section": section_name,
+            "section_name": section_name,  # Include both for compatibility
+            "quote": quote,
+            "context": context
+        }
+
     def add_citations_from_metadata(self, metadata_list: List[Dict]) -> List[int]:
         """
         Add multiple citations from metadata list
@@ -86,24 +128,42 @@ class CitationManager:
         Returns:
             List of citation IDs
         """
+        valid = [metadata for metadata in metadata_list if isinstance(metadata, dict)]
+        if len(valid) < len(metadata_list):
+            logger.warning(f"Skipped {len(metadata_list) - len(valid)} non-dict citation metadata entries")
+
         citation_ids = []
+        new_citations = []
+        next_id = self.next_id
 
-        for metadata in metadata_list:
-            try:
-                citation_id = self.add_citation(
-                    doc_id=metadata.get("doc_id", 0),
-                    doc_name=metadata.get("doc_name", "Unknown"),
-                    page_num=metadata.get("page", 0),
-                    section_name=metadata.get("section"),
-                    context=metadata.get("source")
-                )
-                citation_ids.append(citation_id)
-
-            except Exception as e:
-                logger.warning(f"Failed to add citation from metadata: {str(e)}")
+        for metadata in valid:
+            doc_id = metadata.get("doc_id", 0)
+            page_num = metadata.get("page", 0)
+            section_name = metadata.get("section")
+            citation_key = (doc_id, page_num, section_name, None)
+
+            if self.dedupe and citation_key in self.citation_map:
+                citation_ids.append(self.citation_map[citation_key])
                 continue
 
-        logger.debug(f"Added {len(citation_ids)} citations from metadata")
+            new_citations.append(self._make_citation(
+                next_id,
+                doc_id,
+                metadata.get("doc_name", "Unknown"),
+                page_num,
+                section_name=section_name,
+                context=metadata.get("source")
+            ))
+            self.citation_map.setdefault(citation_key, next_id)
+            citation_ids.append(next_id)
+            next_id += 1
+
+        self.citations.extend(new_citations)
+        for citation in new_citations:
+            self._index_citation(citation)
+        self.next_id = next_id
+
+        logger.debug(f"Added {len(new_citations)} citations from metadata")
         return citation_ids
 
     def get_citation(self, citation_id: int) -> Optional[Dict]:
@@ -116,15 +176,17 @@ class CitationManager:
         Returns:
             Citation dictionary or None
         """
-        for citation in self.citations:
-            if citation.get('id') == citation_id:
-                return citation
+        # IDs are assigned sequentially from 1, so an ID is its list position + 1
+        if isinstance(citation_id, int) and 0 < citation_id <= len(self.citations):
+            return self.citations[citation_id - 1]
         return None
 
     def format_citation(self, citation_ids: List[int], style: str = "inline") -> str:
         """
         Format citations according to style
 
+        Results are memoized per (citation IDs, style) until citations change.
+
         Args:
             citation_ids: List of citation IDs
             style: Citation style ("inline", "footnote", "endnote")
@@ -136,21 +198,12 @@ class CitationManager:
             if not citation_ids:
                 return ""
 
-            # Get citations
-            citations = [self.get_citation(cid) for cid in citation_ids]
-            citations = [c for c in citations if c is not None]
-
-            if not citations:
-                return ""
-
-            if style == "inline":
-                return self._format_inline(citations)
-            elif style == "footnote":
-                return self._format_footnote(citations)
-            elif style == "endnote":
-                return self._format_endnote(citations)
-            else:
-                raise ValueError(f"Invalid citation style: {style}. Must be 'inline', 'footnote', or 'endnote'.")
+            citation_ids = tuple(citation_ids)
+            # Citations are append-only, so only groups of known IDs are safe to memoize;
+            # keyed on the ordered IDs because output follows the order they are given in
+            if all(isinstance(i, int) and 0 < i <= len(self.citations) for i in citation_ids):
+                return self._format_cached(citation_ids, style)
+            return self._format_uncached(citation_ids, style)
 
         except ValueError:
             # Re-raise ValueError for invalid style
@@ -159,6 +212,23 @@ class CitationManager:
             logger.error(f"Failed to format citation: {str(e)}")
             return "[Citation Error]"
 
+    def _format_uncached(self, citation_ids: Tuple[int, ...], style: str) -> str:
+        """Format citations without consulting the cache"""
+        # Get citations
+        citations = [c for c in map(self.get_citation, citation_ids) if c is not None]
+
+        if not citations:
+            return ""
+
+        if style == "inline":
+            return self._format_inline(citations)
+        elif style == "footnote":
+            return self._format_footnote(citations)
+        elif style == "endnote":
+            return self._format_endnote(citations)
+        else:
+            raise ValueError(f"Invalid citation style: {style}. Must be 'inline', 'footnote', or 'endnote'.")
+
     def _format_inline(self, citations: List[Dict]) -> str:
         """
         Format citations as inline references
@@ -169,17 +239,19 @@ class CitationManager:
         Returns:
             Formatted inline citation
         """
-        # Group by document
-        by_doc = defaultdict(list)
+        # Group by document, collecting pages and sections (first-seen order) in one pass
+        by_doc = defaultdict(lambda: {"pages": set(), "sections": {}})
         for cite in citations:
-            doc_name = cite["doc_name"]
-            by_doc[doc_name].append(cite)
+            group = by_doc[cite["doc_name"]]
+            group["pages"].add(cite["page"])
+            section = cite.get("section")
+            if section:
+                group["sections"][section] = None
 
         # Format: [Doc1, pp.5-7, §2.3; Doc2, p.12, §3.1]
         parts = []
-        for doc_name, cites in by_doc.items():
-            # Get unique pages
-            pages = sorted(set(c["page"] for c in cites))
+        for doc_name, group in by_doc.items():
+            pages = sorted(group["pages"])
 
             # Format pages
             if len(pages) == 1:
@@ -189,15 +261,13 @@ class CitationManager:
             else:
                 page_str = f"pp.{pages[0]}-{pages[-1]}"
 
-            # Get unique sections
-            sections = [c.get("section") for c in cites if c.get("section")]
+            # Format sections
+            sections = list(group["sections"])
             section_str = ""
-            if sections:
-                unique_sections = list(set(sections))
-                if len(unique_sections) == 1:
-                    section_str = f", §{unique_sections[0]}"
-                elif len(unique_sections) > 1:
-                    section_str = f", §{unique_sections[0]} et al."
+            if len(sections) == 1:
+                section_str = f", §{sections[0]}"
+            elif len(sections) > 1:
+                section_str = f", §{sections[0]} et al."
 
             parts.append(f"{doc_name}, {page_str}{section_str}")
 
@@ -230,35 +300,25 @@ class CitationManager:
         """
         try:
             if citation_ids is None:
-                # Use all citations
-                citations_to_use = self.citations
+                # All citations are already grouped by the document index
+                by_doc = self._doc_index
             else:
-                citations_to_use = [self.get_citation(cid) for cid in citation_ids]
-                citations_to_use = [c for c in citations_to_use if c is not None]
-
-            # Group by document
-            by_doc = defaultdict(list)
-            for cite in citations_to_use:
-                doc_id = cite["doc_id"]
-                by_doc[doc_id].append(cite)
-
-            # Create bibliography entries
-            bibliography = []
-            for doc_id, cites in sorted(by_doc.items()):
-                # Get document info from first citation
-                first_cite = cites[0]
-
-                # Get all pages referenced
-                pages = sorted(set(c["page"] for c in cites))
-
-                entry = {
+                by_doc = defaultdict(list)
+                for cite in map(self.get_citation, citation_ids):
+                    if cite is not None:
+                        by_doc[cite["doc_id"]].append(cite)
+
+            # Create bibliography entries; document info comes from the first citation
+            bibliography = [
+                {
                     "doc_id": doc_id,
-                    "doc_name": first_cite["doc_name"],
-                    "pages_cited": pages,
+                    "doc_name": cites[0]["doc_name"],
+                    "pages_cited": sorted({c["page"] for c in cites}),
                     "citation_count": len(cites)
                 }
-
-                bibliography.append(entry)
+                for doc_id, cites in sorted(by_doc.items(), key=lambda item: item[0])
+                if cites
+            ]
 
             logger.debug(f"Generated bibliography with {len(bibliography)} entries")
             return bibliography
@@ -267,29 +327,60 @@ class CitationManager:
             logger.error(f"Failed to generate bibliography: {str(e)}")
             return []
 
+    def _reset_indexes(self):
+        """Reset the document index and the running counters behind get_citation_statistics"""
+        self._doc_index: Dict[int, List[Dict]] = defaultdict(list)  # Maps doc IDs to citations
+        self._unique_docs = set()
+        self._unique_pages = set()
+        self._quote_count = 0
+        self._doc_counts = defaultdict(int)
+        self._doc_order: Dict[str, int] = {}  # First-cited order, for tie-breaks
+        self._most_cited: Optional[str] = None
+        # Fresh per-instance cache so cleared or reloaded citations never format stale
+        self._format_cached = lru_cache(maxsize=FORMAT_CACHE_SIZE)(self._format_uncached)
+
+    def _index_citation(self, cite: Dict):
+        """Add one citation to the document index and running counters"""
+        doc_id = cite["doc_id"]
+        self._doc_index[doc_id].append(cite)
+
+        doc_name = cite["doc_name"]
+        self._unique_docs.add(doc_id)
+        self._unique_pages.add((doc_id, cite["page"]))
+        if cite.get("quote"):
+            self._quote_count += 1
+
+        self._doc_order.setdefault(doc_name, len(self._doc_order))
+        self._doc_counts[doc_name] += 1
+        count = self._doc_counts[doc_name]
+
+        # Ties go to the document cited first
+        best = self._most_cited
+        if best is None or count > self._doc_counts[best] or (
+            count == self._doc_counts[best] and self._doc_order[doc_name] < self._doc_order[best]
+        ):
+            self._most_cited = doc_name
+
     def get_citation_statistics(self) -> Dict:
         """
         Get statistics about citations
 
+        Counters are maintained as citations are added, loaded or cleared.
+
         Returns:
             Dictionary with citation statistics
         """
         stats = {
             "total_citations": len(self.citations),
-            "unique_documents": len(set(c["doc_id"] for c in self.citations)),
-            "unique_pages": len(set((c["doc_id"], c["page"]) for c in self.citations)),
-            "citations_with_quotes": len([c for c in self.citations if c.get("quote")])
+            "unique_documents": len(self._unique_docs),
+            "unique_pages": len(self._unique_pages),
+            "citations_with_quotes": self._quote_count
         }
 
         # Most cited document
-        doc_counts = defaultdict(int)
-        for cite in self.citations:
-            doc_counts[cite["doc_name"]] += 1
-
-        if doc_counts:
-            most_cited = max(doc_counts.items(), key=lambda x: x[1])
-            stats["most_cited_document"] = most_cited[0]
-            stats["most_cited_count"] = most_cited[1]
+        if self._most_cited is not None:
+            stats["most_cited_document"] = self._most_cited
+            stats["most_cited_count"] = self._doc_counts[self._most_cited]
 
         return stats
 
@@ -305,11 +396,11 @@ class CitationManager:
             # Create parent directories if they don't exist
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, "w") as f:
-                json.dump({
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps({
                     "citations": self.citations,
                     "next_id": self.next_id
-                }, f, indent=2)
+                }, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
             logger.info(f"Citations saved to {file_path}")
 
@@ -331,11 +422,23 @@ class CitationManager:
             self.citations = data["citations"]
             self.next_id = data["next_id"]
 
-            # Rebuild citation map
+            # Citation IDs double as list positions; renumber files that break that
+            if any(cite["id"] != i for i, cite in enumerate(self.citations, start=1)):
+                logger.warning(f"Renumbering non-sequential citation IDs from {file_path}")
+                for i, cite in enumerate(self.citations, start=1):
+                    cite["id"] = i
+                self.next_id = len(self.citations) + 1
+
+            # Rebuild citation map, indexes and statistics
             self.citation_map = {}
+            self._reset_indexes()
             for cite in self.citations:
-                citation_key = f"{cite['doc_id']}_{cite['page']}_{cite.get('section')}"
-                self.citation_map[citation_key] = cite["id"]
+                # Share one string object per repeated document/section name
+                for field in ("doc_name", "section", "section_name"):
+                    cite[field] = _intern(cite.get(field))
+                citation_key = (cite["doc_id"], cite["page"], cite.get("section"), cite.get("quote"))
+                self.citation_map.setdefault(citation_key, cite["id"])
+                self._index_citation(cite)
 
             logger.info(f"Citations loaded from {file_path}")
 
@@ -352,6 +455,7 @@ class CitationManager:
         self.citations = []
         self.citation_map = {}
         self.next_id = 1
+        self._reset_indexes()
         logger.info("Citations cleared")
 
     def clear_citations(self):
@@ -368,4 +472,4 @@ class CitationManager:
         Returns:
             List of citation dictionaries for the specified document
         """
-        return [c for c in self.citations if c.get('doc_id') == doc_id]
+        return list(self._doc_index.get(doc_id, ()))
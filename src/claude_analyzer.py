@@ -3,30 +3,52 @@ Claude API Analyzer
 Handles AI-powered analysis of research documents using Claude Sonnet 4.5
 """
 
+import asyncio
+import hashlib
+import random
 import time
-from typing import List, Dict, Optional
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import anthropic
 from anthropic import APIError, APIConnectionError, RateLimitError as AnthropicRateLimitError
 
 from config.settings import (
-    ANTHROPIC_API_KEY,
+    get_api_key,
     CLAUDE_MODEL,
     CLAUDE_MAX_TOKENS,
     CLAUDE_TEMPERATURE,
     CLAUDE_REQUEST_TIMEOUT,
     CLAUDE_MAX_RETRIES,
     CLAUDE_RETRY_DELAY,
+    CLAUDE_RETRY_MAX_DELAY,
+    CLAUDE_MAX_CONCURRENT_REQUESTS,
+    ENABLE_RESPONSE_CACHE,
     EXPERT_SYSTEM_PROMPT,
-    ANALYSIS_PROMPT_TEMPLATE,
-    SYNTHESIS_PROMPT_TEMPLATE
+    render_analysis_prompt,
+    render_synthesis_prompt
 )
+from src.api_clients import get_anthropic_client
+from src.response_cache import ResponseCache
 from utils.logger import get_logger
 from utils.exceptions import ClaudeAPIError, RateLimitError, AuthenticationError
 from utils.image_utils import image_to_base64
 
 logger = get_logger(__name__)
 
+# Distinct image contents whose base64 encoding is kept for reuse
+IMAGE_ENCODING_CACHE_SIZE = 64
+
+# Queries used by analyze_with_rag when none are given
+DEFAULT_ANALYSIS_QUERIES = [
+    "What are the main research questions and objectives?",
+    "What methodologies are used in these studies?",
+    "What are the key findings and contributions?",
+    "What are the limitations and future directions?",
+    "How do these studies relate to each other?"
+]
+
 
 class ClaudeAnalyzer:
     """
@@ -36,25 +58,142 @@ class ClaudeAnalyzer:
     def __init__(self):
         """Initialize Claude analyzer"""
         try:
-            self.client = anthropic.Anthropic(
-                api_key=ANTHROPIC_API_KEY,
-                timeout=CLAUDE_REQUEST_TIMEOUT
-            )
+            self.client = get_anthropic_client(get_api_key("api"), CLAUDE_REQUEST_TIMEOUT)
+            self._aclient: Optional[anthropic.AsyncAnthropic] = None
             self.model = CLAUDE_MODEL
+            self.response_cache = ResponseCache() if ENABLE_RESPONSE_CACHE else None
+            # id(image) -> (weak reference, base64 data) for images already encoded
+            self._image_base64: Dict[int, Tuple[weakref.ref, str]] = {}
+            # Pixel-content digest -> base64 data, so identical copies share an encoding
+            self._encoded_images: "OrderedDict[bytes, str]" = OrderedDict()
             logger.info(f"Claude analyzer initialized with model: {self.model}")
 
         except Exception as e:
             logger.error(f"Failed to initialize Claude client: {str(e)}")
             raise ClaudeAPIError(f"Initialization failed: {str(e)}")
 
-    def _make_api_call(self, messages: List[Dict], system_prompt: str, max_tokens: int = CLAUDE_MAX_TOKENS) -> str:
+    @property
+    def aclient(self) -> anthropic.AsyncAnthropic:
+        """Async client for concurrent calls, created on first use"""
+        if self._aclient is None:
+            self._aclient = self._new_async_client()
+        return self._aclient
+
+    @staticmethod
+    def _new_async_client() -> anthropic.AsyncAnthropic:
+        """Create an async client; it is bound to the event loop it is first used on"""
+        return anthropic.AsyncAnthropic(api_key=get_api_key("api"), timeout=CLAUDE_REQUEST_TIMEOUT)
+
+    def _request_params(self, messages: List[Dict], system_prompt: str, max_tokens: int) -> Dict:
+        """Build the messages.create arguments shared by the sync and async calls"""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": CLAUDE_TEMPERATURE,
+            "system": [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}  # Enable prompt caching
+            }],
+            "messages": messages
+        }
+
+    def _cache_key(self, system_prompt: str, params: Dict, cache: bool) -> Optional[str]:
+        """Response cache key for a request, or None when caching is off"""
+        if not cache or self.response_cache is None:
+            return None
+        return self.response_cache.make_key(
+            params["model"], system_prompt, params["messages"],
+            params["max_tokens"], params["temperature"]
+        )
+
+    def clear_cache(self):
+        """Remove all cached Claude responses"""
+        if self.response_cache is not None:
+            self.response_cache.clear()
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """Extract the text of a Claude response, logging token usage"""
+        if response.content and len(response.content) > 0:
+            result_text = response.content[0].text
+
+            # Log usage for monitoring
+            if hasattr(response, 'usage'):
+                logger.info(f"API usage - Input: {response.usage.input_tokens}, "
+                          f"Output: {response.usage.output_tokens}")
+
+            return result_text
+
+        raise ClaudeAPIError("Empty response from Claude API")
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """
+        Decide how long to wait before retrying a failed API call
+
+        Delays grow exponentially from CLAUDE_RETRY_DELAY up to
+        CLAUDE_RETRY_MAX_DELAY and are jittered so concurrent callers do not
+        retry in lockstep.
+
+        Args:
+            error: Exception raised by the API call
+            attempt: Zero-based attempt number that failed
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            ClaudeAPIError: If the error is not retryable or retries are exhausted
+            RateLimitError: If rate limit exceeded on the last attempt
+            AuthenticationError: If authentication fails
+        """
+        last_attempt = attempt >= CLAUDE_MAX_RETRIES - 1
+
+        if isinstance(error, AnthropicRateLimitError):
+            logger.warning(f"Rate limit exceeded (attempt {attempt + 1})")
+            if last_attempt:
+                raise RateLimitError(f"Rate limit exceeded after {CLAUDE_MAX_RETRIES} attempts")
+
+        elif isinstance(error, APIConnectionError):
+            logger.warning(f"Connection error (attempt {attempt + 1}): {str(error)}")
+            if last_attempt:
+                raise ClaudeAPIError(f"Connection failed after {CLAUDE_MAX_RETRIES} attempts: {str(error)}")
+
+        elif isinstance(error, anthropic.AuthenticationError):
+            logger.error(f"Authentication error: {str(error)}")
+            raise AuthenticationError(f"Invalid API key: {str(error)}")
+
+        elif isinstance(error, APIError):
+            logger.error(f"Claude API error: {str(error)}")
+            if last_attempt:
+                raise ClaudeAPIError(f"API error after {CLAUDE_MAX_RETRIES} attempts: {str(error)}")
+
+        else:
+            logger.error(f"Unexpected error in API call: {str(error)}")
+            raise ClaudeAPIError(f"Unexpected error: {str(error)}")
+
+        wait_time = min(CLAUDE_RETRY_MAX_DELAY, CLAUDE_RETRY_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+        logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
+        return wait_time
+
+    def _make_api_call(
+        self,
+        messages: List[Dict],
+        system_prompt: str,
+        max_tokens: int = CLAUDE_MAX_TOKENS,
+        cache: bool = True
+    ) -> str:
         """
         Make API call to Claude with retry logic
 
+        Identical requests are answered from the response cache.
+
         Args:
             messages: List of message dictionaries
             system_prompt: System prompt
             max_tokens: Maximum tokens in response
+            cache: Read and write the response cache (False forces a fresh call)
 
         Returns:
             Response text
@@ -64,68 +203,115 @@ class ClaudeAnalyzer:
             RateLimitError: If rate limit exceeded
             AuthenticationError: If authentication fails
         """
+        params = self._request_params(messages, system_prompt, max_tokens)
+        cache_key = self._cache_key(system_prompt, params, cache)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         for attempt in range(CLAUDE_MAX_RETRIES):
             try:
                 logger.debug(f"Making Claude API call (attempt {attempt + 1}/{CLAUDE_MAX_RETRIES})")
+                result_text = self._response_text(self.client.messages.create(**params))
+                if cache_key:
+                    self.response_cache.set(cache_key, result_text)
+                return result_text
 
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    temperature=CLAUDE_TEMPERATURE,
-                    system=[{
-                        "type": "text",
-                        "text": system_prompt,
-                        "cache_control": {"type": "ephemeral"}  # Enable prompt caching
-                    }],
-                    messages=messages
-                )
+            except Exception as e:
+                time.sleep(self._retry_delay(e, attempt))
+
+        raise ClaudeAPIError("Max retries exceeded")
+
+    async def _make_api_call_async(
+        self,
+        messages: List[Dict],
+        system_prompt: str,
+        max_tokens: int = CLAUDE_MAX_TOKENS,
+        cache: bool = True,
+        client: Optional[anthropic.AsyncAnthropic] = None
+    ) -> str:
+        """
+        Make API call to Claude without blocking the event loop
+
+        Same retry and caching behaviour as _make_api_call, so several calls
+        can be awaited together (e.g. with asyncio.gather).
+
+        Args:
+            messages: List of message dictionaries
+            system_prompt: System prompt
+            max_tokens: Maximum tokens in response
+            cache: Read and write the response cache (False forces a fresh call)
+            client: Async client to use (default: the shared aclient)
 
-                # Extract text from response
-                if response.content and len(response.content) > 0:
-                    result_text = response.content[0].text
-
-                    # Log usage for monitoring
-                    if hasattr(response, 'usage'):
-                        logger.info(f"API usage - Input: {response.usage.input_tokens}, "
-                                  f"Output: {response.usage.output_tokens}")
-
-                    return result_text
-
-                raise ClaudeAPIError("Empty response from Claude API")
-
-            except AnthropicRateLimitError as e:
-                logger.warning(f"Rate limit exceeded (attempt {attempt + 1})")
-                if attempt < CLAUDE_MAX_RETRIES - 1:
-                    wait_time = CLAUDE_RETRY_DELAY * (attempt + 1)
-                    logger.info(f"Waiting {wait_time} seconds before retry...")
-                    time.sleep(wait_time)
-                else:
-                    raise RateLimitError(f"Rate limit exceeded after {CLAUDE_MAX_RETRIES} attempts")
-
-            except APIConnectionError as e:
-                logger.warning(f"Connection error (attempt {attempt + 1}): {str(e)}")
-                if attempt < CLAUDE_MAX_RETRIES - 1:
-                    time.sleep(CLAUDE_RETRY_DELAY)
-                else:
-                    raise ClaudeAPIError(f"Connection failed after {CLAUDE_MAX_RETRIES} attempts: {str(e)}")
-
-            except anthropic.AuthenticationError as e:
-                logger.error(f"Authentication error: {str(e)}")
-                raise AuthenticationError(f"Invalid API key: {str(e)}")
-
-            except APIError as e:
-                logger.error(f"Claude API error: {str(e)}")
-                if attempt < CLAUDE_MAX_RETRIES - 1:
-                    time.sleep(CLAUDE_RETRY_DELAY)
-                else:
-                    raise ClaudeAPIError(f"API error after {CLAUDE_MAX_RETRIES} attempts: {str(e)}")
+        Returns:
+            Response text
+
+        Raises:
+            ClaudeAPIError: If API call fails
+            RateLimitError: If rate limit exceeded
+            AuthenticationError: If authentication fails
+        """
+        params = self._request_params(messages, system_prompt, max_tokens)
+        cache_key = self._cache_key(system_prompt, params, cache)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        client = client or self.aclient
+        for attempt in range(CLAUDE_MAX_RETRIES):
+            try:
+                logger.debug(f"Making async Claude API call (attempt {attempt + 1}/{CLAUDE_MAX_RETRIES})")
+                result_text = self._response_text(await client.messages.create(**params))
+                if cache_key:
+                    self.response_cache.set(cache_key, result_text)
+                return result_text
 
             except Exception as e:
-                logger.error(f"Unexpected error in API call: {str(e)}")
-                raise ClaudeAPIError(f"Unexpected error: {str(e)}")
+                await asyncio.sleep(self._retry_delay(e, attempt))
 
         raise ClaudeAPIError("Max retries exceeded")
 
+    def _encode_image(self, image) -> str:
+        """
+        Base64-encode an image, reusing earlier encodings of the same image
+
+        The same object is recognised by identity; a different object with
+        identical pixels is recognised by a digest of its raw data, which is
+        much cheaper than encoding it again.
+
+        Args:
+            image: PIL image (not modified in place after encoding)
+
+        Returns:
+            Base64 encoded string
+        """
+        key = id(image)
+        entry = self._image_base64.get(key)
+        if entry is not None and entry[0]() is image:
+            return entry[1]
+
+        # Palette images ("P"/"PA") store indices; the palette and transparency give the colours
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{image.mode}{image.size}".encode())
+        hasher.update(image.tobytes())
+        hasher.update(repr((image.getpalette(), image.info.get("transparency"))).encode())
+        digest = hasher.digest()
+        encoded = self._encoded_images.get(digest)
+        if encoded is None:
+            encoded = image_to_base64(image)
+            self._encoded_images[digest] = encoded
+            if len(self._encoded_images) > IMAGE_ENCODING_CACHE_SIZE:
+                self._encoded_images.popitem(last=False)
+        else:
+            self._encoded_images.move_to_end(digest)
+
+        # Drop the entry when the image is collected so a reused id never matches
+        ref = weakref.ref(image, lambda _, key=key: self._image_base64.pop(key, None))
+        self._image_base64[key] = (ref, encoded)
+        return encoded
+
     def analyze_text_chunk(
         self,
         text: str,
@@ -151,7 +337,7 @@ class ClaudeAnalyzer:
             logger.info(f"Analyzing chunk from {doc_name}, page {page_num}")
 
             # Prepare prompt
-            prompt = ANALYSIS_PROMPT_TEMPLATE.format(
+            prompt = render_analysis_prompt(
                 doc_name=doc_name,
                 page_num=page_num,
                 section_name=section_name or "Unknown Section",
@@ -165,7 +351,7 @@ class ClaudeAnalyzer:
             if images:
                 for img in images[:3]:  # Limit to 3 images per chunk
                     try:
-                        img_base64 = image_to_base64(img["image"])
+                        img_base64 = self._encode_image(img["image"])
                         content.append({
                             "type": "image",
                             "source": {
@@ -196,6 +382,47 @@ class ClaudeAnalyzer:
             logger.error(f"Failed to analyze chunk: {str(e)}")
             raise ClaudeAPIError(f"Analysis failed: {str(e)}")
 
+    @staticmethod
+    def _synthesis_messages(retrieved_chunks: List[Dict], topic: Optional[str]) -> List[Dict]:
+        """Build the synthesis request for a set of retrieved chunks"""
+        # Prepare retrieved content, sending each distinct chunk only once
+        content_parts = []
+        seen = set()
+        for chunk in retrieved_chunks:
+            text = chunk.get("text", "")
+            metadata = chunk.get("metadata", {})
+            source = metadata.get("source", "Unknown")
+            section = metadata.get("section", "Unknown Section")
+
+            chunk_key = (source, section, hashlib.blake2b(text.encode(), digest_size=8).digest())
+            if chunk_key in seen:
+                continue
+            seen.add(chunk_key)
+
+            content_parts.append(
+                f"**Source {len(content_parts) + 1}**: {source}, §{section}\n{text}\n"
+            )
+
+        retrieved_content = "\n---\n".join(content_parts)
+
+        # Prepare prompt
+        prompt = render_synthesis_prompt(
+            doc_count=len(set(c.get("metadata", {}).get("doc_name", "") for c in retrieved_chunks)),
+            topic=topic or "research findings",
+            retrieved_content=retrieved_content
+        )
+
+        return [{"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _synthesis_result(retrieved_chunks: List[Dict], synthesis_text: str) -> Dict:
+        """Package a synthesis response with its chunk and document counts"""
+        return {
+            "synthesis": synthesis_text,
+            "chunk_count": len(retrieved_chunks),
+            "doc_count": len(set(c.get("metadata", {}).get("doc_name", "") for c in retrieved_chunks))
+        }
+
     def synthesize_insights(
         self,
         retrieved_chunks: List[Dict],
@@ -220,37 +447,49 @@ class ClaudeAnalyzer:
                     "chunk_count": 0
                 }
 
-            # Prepare retrieved content
-            content_parts = []
-            for i, chunk in enumerate(retrieved_chunks):
-                text = chunk.get("text", "")
-                metadata = chunk.get("metadata", {})
-                source = metadata.get("source", "Unknown")
-                section = metadata.get("section", "Unknown Section")
+            messages = self._synthesis_messages(retrieved_chunks, topic)
 
-                content_parts.append(
-                    f"**Source {i+1}**: {source}, §{section}\n{text}\n"
-                )
+            # Make API call
+            synthesis_text = self._make_api_call(messages, EXPERT_SYSTEM_PROMPT, max_tokens=6000)
 
-            retrieved_content = "\n---\n".join(content_parts)
+            return self._synthesis_result(retrieved_chunks, synthesis_text)
 
-            # Prepare prompt
-            prompt = SYNTHESIS_PROMPT_TEMPLATE.format(
-                doc_count=len(set(c.get("metadata", {}).get("doc_name", "") for c in retrieved_chunks)),
-                topic=topic or "research findings",
-                retrieved_content=retrieved_content
-            )
+        except Exception as e:
+            logger.error(f"Failed to synthesize insights: {str(e)}")
+            raise ClaudeAPIError(f"Synthesis failed: {str(e)}")
 
-            messages = [{"role": "user", "content": prompt}]
+    async def synthesize_insights_async(
+        self,
+        retrieved_chunks: List[Dict],
+        topic: Optional[str] = None,
+        client: Optional[anthropic.AsyncAnthropic] = None
+    ) -> Dict:
+        """
+        Synthesize insights from retrieved chunks without blocking the event loop
 
-            # Make API call
-            synthesis_text = self._make_api_call(messages, EXPERT_SYSTEM_PROMPT, max_tokens=6000)
+        Args:
+            retrieved_chunks: List of chunk dictionaries from RAG search
+            topic: Optional topic description
+            client: Async client to use (default: the shared aclient)
 
-            return {
-                "synthesis": synthesis_text,
-                "chunk_count": len(retrieved_chunks),
-                "doc_count": len(set(c.get("metadata", {}).get("doc_name", "") for c in retrieved_chunks))
-            }
+        Returns:
+            Dictionary with synthesis results
+        """
+        try:
+            logger.info(f"Synthesizing insights from {len(retrieved_chunks)} chunks")
+
+            if not retrieved_chunks:
+                return {
+                    "synthesis": "No relevant content found for synthesis.",
+                    "chunk_count": 0
+                }
+
+            messages = self._synthesis_messages(retrieved_chunks, topic)
+            synthesis_text = await self._make_api_call_async(
+                messages, EXPERT_SYSTEM_PROMPT, max_tokens=6000, client=client
+            )
+
+            return self._synthesis_result(retrieved_chunks, synthesis_text)
 
         except Exception as e:
             logger.error(f"Failed to synthesize insights: {str(e)}")
@@ -315,6 +554,95 @@ Keep the summary concise but comprehensive (500-800 words).
             logger.error(f"Failed to generate executive summary: {str(e)}")
             return f"Error generating summary: {str(e)}"
 
+    async def _analyze_query(
+        self,
+        rag_system,
+        query: str,
+        semaphore: asyncio.Semaphore,
+        client: Optional[anthropic.AsyncAnthropic] = None
+    ) -> Optional[Dict]:
+        """
+        Retrieve context for one query and synthesize insights from it
+
+        Args:
+            rag_system: RAGSystem instance
+            query: Analysis query
+            semaphore: Limits how many queries call Claude at once
+            client: Async client to use (default: the shared aclient)
+
+        Returns:
+            Analysis result, or None if no relevant context was found
+        """
+        async with semaphore:
+            logger.info(f"Analyzing query: {query}")
+
+            # Retrieval is synchronous; keep it off the event loop
+            chunks = await asyncio.to_thread(
+                rag_system.get_relevant_chunks, query, max_chunks=5
+            )
+
+            if not chunks:
+                logger.warning(f"No relevant context found for query: {query}")
+                return None
+
+            # Synthesize insights
+            synthesis = await self.synthesize_insights_async(chunks, topic=query, client=client)
+
+            return {
+                "query": query,
+                "synthesis": synthesis["synthesis"],
+                "sources": [chunk["metadata"] for chunk in chunks]
+            }
+
+    async def analyze_with_rag_async(
+        self,
+        rag_system,
+        analysis_queries: Optional[List[str]] = None,
+        max_concurrency: int = CLAUDE_MAX_CONCURRENT_REQUESTS,
+        client: Optional[anthropic.AsyncAnthropic] = None
+    ) -> List[Dict]:
+        """
+        Perform comprehensive analysis using RAG system, running queries concurrently
+
+        A query that fails is logged and left out of the results; the
+        analysis only fails if every query does.
+
+        Args:
+            rag_system: RAGSystem instance
+            analysis_queries: Optional list of specific queries to analyze
+            max_concurrency: Maximum number of queries analyzed at once
+            client: Async client to use (default: the shared aclient)
+
+        Returns:
+            List of analysis results, in query order
+        """
+        logger.info("Starting comprehensive RAG-based analysis")
+
+        # Default queries if none provided
+        if not analysis_queries:
+            analysis_queries = DEFAULT_ANALYSIS_QUERIES
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        outcomes = await asyncio.gather(
+            *(self._analyze_query(rag_system, query, semaphore, client) for query in analysis_queries),
+            return_exceptions=True
+        )
+
+        results = []
+        errors = []
+        for query, outcome in zip(analysis_queries, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Analysis failed for query '{query}': {str(outcome)}")
+                errors.append(outcome)
+            elif outcome is not None:
+                results.append(outcome)
+
+        if errors and len(errors) == len(analysis_queries):
+            raise ClaudeAPIError(f"RAG analysis failed: {str(errors[0])}")
+
+        logger.info(f"Completed analysis of {len(results)} queries")
+        return results
+
     def analyze_with_rag(
         self,
         rag_system,
@@ -323,53 +651,42 @@ Keep the summary concise but comprehensive (500-800 words).
         """
         Perform comprehensive analysis using RAG system
 
+        Runs its own event loop, so it cannot be called from a coroutine;
+        await analyze_with_rag_async there instead.
+
         Args:
             rag_system: RAGSystem instance
             analysis_queries: Optional list of specific queries to analyze
 
         Returns:
             List of analysis results
+
+        Raises:
+            ClaudeAPIError: If called from a running event loop or every query fails
         """
         try:
-            logger.info("Starting comprehensive RAG-based analysis")
-
-            # Default queries if none provided
-            if not analysis_queries:
-                analysis_queries = [
-                    "What are the main research questions and objectives?",
-                    "What methodologies are used in these studies?",
-                    "What are the key findings and contributions?",
-                    "What are the limitations and future directions?",
-                    "How do these studies relate to each other?"
-                ]
-
-            results = []
-
-            for query in analysis_queries:
-                logger.info(f"Analyzing query: {query}")
-
-                # Get relevant context from RAG
-                context, metadata_list = rag_system.get_relevant_context(query, max_chunks=5)
-
-                if not context:
-                    logger.warning(f"No relevant context found for query: {query}")
-                    continue
-
-                # Synthesize insights
-                synthesis = self.synthesize_insights(
-                    [{"text": context, "metadata": m} for m in metadata_list],
-                    topic=query
-                )
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise ClaudeAPIError(
+                "analyze_with_rag cannot run inside an event loop; await analyze_with_rag_async instead"
+            )
 
-                results.append({
-                    "query": query,
-                    "synthesis": synthesis["synthesis"],
-                    "sources": metadata_list
-                })
+        async def run():
+            # A client of its own, bound to this loop and closed with it;
+            # the shared aclient may belong to another caller's loop
+            client = self._new_async_client()
+            try:
+                return await self.analyze_with_rag_async(rag_system, analysis_queries, client=client)
+            finally:
+                await client.close()
 
-            logger.info(f"Completed analysis of {len(results)} queries")
-            return results
+        try:
+            return asyncio.run(run())
 
+        except ClaudeAPIError:
+            raise
         except Exception as e:
             logger.error(f"RAG analysis failed: {str(e)}")
             raise ClaudeAPIError(f"RAG analysis failed: {str(e)}")
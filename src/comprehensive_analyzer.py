@@ -4,13 +4,13 @@ Creates detailed research notes with cross-document synthesis
 """
 
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 import anthropic
 from anthropic import APIError, APIConnectionError, RateLimitError as AnthropicRateLimitError
 
 from config.settings import (
     MODEL_MODE,
-    ANTHROPIC_API_KEY,
+    get_api_key,
     CLAUDE_MODEL,
     CLAUDE_MAX_TOKENS,
     CLAUDE_TEMPERATURE,
@@ -18,9 +18,11 @@ from config.settings import (
     CLAUDE_MAX_RETRIES,
     CLAUDE_RETRY_DELAY,
     EXPERT_SYSTEM_PROMPT,
-    SYNTHESIS_PROMPT_TEMPLATE,
+    render_synthesis_prompt,
     ENABLE_PROMPT_CACHING
 )
+from src.api_clients import get_anthropic_client
+from src.llm_queue import get_request_queue, PRIORITY_BATCH
 from utils.logger import get_logger
 from utils.exceptions import ClaudeAPIError, RateLimitError, AuthenticationError
 
@@ -36,23 +38,22 @@ class ComprehensiveAnalyzer:
     - Connected insights across papers
     """
 
-    def __init__(self, model_mode: str = None, local_model_name: str = None):
+    def __init__(self, model_mode: str = None, local_model_name: str = None, request_priority: int = PRIORITY_BATCH):
         """Initialize comprehensive analyzer
 
         Args:
             model_mode: "api" for Claude API, "grok" for xAI Grok, or "local" for local LLM (defaults to settings)
             local_model_name: Name of local model to use (only for local mode)
+            request_priority: Queue priority for this analyzer's LLM calls (see src.llm_queue)
         """
         try:
             self.model_mode = model_mode or MODEL_MODE
+            self.request_priority = request_priority
             logger.info(f"Initializing comprehensive analyzer in {self.model_mode} mode")
 
             if self.model_mode == "api":
                 # Initialize Claude API client
-                self.client = anthropic.Anthropic(
-                    api_key=ANTHROPIC_API_KEY,
-                    timeout=CLAUDE_REQUEST_TIMEOUT
-                )
+                self.client = get_anthropic_client(get_api_key("api"), CLAUDE_REQUEST_TIMEOUT)
                 self.model = CLAUDE_MODEL
                 self.local_handler = None
                 self.grok_handler = None
@@ -90,7 +91,22 @@ class ComprehensiveAnalyzer:
             logger.error(f"Failed to initialize analyzer: {str(e)}")
             raise ClaudeAPIError(f"Initialization failed: {str(e)}")
 
-    def _make_api_call(self, messages: List[Dict], system_prompt: str, max_tokens: int = CLAUDE_MAX_TOKENS, use_cache: bool = True) -> str:
+    def _make_api_call(self, messages: List[Dict], system_prompt: str, max_tokens: int = CLAUDE_MAX_TOKENS, use_cache: bool = ENABLE_PROMPT_CACHING) -> str:
+        """Make API call once a slot is free in the backend's shared request queue
+
+        Args:
+            messages: List of message dictionaries
+            system_prompt: System prompt text
+            max_tokens: Maximum tokens for response
+            use_cache: Whether to use prompt caching (default: ENABLE_PROMPT_CACHING)
+
+        Returns:
+            Response text from API
+        """
+        with get_request_queue(self.model_mode).slot(self.request_priority):
+            return self._call_model(messages, system_prompt, max_tokens, use_cache)
+
+    def _call_model(self, messages: List[Dict], system_prompt: str, max_tokens: int = CLAUDE_MAX_TOKENS, use_cache: bool = True) -> str:
         """Make API call (either Claude API or local LLM) with optional prompt caching
 
         Args:
@@ -215,6 +231,85 @@ class ComprehensiveAnalyzer:
         # Use caching based on global setting (enabled by default for cost savings)
         return self._make_api_call(messages, system_prompt, max_tokens, use_cache=ENABLE_PROMPT_CACHING)
 
+    def _stream_api_call(self, messages: List[Dict], system_prompt: str, max_tokens: int = CLAUDE_MAX_TOKENS) -> Iterator[str]:
+        """Stream a response, holding a request queue slot until the stream ends
+
+        Args:
+            messages: List of message dictionaries
+            system_prompt: System prompt text
+            max_tokens: Maximum tokens for response
+
+        Yields:
+            Response text chunks
+        """
+        with get_request_queue(self.model_mode).slot(self.request_priority):
+            yield from self._stream_model(messages, system_prompt, max_tokens)
+
+    def _stream_model(self, messages: List[Dict], system_prompt: str, max_tokens: int = CLAUDE_MAX_TOKENS) -> Iterator[str]:
+        """Stream a response (Claude API, Grok or local LLM) as text chunks
+
+        Streaming calls are not retried: once text has been yielded a retry
+        would repeat it.
+
+        Args:
+            messages: List of message dictionaries
+            system_prompt: System prompt text
+            max_tokens: Maximum tokens for response
+
+        Yields:
+            Response text chunks
+        """
+        if self.model_mode == "local":
+            yield from self.local_handler.stream_api_call(messages, system_prompt, max_tokens)
+            return
+
+        if self.model_mode == "grok":
+            from config.settings import GROK_MAX_TOKENS, GROK_TEMPERATURE
+            grok_messages = [{"role": "system", "content": system_prompt}] + messages
+            yield from self.grok_handler.stream_response(
+                messages=grok_messages,
+                max_tokens=min(max_tokens, GROK_MAX_TOKENS),
+                temperature=GROK_TEMPERATURE
+            )
+            return
+
+        if ENABLE_PROMPT_CACHING:
+            system_message = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        else:
+            system_message = system_prompt
+
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=CLAUDE_TEMPERATURE,
+                system=system_message,
+                messages=messages
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+
+                usage = stream.get_final_message().usage
+                logger.info(
+                    f"API usage - Input: {usage.input_tokens}, Output: {usage.output_tokens}, "
+                    f"Cache read: {getattr(usage, 'cache_read_input_tokens', 0)}"
+                )
+
+        except AnthropicRateLimitError:
+            raise RateLimitError("Rate limit exceeded")
+
+        except anthropic.AuthenticationError as e:
+            logger.error(f"Authentication error: {str(e)}")
+            raise AuthenticationError(f"Invalid API key: {str(e)}")
+
+        except (APIConnectionError, APIError) as e:
+            logger.error(f"Claude API streaming error: {str(e)}")
+            raise ClaudeAPIError(f"API error: {str(e)}")
+
     def create_comprehensive_summary(
         self,
         rag_system,
@@ -234,6 +329,38 @@ class ComprehensiveAnalyzer:
         Returns:
             Dictionary with comprehensive notes and metadata
         """
+        result = {}
+        for event in self.iter_comprehensive_summary(
+            rag_system, documents_data, focus_areas, report_mode
+        ):
+            if event['kind'] == 'summary':
+                result = event['data']
+        return result
+
+    def iter_comprehensive_summary(
+        self,
+        rag_system,
+        documents_data: List[Dict],
+        focus_areas: Optional[List[str]] = None,
+        report_mode: str = "quick"
+    ) -> Iterator[Dict]:
+        """
+        Streaming variant of create_comprehensive_summary
+
+        Yields events as work completes:
+        - {'kind': 'executive_summary', 'data': str}
+        - {'kind': 'section', 'data': section_dict} for each focus area
+        - {'kind': 'summary', 'data': result_dict} once at the end
+
+        Args:
+            rag_system: RAGSystem instance
+            documents_data: List of processed document data
+            focus_areas: Optional list of specific areas to focus on
+            report_mode: "quick" or "full" report type (images removed)
+
+        Yields:
+            Event dictionaries (see above)
+        """
         try:
             logger.info(f"Creating comprehensive research notes with deep synthesis")
 
@@ -250,6 +377,7 @@ class ComprehensiveAnalyzer:
 
             # Generate executive summary
             executive_summary = self._generate_executive_summary(documents_data)
+            yield {'kind': 'executive_summary', 'data': executive_summary}
 
             # Analyze each focus area with cross-document synthesis
             detailed_sections = []
@@ -272,12 +400,14 @@ class ComprehensiveAnalyzer:
                     len(documents_data)
                 )
 
-                detailed_sections.append({
+                section = {
                     'title': focus_area,
                     'content': synthesis,
                     'sources': metadata_list,
                     'images': []  # No images in notes format
-                })
+                }
+                detailed_sections.append(section)
+                yield {'kind': 'section', 'data': section}
 
             # Calculate statistics
             total_pages = sum(len(d.get('pages', [])) for d in documents_data)
@@ -292,7 +422,7 @@ class ComprehensiveAnalyzer:
             }
 
             logger.info(f"Comprehensive notes complete: {len(detailed_sections)} sections generated")
-            return result
+            yield {'kind': 'summary', 'data': result}
 
         except Exception as e:
             logger.error(f"Failed to create comprehensive notes: {str(e)}")
@@ -369,7 +499,7 @@ Make it informative, well-structured, and engaging. Connect the dots between pap
         """Synthesize comprehensive text-only analysis with detailed theoretical content"""
         try:
             # Prepare text prompt for detailed notes
-            text_prompt = SYNTHESIS_PROMPT_TEMPLATE.format(
+            text_prompt = render_synthesis_prompt(
                 topic=topic,
                 doc_count=doc_count,
                 retrieved_content=context
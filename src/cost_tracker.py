@@ -3,9 +3,10 @@ Cost Tracker
 Tracks and displays API costs for multi-agent research system
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
-import streamlit as st
+from pathlib import Path
+import json
 
 from utils.logger import get_logger
 
@@ -28,9 +29,36 @@ class CostTracker:
         "cache_read": 0.30
     }
 
-    def __init__(self):
-        """Initialize cost tracker"""
-        self.session_costs = []
+    def __init__(self, log_path: Optional[Path] = None):
+        """
+        Initialize cost tracker
+
+        Args:
+            log_path: Optional JSON Lines file that cost entries are appended to.
+                When set, entries live on disk instead of in memory.
+        """
+        self.log_path = Path(log_path) if log_path else None
+        self._session_costs = []
+
+    @property
+    def session_costs(self) -> List[Dict]:
+        """All logged cost entries (read from the log file when one is configured)"""
+        if not self.log_path:
+            return self._session_costs
+        if not self.log_path.exists():
+            return []
+
+        entries = []
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning("Skipping malformed cost log entry")
+        return entries
 
     def display_research_cost(self, result: Dict):
         """
@@ -39,6 +67,8 @@ class CostTracker:
         Args:
             result: Research result dictionary with cost information
         """
+        import streamlit as st
+
         total_cost = result.get("total_cost", 0.0)
         cost_breakdown = result.get("cost_breakdown", {})
         worker_count = result.get("worker_count", 0)
@@ -99,6 +129,8 @@ class CostTracker:
         Args:
             estimate: Cost estimate dictionary
         """
+        import streamlit as st
+
         st.info("💡 **Cost Estimate (before execution)**")
 
         col1, col2 = st.columns(2)
@@ -127,6 +159,7 @@ class CostTracker:
 
     def compare_architectures(self):
         """Display comparison between single-agent and multi-agent costs"""
+        import streamlit as st
 
         st.subheader("💰 Architecture Cost Comparison")
 
@@ -156,6 +189,8 @@ class CostTracker:
         Args:
             session_costs: List of cost dictionaries from session
         """
+        import streamlit as st
+
         if not session_costs:
             return
 
@@ -201,7 +236,15 @@ class CostTracker:
             "worker_count": cost_info.get("worker_count", 0)
         }
 
-        self.session_costs.append(log_entry)
+        if self.log_path:
+            try:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(log_entry) + "\n")
+            except OSError as e:
+                logger.warning(f"Failed to append cost log: {str(e)}")
+        else:
+            self._session_costs.append(log_entry)
 
         logger.info(
             f"💰 Cost logged: ${log_entry['total_cost']:.4f} "
@@ -3,13 +3,14 @@ Document Session Management
 Handles storage and retrieval of document analysis sessions
 """
 
-import json
 import shutil
 import re
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+import orjson
+
 from config.settings import DATA_DIR
 from utils.logger import get_logger
 from utils.exceptions import RAGSystemError
@@ -69,8 +70,8 @@ class DocumentSession:
     def _load_metadata(self) -> Dict:
         """Load session metadata"""
         if self.metadata_path.exists():
-            with open(self.metadata_path, 'r') as f:
-                return json.load(f)
+            with open(self.metadata_path, 'rb') as f:
+                return orjson.loads(f.read())
         return {
             "session_id": self.session_id,
             "session_name": self.session_name,
@@ -87,8 +88,8 @@ class DocumentSession:
     def _save_metadata(self):
         """Save session metadata"""
         self.metadata["updated_at"] = datetime.now().isoformat()
-        with open(self.metadata_path, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+        with open(self.metadata_path, 'wb') as f:
+            f.write(orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         logger.info(f"Saved metadata for session: {self.session_id}")
 
     def store_source_pdfs(self, pdf_paths: List[Path]) -> List[Path]:
@@ -147,6 +148,8 @@ class DocumentSession:
             # Update metadata
             self.metadata["has_summary"] = True
             self.metadata["summary_pdf_name"] = summary_pdf_path.name
+            self.metadata["summary_in_rag"] = False  # Set by record_summary_in_rag
+            self.metadata["summary_chunk_count"] = 0
             self._save_metadata()
 
             logger.info(f"Stored summary PDF: {summary_pdf_path.name}")
@@ -176,18 +179,19 @@ class DocumentSession:
             logger.error(f"Failed to store RAG system: {str(e)}")
             raise RAGSystemError(f"Failed to store RAG system: {str(e)}")
 
-    def load_rag_system(self, rag_system):
+    def load_rag_system(self, rag_system, mmap: bool = False):
         """
         Load RAG system vector store
 
         Args:
             rag_system: RAGSystem instance to load into
+            mmap: Memory-map the vector index (read-only use, e.g. chat)
         """
         try:
             if not self.metadata["has_rag_store"]:
                 raise RAGSystemError("No RAG store found for this session")
 
-            rag_system.load_vector_store(self.rag_dir)
+            rag_system.load_vector_store(self.rag_dir, mmap=mmap)
             logger.info(f"Loaded RAG system for session: {self.session_id}")
 
         except Exception as e:
@@ -217,6 +221,12 @@ class DocumentSession:
             logger.error(f"Failed to delete session: {str(e)}")
             raise RAGSystemError(f"Failed to delete session: {str(e)}")
 
+    def record_summary_in_rag(self, chunk_count: int):
+        """Record how many summary PDF chunks the stored RAG system holds"""
+        self.metadata["summary_in_rag"] = chunk_count > 0
+        self.metadata["summary_chunk_count"] = chunk_count
+        self._save_metadata()
+
     def update_statistics(self, total_pages: int, total_images: int):
         """Update session statistics"""
         self.metadata["total_pages"] = total_pages
@@ -241,9 +251,8 @@ class SessionManager:
             if session_dir.is_dir():
                 metadata_path = session_dir / "metadata.json"
                 if metadata_path.exists():
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                        sessions.append(metadata)
+                    with open(metadata_path, 'rb') as f:
+                        sessions.append(orjson.loads(f.read()))
 
         # Sort by updated_at (most recent first)
         sessions.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
@@ -264,8 +273,8 @@ class SessionManager:
         if session_dir.exists():
             metadata_path = session_dir / "metadata.json"
             if metadata_path.exists():
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
+                with open(metadata_path, 'rb') as f:
+                    metadata = orjson.loads(f.read())
                     return DocumentSession(
                         session_id=session_id,
                         session_name=metadata.get("session_name")
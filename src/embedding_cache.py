@@ -0,0 +1,148 @@
+"""
+Embedding Cache
+Wraps the sentence-transformer embedder so repeated queries and re-ingested
+chunks are not pushed through the model again
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from config.settings import (
+    EMBEDDING_VECTOR_CACHE_PATH,
+    QUERY_EMBEDDING_CACHE_SIZE
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain Embeddings wrapper with two caches
+
+    - Queries: in-memory LRU keyed on the stripped query text
+    - Documents: SQLite table keyed on (model name, sha1 of chunk text); only
+      uncached chunks are sent to the model, in one embed_documents call
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        model_name: str,
+        cache_path: Optional[Path] = EMBEDDING_VECTOR_CACHE_PATH,
+        query_cache_size: int = QUERY_EMBEDDING_CACHE_SIZE
+    ):
+        """
+        Initialize embedding cache
+
+        Args:
+            base: Underlying embedder (e.g. HuggingFaceEmbeddings)
+            model_name: Embedding model name (part of the document cache key)
+            cache_path: SQLite file for document embeddings (None disables the disk tier)
+            query_cache_size: Maximum number of query embeddings kept in memory
+        """
+        self.base = base
+        self.model_name = model_name
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.query_cache_size = query_cache_size
+
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, reusing the embedding of an identical recent query"""
+        key = text.strip()
+
+        with self._lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return cached
+
+        embedding = self.base.embed_query(text)
+
+        with self._lock:
+            self._query_cache[key] = embedding
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+        return embedding
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed chunks, encoding only the ones not already in the disk cache"""
+        if not texts or not self.cache_path:
+            return self.base.embed_documents(texts)
+
+        keys = [self._document_key(text) for text in texts]
+
+        try:
+            cached = self._read_vectors(set(keys))
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache unreadable, encoding all chunks: {str(e)}")
+            return self.base.embed_documents(texts)
+
+        # Embed each distinct uncached text once, in a single batched call
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            new_vectors = self.base.embed_documents(list(missing.values()))
+            fresh = dict(zip(missing.keys(), new_vectors))
+            cached.update(fresh)
+            try:
+                self._write_vectors(fresh)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to update embedding cache: {str(e)}")
+
+        logger.info(
+            f"Embedded {len(texts)} chunks ({len(texts) - len(missing)} from cache, "
+            f"{len(missing)} encoded)"
+        )
+        return [cached[key] for key in keys]
+
+    def _document_key(self, text: str) -> str:
+        return hashlib.sha1(f"{self.model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+        return self._conn
+
+    def _read_vectors(self, keys: set) -> dict:
+        vectors = {}
+        key_list = list(keys)
+        with self._lock:
+            conn = self._connection()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(key_list), 500):
+                batch = key_list[start:start + 500]
+                # Only "?" placeholders are interpolated; the keys themselves are bound
+                query = f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})"
+                rows = conn.execute(query, batch)
+                for key, blob in rows:
+                    vectors[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return vectors
+
+    def _write_vectors(self, vectors: dict):
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in vectors.items()
+        ]
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            conn.commit()
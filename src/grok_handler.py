@@ -3,11 +3,12 @@ Grok API Handler - xAI Grok 4 Fast Integration
 Handles communication with xAI's Grok 4 Fast reasoning models
 """
 
+import json
 import time
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 from config.settings import (
-    GROK_API_KEY,
+    get_api_key,
     GROK_MODEL,
     GROK_MAX_TOKENS,
     GROK_TEMPERATURE,
@@ -30,7 +31,7 @@ class GrokHandler:
         Args:
             api_key: xAI API key (defaults to settings)
         """
-        self.api_key = api_key or GROK_API_KEY
+        self.api_key = api_key or get_api_key("grok")
         self.base_url = "https://api.x.ai/v1"
         self.headers = {
             "Content-Type": "application/json",
@@ -141,6 +142,84 @@ class GrokHandler:
 
         raise ClaudeAPIError("Max retries exceeded")
 
+    def stream_response(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = GROK_MAX_TOKENS,
+        temperature: float = GROK_TEMPERATURE,
+        model: str = GROK_MODEL
+    ) -> Iterator[str]:
+        """Stream a Grok API response as text deltas
+
+        Unlike generate_response this does not retry, since part of the
+        answer may already have been shown to the user.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 to 1.0)
+            model: Grok model to use
+
+        Yields:
+            Generated text deltas
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limit is exceeded
+            ClaudeAPIError: For other API errors
+        """
+        endpoint = f"{self.base_url}/chat/completions"
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
+        }
+
+        try:
+            logger.info("Streaming request to Grok API")
+
+            with requests.post(
+                endpoint,
+                headers=self.headers,
+                json=payload,
+                timeout=GROK_REQUEST_TIMEOUT,
+                stream=True
+            ) as response:
+                if response.status_code == 401:
+                    raise AuthenticationError("Invalid xAI API key")
+                elif response.status_code == 429:
+                    raise RateLimitError("Grok API rate limit exceeded")
+                elif response.status_code != 200:
+                    raise ClaudeAPIError(f"Grok API error {response.status_code}")
+
+                # Server-sent events: "data: {...}" lines, terminated by "data: [DONE]"
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    delta = json.loads(data)['choices'][0].get('delta', {})
+                    if delta.get('content'):
+                        yield delta['content']
+
+        except (AuthenticationError, RateLimitError, ClaudeAPIError):
+            raise
+
+        except requests.exceptions.Timeout:
+            raise ClaudeAPIError("Grok API request timeout")
+
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Connection error: {str(e)}")
+            raise ClaudeAPIError(f"Failed to connect to Grok API: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            raise ClaudeAPIError(f"Grok API error: {str(e)}")
+
     def analyze_with_grok(
         self,
         system_prompt: str,
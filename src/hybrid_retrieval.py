@@ -45,6 +45,7 @@ class HybridRetriever:
         self.cross_encoder = None
         self.bm25 = None
         self.corpus_texts = []
+        self.tokenized_corpus = []
         self.bm25_weight = 0.5
         self.vector_weight = 0.5
         self.model_loaded = False
@@ -161,6 +162,7 @@ class HybridRetriever:
             # Build BM25 index
             self.bm25 = BM25Okapi(tokenized_corpus)
             self.corpus_texts = validated_texts
+            self.tokenized_corpus = tokenized_corpus
 
             logger.info("✓ BM25 index built successfully")
 
@@ -172,6 +174,41 @@ class HybridRetriever:
             logger.error(f"❌ Failed to build BM25 index: {str(e)}")
             self.bm25 = None
 
+    def extend_bm25_index(self, texts: List[str]):
+        """
+        Add texts to an existing BM25 index, tokenizing only the new texts
+
+        BM25 statistics (IDF, average length) span the whole corpus, so the
+        index object is recreated, but from the cached token lists.
+
+        Args:
+            texts: List of new document texts
+        """
+        if self.bm25 is None:
+            self.build_bm25_index(texts)
+            return
+
+        try:
+            new_texts = [self._validate_and_truncate_text(text) for text in texts]
+            new_texts = [text for text in new_texts if text]
+            if not new_texts:
+                return
+
+            logger.info(f"Adding {len(new_texts)} documents to BM25 index ({len(self.corpus_texts)} existing)")
+
+            tokenized_corpus = self.tokenized_corpus + [self._tokenize(text) for text in new_texts]
+            self.bm25 = BM25Okapi(tokenized_corpus)
+            self.corpus_texts = self.corpus_texts + new_texts
+            self.tokenized_corpus = tokenized_corpus
+
+            logger.info("✓ BM25 index extended successfully")
+
+        except MemoryError:
+            logger.error("❌ MemoryError extending BM25 index - corpus too large")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to extend BM25 index: {str(e)}")
+
     def _tokenize(self, text: str) -> List[str]:
         """
         Tokenize text for BM25 indexing
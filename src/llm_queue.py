@@ -0,0 +1,100 @@
+"""
+LLM Request Queue
+Admission control for concurrent LLM calls so interactive chat is not stuck
+behind long-running report generation
+"""
+
+import heapq
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from config.settings import (
+    LOCAL_MAX_CONCURRENT_REQUESTS,
+    API_MAX_CONCURRENT_REQUESTS
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Lower value is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+
+class LLMRequestQueue:
+    """
+    Priority-ordered concurrency limiter shared by all callers of one backend
+
+    Up to max_concurrent requests run at once; the rest wait and are
+    admitted highest priority first, FIFO within a priority.
+    """
+
+    def __init__(self, max_concurrent: int):
+        """
+        Initialize request queue
+
+        Args:
+            max_concurrent: Maximum number of requests in flight at once
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = []
+        self._sequence = itertools.count()
+
+    @contextmanager
+    def slot(self, priority: int = PRIORITY_BATCH) -> Iterator[None]:
+        """Hold one request slot for the duration of the with-block"""
+        ticket = (priority, next(self._sequence))
+
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            while self._waiting[0] != ticket or self._active >= self.max_concurrent:
+                self._cond.wait()
+            heapq.heappop(self._waiting)
+            self._active += 1
+            # The next waiter may fit as well
+            self._cond.notify_all()
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot"""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for a slot"""
+        return len(self._waiting)
+
+
+_queues: Dict[str, LLMRequestQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_request_queue(model_mode: str) -> LLMRequestQueue:
+    """
+    Get the process-wide request queue for a model backend
+
+    Args:
+        model_mode: "api", "grok" or "local"
+
+    Returns:
+        Shared LLMRequestQueue for that backend
+    """
+    with _queues_lock:
+        queue = _queues.get(model_mode)
+        if queue is None:
+            limit = LOCAL_MAX_CONCURRENT_REQUESTS if model_mode == "local" else API_MAX_CONCURRENT_REQUESTS
+            queue = LLMRequestQueue(limit)
+            _queues[model_mode] = queue
+            logger.info(f"LLM request queue for {model_mode} mode: {limit} concurrent requests")
+        return queue
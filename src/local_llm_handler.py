@@ -3,9 +3,11 @@ Local LLM Handler
 Handles communication with local LLM models (Ollama, LlamaCpp, etc.)
 """
 
+import json
+import re
 import requests
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
 from pathlib import Path
 
 from config.settings import (
@@ -53,6 +55,51 @@ def get_available_models(model_url: str = LOCAL_MODEL_URL) -> List[Dict]:
         return []
 
 
+# Reasoning model tags (e.g., <think> from deepseek-r1)
+_REASONING_TAG = re.compile(r'<(/?)(think|thinking)>')
+_REASONING_CLOSE_TAG = re.compile(r'</(think|thinking)>')
+_MAX_TAG_LENGTH = len("</thinking>")
+
+
+def _strip_reasoning_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Drop <think>/<thinking> blocks from a stream of text chunks
+
+    Tags may be split across chunks, so a trailing partial tag is held back
+    until the next chunk arrives.
+    """
+    buffer = ""
+    in_reasoning = False
+
+    for chunk in chunks:
+        buffer += chunk
+
+        while True:
+            pattern = _REASONING_CLOSE_TAG if in_reasoning else _REASONING_TAG
+            match = pattern.search(buffer)
+
+            if match:
+                if not in_reasoning and match.start():
+                    yield buffer[:match.start()]
+                # An orphaned closing tag is simply dropped
+                if in_reasoning or not match.group(1):
+                    in_reasoning = not in_reasoning
+                buffer = buffer[match.end():]
+                continue
+
+            # Keep a possible partial tag at the end of the buffer
+            cut = buffer.rfind("<")
+            if cut == -1 or ">" in buffer[cut:] or len(buffer) - cut >= _MAX_TAG_LENGTH:
+                cut = len(buffer)
+            if not in_reasoning and cut:
+                yield buffer[:cut]
+            buffer = buffer[cut:]
+            break
+
+    if buffer and not in_reasoning:
+        yield buffer
+
+
 class LocalLLMHandler:
     """
     Handler for local LLM models
@@ -201,6 +248,90 @@ class LocalLLMHandler:
             logger.error(f"Unexpected error in local LLM call: {str(e)}")
             raise ClaudeAPIError(f"Unexpected error: {str(e)}")
 
+    def stream_api_call(
+        self,
+        messages: List[Dict],
+        system_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a local LLM response as text chunks
+
+        Args:
+            messages: List of message dictionaries
+            system_prompt: System prompt for the model
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text chunks (reasoning blocks removed)
+        """
+        yield from _strip_reasoning_stream(
+            self._iter_stream_chunks(messages, system_prompt, max_tokens)
+        )
+
+    def _iter_stream_chunks(
+        self,
+        messages: List[Dict],
+        system_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Raw text chunks from Ollama's streaming generate endpoint"""
+        try:
+            max_tokens = max_tokens or self.max_tokens
+
+            payload = {
+                "model": self.model_name,
+                "prompt": self._format_prompt(messages, system_prompt),
+                "stream": True,
+                "options": {
+                    "temperature": self.temperature,
+                    "num_predict": max_tokens
+                }
+            }
+
+            logger.debug(f"Streaming local LLM API call to {self.model_name}")
+
+            with requests.post(
+                f"{self.model_url}/api/generate",
+                json=payload,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = f"Local LLM API returned status {response.status_code}"
+                    logger.error(error_msg)
+                    raise ClaudeAPIError(error_msg)
+
+                # Ollama streams one JSON object per line
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get('response'):
+                        yield data['response']
+                    if data.get('done'):
+                        if 'eval_count' in data:
+                            logger.info(f"Local LLM tokens generated: {data['eval_count']}")
+                        break
+
+        except ClaudeAPIError:
+            raise
+
+        except requests.exceptions.Timeout:
+            logger.error("Local LLM request timed out")
+            raise ClaudeAPIError(
+                f"Local LLM request timed out after {self.timeout} seconds. "
+                "Try a shorter prompt or increase timeout."
+            )
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Local LLM request failed: {str(e)}")
+            raise ClaudeAPIError(f"Local LLM request failed: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Unexpected error in local LLM stream: {str(e)}")
+            raise ClaudeAPIError(f"Unexpected error: {str(e)}")
+
     def _format_prompt(self, messages: List[Dict], system_prompt: str) -> str:
         """
         Format messages into a single prompt for local LLM
@@ -11,13 +11,14 @@ from anthropic import APIError, APIConnectionError, RateLimitError as AnthropicR
 import tiktoken
 
 from config.settings import (
-    ANTHROPIC_API_KEY,
     CLAUDE_TEMPERATURE,
     CLAUDE_REQUEST_TIMEOUT,
     CLAUDE_MAX_RETRIES,
     CLAUDE_RETRY_DELAY,
-    ENABLE_PROMPT_CACHING
+    ENABLE_PROMPT_CACHING,
+    get_api_key
 )
+from src.api_clients import get_anthropic_client
 from utils.logger import get_logger
 from utils.exceptions import ClaudeAPIError, RateLimitError, AuthenticationError
 
@@ -61,10 +62,7 @@ class ModelRouter:
     def __init__(self):
         """Initialize model router with Anthropic client and token counter"""
         try:
-            self.client = anthropic.Anthropic(
-                api_key=ANTHROPIC_API_KEY,
-                timeout=CLAUDE_REQUEST_TIMEOUT
-            )
+            self.client = get_anthropic_client(get_api_key("api"), CLAUDE_REQUEST_TIMEOUT)
 
             # Initialize tokenizer for token counting
             try:
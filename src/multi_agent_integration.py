@@ -4,7 +4,7 @@ Helper module to integrate multi-agent research system with existing application
 """
 
 import asyncio
-from typing import Dict, List
+from typing import Dict, List, Iterator, AsyncIterator
 from pathlib import Path
 
 from src.multi_agent_system import MultiAgentOrchestrator
@@ -33,6 +33,37 @@ async def run_multi_agent_research(
     Returns:
         Dictionary with comprehensive research results and cost info
     """
+    result = {}
+    async for event in iter_multi_agent_research(
+        orchestrator, rag_system, documents_data, focus_areas
+    ):
+        if event['kind'] == 'summary':
+            result = event['data']
+    return result
+
+
+async def iter_multi_agent_research(
+    orchestrator: MultiAgentOrchestrator,
+    rag_system,
+    documents_data: List[Dict],
+    focus_areas: List[str] = None
+) -> AsyncIterator[Dict]:
+    """
+    Streaming variant of run_multi_agent_research
+
+    Yields a {'kind': 'section'} event as each focus area completes, then
+    {'kind': 'executive_summary'} and a final {'kind': 'summary'} event
+    carrying the same dictionary run_multi_agent_research returns.
+
+    Args:
+        orchestrator: MultiAgentOrchestrator instance
+        rag_system: RAG system for context retrieval
+        documents_data: Processed document data
+        focus_areas: List of research focus areas
+
+    Yields:
+        Event dictionaries with 'kind' and 'data' keys
+    """
     logger.info("🚀 Starting multi-agent research...")
 
     # Default focus areas if none provided
@@ -60,18 +91,20 @@ async def run_multi_agent_research(
         )
 
         # Store section
-        all_sections.append({
+        section = {
             'title': focus_area,
             'content': result['synthesis'],
             'sources': result['sources'],
             'images': []  # No images in multi-agent mode
-        })
+        }
+        all_sections.append(section)
 
         # Track costs
         total_cost += result['total_cost']
         cost_breakdowns.append(result['cost_breakdown'])
 
         logger.info(f"✅ Research {i} complete - Cost: ${result['total_cost']:.4f}")
+        yield {'kind': 'section', 'data': section}
 
     # Generate executive summary
     logger.info("\n📝 Generating executive summary...")
@@ -79,11 +112,12 @@ async def run_multi_agent_research(
         orchestrator,
         documents_data
     )
+    yield {'kind': 'executive_summary', 'data': exec_summary}
 
     # Calculate statistics
     total_pages = sum(len(d.get('pages', [])) for d in documents_data)
 
-    return {
+    yield {'kind': 'summary', 'data': {
         'executive_summary': exec_summary,
         'detailed_sections': all_sections,
         'doc_count': len(documents_data),
@@ -98,7 +132,7 @@ async def run_multi_agent_research(
         },
         'worker_count': NUM_WORKER_AGENTS,
         'total_tokens': 0  # Calculated separately if needed
-    }
+    }}
 
 
 def _generate_executive_summary_multi_agent(
@@ -247,3 +281,60 @@ def create_comprehensive_summary_with_routing(
         )
 
         return summary_data
+
+
+def create_comprehensive_summary_with_routing_stream(
+    model_mode: str,
+    comprehensive_analyzer: ComprehensiveAnalyzer,
+    multi_agent_orchestrator: MultiAgentOrchestrator,
+    rag_system,
+    documents_data: List[Dict],
+    focus_areas: List[str] = None,
+    report_mode: str = "quick"
+) -> Iterator[Dict]:
+    """
+    Streaming variant of create_comprehensive_summary_with_routing
+
+    Yields {'kind': 'section' | 'executive_summary', 'data': ...} events as
+    they complete, followed by a final {'kind': 'summary', 'data': summary_data}
+    event with the same dictionary the blocking version returns.
+
+    Args:
+        Same as create_comprehensive_summary_with_routing
+
+    Yields:
+        Event dictionaries with 'kind' and 'data' keys
+    """
+    use_multi_agent = should_use_multi_agent(model_mode)
+
+    if use_multi_agent and multi_agent_orchestrator:
+        logger.info("🚀 Using Multi-Agent Research System (Opus + Sonnet) [streaming]")
+
+        # Drive the async generator one step at a time so each section is
+        # handed back to the (synchronous) caller as soon as it completes
+        loop = asyncio.new_event_loop()
+        events = iter_multi_agent_research(
+            orchestrator=multi_agent_orchestrator,
+            rag_system=rag_system,
+            documents_data=documents_data,
+            focus_areas=focus_areas
+        )
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(events.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(events.aclose())
+            loop.close()
+
+    else:
+        logger.info("⚡ Using Single-Agent Research System (Sonnet) [streaming]")
+
+        yield from comprehensive_analyzer.iter_comprehensive_summary(
+            rag_system=rag_system,
+            documents_data=documents_data,
+            focus_areas=focus_areas,
+            report_mode=report_mode
+        )
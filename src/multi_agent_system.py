@@ -8,12 +8,12 @@ import json
 from typing import List, Dict, Optional
 from datetime import datetime
 from dataclasses import dataclass
-import anthropic
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from src.api_clients import get_anthropic_client
 from src.model_router import ModelRouter
 from src.web_search import WebSearchManager
-from config.settings import ANTHROPIC_API_KEY
+from config.settings import get_api_key
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -112,7 +112,10 @@ You are using Claude Opus 4 for your superior synthesis capabilities."""
     def __init__(self, router: ModelRouter):
         """Initialize Lead Agent with model router"""
         self.router = router
-        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
+        try:
+            self.client = get_anthropic_client(get_api_key("api"))
+        except ValueError:
+            self.client = None
         logger.info("🧠 Lead Agent initialized (Claude Opus 4)")
 
     def plan_research(self, query: str, available_workers: int = 4) -> ResearchPlan:
@@ -353,7 +356,7 @@ Focus on depth and clarity."""
         else:
             # Create client for execute_task compatibility
             try:
-                self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
+                self.client = get_anthropic_client(get_api_key("api"))
             except:
                 self.client = None
 
@@ -380,8 +383,12 @@ Focus on depth and clarity."""
         """
         logger.info(f"⚡ Worker Agent {self.agent_id} executing: {subtask.focus}")
 
+        # Retrieval, web search and the LLM call are blocking; run them in worker
+        # threads so research() actually overlaps the subtasks it gathers
+
         # Step 1: Retrieve relevant context from PDFs (RAG system)
-        pdf_context, pdf_metadata = rag_system.get_relevant_context(
+        pdf_context, pdf_metadata = await asyncio.to_thread(
+            rag_system.get_relevant_context,
             subtask.query,
             max_chunks=10  # Increased from 5 for better coverage
         )
@@ -393,7 +400,8 @@ Focus on depth and clarity."""
         if self.web_search_manager and self.web_search_manager.enabled:
             try:
                 logger.debug(f"   🌐 Worker {self.agent_id}: Searching web for '{subtask.query[:50]}...'")
-                web_results = self.web_search_manager.search(
+                web_results = await asyncio.to_thread(
+                    self.web_search_manager.search,
                     query=subtask.query,
                     max_results=5  # Limit web results per subtask
                 )
@@ -478,7 +486,8 @@ Make it detailed and insightful. Explain WHY things work, not just WHAT. Synthes
         messages = [{"role": "user", "content": execution_prompt}]
 
         # Use Sonnet for execution (5× cheaper than Opus)
-        result = self.router.route_task(
+        result = await asyncio.to_thread(
+            self.router.route_task,
             task_type="execution",
             messages=messages,
             system_prompt=self.EXECUTION_SYSTEM_PROMPT,
@@ -5,15 +5,21 @@ Handles PDF parsing, text extraction, and image extraction
 
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import pickle
 from PIL import Image
 import io
 import re
 
-from config.settings import TEMP_DIR, IMAGE_DPI
+from config.settings import TEMP_DIR, IMAGE_DPI, ENABLE_PDF_CACHE, PDF_CACHE_DIR, PDF_CACHE_MAX_ENTRIES
 from utils.logger import get_logger
 from utils.exceptions import PDFProcessingError, ImageExtractionError
 from utils.image_utils import save_image, optimize_image
+from utils.file_utils import get_file_hash
 
 logger = get_logger(__name__)
 
@@ -246,6 +252,57 @@ class PDFProcessor:
             logger.debug(f"Failed to detect section header: {str(e)}")
             return None
 
+    def iter_pages(self, extract_images: bool = True) -> Iterator[Dict]:
+        """
+        Extract the document one page at a time
+
+        A page that fails is yielded as an empty page with an "error" entry.
+
+        Args:
+            extract_images: Whether to extract images
+
+        Yields:
+            Dictionary with one page's extracted data
+        """
+        for page_num in range(len(self.doc)):
+            try:
+                # Extract text
+                text_data = self.extract_text_from_page(page_num)
+
+                # Detect section
+                section_name = self.detect_section_headers(text_data)
+
+                # Extract images
+                images = []
+                if extract_images:
+                    images = self.extract_images_from_page(page_num, save_to_disk=True)
+
+                page_data = {
+                    "page_num": page_num + 1,
+                    "text": text_data["plain_text"],
+                    "structured_text": text_data["structured_text"],
+                    "section": section_name,
+                    "images": images,
+                    "image_count": len(images)
+                }
+
+                logger.debug(f"Processed page {page_num + 1}/{len(self.doc)}")
+
+            except Exception as e:
+                logger.error(f"Error processing page {page_num + 1}: {str(e)}")
+                # Continue with other pages
+                page_data = {
+                    "page_num": page_num + 1,
+                    "text": "",
+                    "structured_text": [],
+                    "section": None,
+                    "images": [],
+                    "image_count": 0,
+                    "error": str(e)
+                }
+
+            yield page_data
+
     def process_document(self, extract_images: bool = True) -> Dict:
         """
         Process entire PDF document
@@ -260,50 +317,12 @@ class PDFProcessor:
             logger.info(f"Processing PDF: {self.doc_name}")
 
             metadata = self.get_metadata()
-            pages_data = []
-
-            for page_num in range(len(self.doc)):
-                try:
-                    # Extract text
-                    text_data = self.extract_text_from_page(page_num)
-
-                    # Detect section
-                    section_name = self.detect_section_headers(text_data)
-
-                    # Extract images
-                    images = []
-                    if extract_images:
-                        images = self.extract_images_from_page(page_num, save_to_disk=True)
-
-                    page_data = {
-                        "page_num": page_num + 1,
-                        "text": text_data["plain_text"],
-                        "structured_text": text_data["structured_text"],
-                        "section": section_name,
-                        "images": images,
-                        "image_count": len(images)
-                    }
-
-                    pages_data.append(page_data)
-
-                    logger.debug(f"Processed page {page_num + 1}/{len(self.doc)}")
-
-                except Exception as e:
-                    logger.error(f"Error processing page {page_num + 1}: {str(e)}")
-                    # Continue with other pages
-                    pages_data.append({
-                        "page_num": page_num + 1,
-                        "text": "",
-                        "structured_text": [],
-                        "section": None,
-                        "images": [],
-                        "image_count": 0,
-                        "error": str(e)
-                    })
+            pages_data = list(self.iter_pages(extract_images=extract_images))
 
             result = {
                 "doc_name": self.doc_name,
                 "doc_path": str(self.pdf_path),
+                "content_hash": get_file_hash(self.pdf_path),
                 "metadata": metadata,
                 "pages": pages_data,
                 "total_pages": len(pages_data),
@@ -335,34 +354,193 @@ def process_pdf_file(pdf_path: Path, extract_images: bool = True) -> Dict:
         return processor.process_document(extract_images=extract_images)
 
 
-def process_multiple_pdfs(pdf_paths: List[Path], extract_images: bool = True) -> List[Dict]:
+def _process_one_pdf(pdf_path: Path, extract_images: bool = True) -> Dict:
+    """
+    Process a single PDF, returning an error entry instead of raising
+
+    Module-level so it can be dispatched to worker processes.
+    """
+    try:
+        return process_pdf_file(pdf_path, extract_images=extract_images)
+
+    except Exception as e:
+        logger.error(f"Failed to process {pdf_path.name}: {str(e)}")
+        # Add error entry
+        return {
+            "doc_name": pdf_path.stem,
+            "doc_path": str(pdf_path),
+            "error": str(e),
+            "pages": [],
+            "total_pages": 0,
+            "total_images": 0
+        }
+
+
+def _extraction_cache_path(content_hash: str, extract_images: bool) -> Path:
+    suffix = "img" if extract_images else "text"
+    return PDF_CACHE_DIR / f"{content_hash}_{suffix}.pkl"
+
+
+def _load_cached_extraction(pdf_path: Path, extract_images: bool) -> Optional[Dict]:
+    """
+    Load a previous extraction of identical PDF content, if still valid
+
+    The cached entry is re-labelled with the current file's name and path;
+    it is ignored if any extracted image file has since been cleaned up.
+    """
+    try:
+        content_hash = get_file_hash(pdf_path)
+        cache_path = _extraction_cache_path(content_hash, extract_images)
+        if not cache_path.exists():
+            return None
+
+        with open(cache_path, 'rb') as f:
+            result = pickle.load(f)
+
+        for page in result.get("pages", []):
+            for image in page.get("images", []):
+                image_path = image.get("image_path")
+                if image_path and not Path(image_path).exists():
+                    return None
+
+        result["doc_name"] = pdf_path.stem
+        result["doc_path"] = str(pdf_path)
+        logger.info(f"Reusing cached extraction for {pdf_path.name}")
+        return result
+
+    except Exception as e:
+        logger.debug(f"Extraction cache miss for {pdf_path.name}: {str(e)}")
+        return None
+
+
+def _store_cached_extraction(result: Dict, extract_images: bool):
+    """Persist a successful extraction keyed by its content hash"""
+    content_hash = result.get("content_hash")
+    if not content_hash or result.get("error"):
+        return
+
+    try:
+        PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_extraction_cache_path(content_hash, extract_images), 'wb') as f:
+            pickle.dump(result, f)
+
+        # Bound the cache: drop least recently written entries
+        entries = sorted(PDF_CACHE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:max(0, len(entries) - PDF_CACHE_MAX_ENTRIES)]:
+            stale.unlink(missing_ok=True)
+
+    except Exception as e:
+        logger.warning(f"Failed to cache extraction for {result.get('doc_name')}: {str(e)}")
+
+
+def process_multiple_pdfs(
+    pdf_paths: List[Path],
+    extract_images: bool = True,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> List[Dict]:
     """
     Process multiple PDF files
 
+    PDFs whose content was already extracted are loaded from the on-disk
+    extraction cache; the rest are extracted in parallel worker processes
+    when more than one remains. Results are returned in the same order as
+    pdf_paths.
+
     Args:
         pdf_paths: List of PDF file paths
         extract_images: Whether to extract images
+        max_workers: Maximum worker processes (default: min(len(pdf_paths), CPU count))
+        progress_callback: Optional callable(done, total) invoked as each PDF finishes
 
     Returns:
         List of dictionaries with extracted data
     """
-    results = []
-
-    for pdf_path in pdf_paths:
+    pdf_paths = [Path(p) for p in pdf_paths]
+    total = len(pdf_paths)
+    results: List[Optional[Dict]] = [None] * total
+    done = 0
+
+    # Re-uploaded PDFs (same content) skip extraction entirely
+    if ENABLE_PDF_CACHE:
+        for index, pdf_path in enumerate(pdf_paths):
+            results[index] = _load_cached_extraction(pdf_path, extract_images)
+            if results[index] is not None:
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    workers = max_workers or min(len(pending), os.cpu_count() or 1)
+
+    if len(pending) > 1 and workers > 1:
         try:
-            result = process_pdf_file(pdf_path, extract_images=extract_images)
-            results.append(result)
+            # Spawn (not fork) so workers don't inherit locks held by the server's threads
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = {
+                    executor.submit(_process_one_pdf, pdf_paths[index], extract_images): index
+                    for index in pending
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Parallel PDF processing unavailable ({str(e)}), falling back to sequential")
+
+    for index in pending:
+        if results[index] is None:
+            results[index] = _process_one_pdf(pdf_paths[index], extract_images)
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+    if ENABLE_PDF_CACHE:
+        for index in pending:
+            _store_cached_extraction(results[index], extract_images)
 
+    return results
+
+
+def process_pdfs_iter(
+    pdf_paths: List[Path],
+    extract_images: bool = True
+) -> Iterator[Tuple[Dict, Dict]]:
+    """
+    Process PDF files one page at a time
+
+    Unlike process_multiple_pdfs, no document is held in memory as a whole:
+    each page is yielded as soon as it is extracted, so a consumer that
+    drops pages after use keeps peak memory at one page. A cached extraction
+    of identical content is replayed page by page instead. PDFs that cannot
+    be opened are logged and skipped.
+
+    Args:
+        pdf_paths: List of PDF file paths
+        extract_images: Whether to extract images
+
+    Yields:
+        Tuples of (document info with "doc_name" and "doc_path", page data)
+    """
+    for pdf_path in (Path(p) for p in pdf_paths):
+        doc_info = {"doc_name": pdf_path.stem, "doc_path": str(pdf_path)}
+
+        cached = _load_cached_extraction(pdf_path, extract_images) if ENABLE_PDF_CACHE else None
+        if cached is not None:
+            for page_data in cached.get("pages", []):
+                yield doc_info, page_data
+            continue
+
+        try:
+            processor = PDFProcessor(pdf_path)
         except Exception as e:
             logger.error(f"Failed to process {pdf_path.name}: {str(e)}")
-            # Add error entry
-            results.append({
-                "doc_name": pdf_path.stem,
-                "doc_path": str(pdf_path),
-                "error": str(e),
-                "pages": [],
-                "total_pages": 0,
-                "total_images": 0
-            })
+            continue
 
-    return results
+        with processor:
+            logger.info(f"Streaming PDF: {processor.doc_name}")
+            for page_data in processor.iter_pages(extract_images=extract_images):
+                yield doc_info, page_data
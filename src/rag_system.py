@@ -3,11 +3,15 @@ RAG (Retrieval-Augmented Generation) System
 Handles document chunking, embedding, and semantic search
 """
 
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Optional, Tuple
+import mmap
 import pickle
 import json
 
+import orjson
+
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
@@ -18,7 +22,13 @@ from config.settings import (
     CHUNK_OVERLAP,
     EMBEDDING_MODEL,
     EMBEDDING_CACHE_FOLDER,
+    EMBEDDING_BATCH_SIZE,
+    ENABLE_EMBEDDING_CACHE,
     TOP_K_RETRIEVAL,
+    IVF_MIN_VECTORS,
+    IVF_MAX_LISTS,
+    IVF_NPROBE,
+    VECTOR_STORE_FP16,
     SIMILARITY_THRESHOLD,
     BASE_DIR
 )
@@ -29,18 +39,61 @@ from src.hybrid_retrieval import HybridRetriever
 logger = get_logger(__name__)
 
 
+def create_embeddings():
+    """
+    Load the sentence-transformer embedding model (wrapped in the embedding cache
+    when enabled)
+
+    Loading takes seconds and several hundred MB, so long-lived callers should
+    build this once and pass it to every RAGSystem they create.
+
+    Returns:
+        LangChain Embeddings instance
+
+    Raises:
+        EmbeddingError: If the model cannot be loaded
+    """
+    try:
+        logger.info(f"Loading embedding model: {EMBEDDING_MODEL}")
+        EMBEDDING_CACHE_FOLDER.mkdir(parents=True, exist_ok=True)  # Ensure cache directory exists
+        embeddings = HuggingFaceEmbeddings(
+            model_name=EMBEDDING_MODEL,
+            cache_folder=str(EMBEDDING_CACHE_FOLDER),  # Cache models for faster loading
+            model_kwargs={'device': 'cpu'},
+            encode_kwargs={'normalize_embeddings': True, 'batch_size': EMBEDDING_BATCH_SIZE}
+        )
+        logger.info("✓ Embedding model loaded (cached for faster subsequent loads)")
+    except Exception as e:
+        logger.error(f"Failed to load embedding model: {str(e)}")
+        raise EmbeddingError(f"Failed to load embedding model: {str(e)}")
+
+    # Reuse embeddings of repeated queries and previously seen chunks
+    if ENABLE_EMBEDDING_CACHE:
+        from src.embedding_cache import CachedEmbeddings
+        embeddings = CachedEmbeddings(embeddings, model_name=EMBEDDING_MODEL)
+
+    return embeddings
+
+
 class RAGSystem:
     """
     Retrieval-Augmented Generation system for document analysis
     """
 
-    def __init__(self):
-        """Initialize RAG system"""
-        self.embeddings = None
+    def __init__(self, embeddings=None):
+        """
+        Initialize RAG system
+
+        Args:
+            embeddings: Optional shared embeddings from create_embeddings();
+                a new model is loaded when omitted
+        """
+        self.embeddings = embeddings
         self.vector_store = None
         self.text_splitter = None
         self.documents = []
         self.chunks_metadata = []
+        self.doc_name_index: Dict[str, List[int]] = defaultdict(list)  # doc_name -> chunk positions
         self.hybrid_retriever = None  # Hybrid retrieval with BM25 + Vector + Reranking
 
         self._initialize_components()
@@ -50,16 +103,8 @@ class RAGSystem:
         try:
             logger.info("Initializing RAG system components...")
 
-            # Initialize embeddings with caching for faster subsequent loads
-            logger.info(f"Loading embedding model: {EMBEDDING_MODEL}")
-            EMBEDDING_CACHE_FOLDER.mkdir(parents=True, exist_ok=True)  # Ensure cache directory exists
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name=EMBEDDING_MODEL,
-                cache_folder=str(EMBEDDING_CACHE_FOLDER),  # Cache models for faster loading
-                model_kwargs={'device': 'cpu'},
-                encode_kwargs={'normalize_embeddings': True}
-            )
-            logger.info("✓ Embedding model loaded (cached for faster subsequent loads)")
+            if self.embeddings is None:
+                self.embeddings = create_embeddings()
 
             # Initialize text splitter
             self.text_splitter = RecursiveCharacterTextSplitter(
@@ -79,6 +124,96 @@ class RAGSystem:
             logger.error(f"Failed to initialize RAG components: {str(e)}")
             raise RAGSystemError(f"Initialization failed: {str(e)}")
 
+    def _chunk_page(self, page_data: Dict, doc_id: int, doc_name: str) -> List[Document]:
+        """
+        Split one page into LangChain chunks
+
+        Args:
+            page_data: Page dictionary from PDFProcessor
+            doc_id: doc_id of the page's document
+            doc_name: Name of the page's document
+
+        Returns:
+            List of chunks (empty for pages with too little text)
+        """
+        page_num = page_data.get("page_num", 0)
+        text = page_data.get("text", "")
+        section = page_data.get("section", "Unknown Section")
+        images = page_data.get("images", [])
+
+        if not text or len(text.strip()) < 50:
+            logger.debug(f"Skipping page {page_num} (insufficient text)")
+            return []
+
+        chunks = []
+
+        # Split text into chunks
+        for chunk_id, chunk_text in enumerate(self.text_splitter.split_text(text)):
+            if len(chunk_text.strip()) < 30:
+                continue
+
+            # Create metadata for chunk
+            metadata = {
+                "doc_id": doc_id,
+                "doc_name": doc_name,
+                "page": page_num,
+                "chunk_id": chunk_id,
+                "section": section,
+                "has_images": len(images) > 0,
+                "image_count": len(images),
+                "source": f"{doc_name}, p.{page_num}"
+            }
+
+            # Store images metadata
+            if images:
+                metadata["images"] = [
+                    {
+                        "path": str(img.get("image_path")),
+                        "format": img.get("format"),
+                        "page": img.get("page"),
+                        "index": img.get("index")
+                    }
+                    for img in images
+                ]
+
+            chunks.append(Document(page_content=chunk_text, metadata=metadata))
+
+        return chunks
+
+    def _chunk_documents(self, pdf_data_list: List[Dict], doc_id_offset: int = 0) -> Tuple[List[Document], List[Dict]]:
+        """
+        Split PDF documents into one flat list of LangChain chunks
+
+        Args:
+            pdf_data_list: List of PDF data dictionaries from PDFProcessor
+            doc_id_offset: First doc_id to assign (for appending to an existing store)
+
+        Returns:
+            Tuple of (chunks, chunks_metadata) in document/page order
+        """
+        chunks = []
+        chunks_metadata = []
+
+        for idx, pdf_data in enumerate(pdf_data_list):
+            doc_id = doc_id_offset + idx
+            doc_name = pdf_data.get("doc_name", f"Document_{doc_id}")
+            pages = pdf_data.get("pages", [])
+
+            logger.info(f"Chunking document: {doc_name} ({len(pages)} pages)")
+
+            # Track chunks created for this document
+            doc_chunk_count = 0
+
+            for page_data in pages:
+                page_chunks = self._chunk_page(page_data, doc_id, doc_name)
+                chunks.extend(page_chunks)
+                chunks_metadata.extend(chunk.metadata for chunk in page_chunks)
+                doc_chunk_count += len(page_chunks)
+
+            logger.info(f"Created {doc_chunk_count} chunks from {doc_name}")
+
+        return chunks, chunks_metadata
+
     def process_documents(self, pdf_data_list: List[Dict]) -> int:
         """
         Process PDF documents and create vector store
@@ -95,77 +230,19 @@ class RAGSystem:
         try:
             logger.info(f"Processing {len(pdf_data_list)} documents for RAG system")
 
-            all_chunks = []
-            self.chunks_metadata = []
-
-            for doc_id, pdf_data in enumerate(pdf_data_list):
-                doc_name = pdf_data.get("doc_name", f"Document_{doc_id}")
-                pages = pdf_data.get("pages", [])
-
-                logger.info(f"Processing document: {doc_name} ({len(pages)} pages)")
-
-                # Track chunks created for this document
-                doc_chunk_count = 0
-
-                for page_data in pages:
-                    page_num = page_data.get("page_num", 0)
-                    text = page_data.get("text", "")
-                    section = page_data.get("section", "Unknown Section")
-                    images = page_data.get("images", [])
-
-                    if not text or len(text.strip()) < 50:
-                        logger.debug(f"Skipping page {page_num} (insufficient text)")
-                        continue
-
-                    # Split text into chunks
-                    page_chunks = self.text_splitter.split_text(text)
-
-                    for chunk_id, chunk_text in enumerate(page_chunks):
-                        if len(chunk_text.strip()) < 30:
-                            continue
-
-                        # Create metadata for chunk
-                        metadata = {
-                            "doc_id": doc_id,
-                            "doc_name": doc_name,
-                            "page": page_num,
-                            "chunk_id": chunk_id,
-                            "section": section,
-                            "has_images": len(images) > 0,
-                            "image_count": len(images),
-                            "source": f"{doc_name}, p.{page_num}"
-                        }
-
-                        # Store images metadata
-                        if images:
-                            metadata["images"] = [
-                                {
-                                    "path": str(img.get("image_path")),
-                                    "format": img.get("format"),
-                                    "page": img.get("page"),
-                                    "index": img.get("index")
-                                }
-                                for img in images
-                            ]
-
-                        # Create LangChain Document
-                        doc = Document(
-                            page_content=chunk_text,
-                            metadata=metadata
-                        )
-
-                        all_chunks.append(doc)
-                        self.chunks_metadata.append(metadata)
-                        doc_chunk_count += 1
-
-                logger.info(f"Created {doc_chunk_count} chunks from {doc_name}")
+            # Flatten every document into one chunk list so the embedder
+            # encodes the whole corpus in a single batched call
+            all_chunks, self.chunks_metadata = self._chunk_documents(pdf_data_list)
+            self._rebuild_doc_name_index()
 
             if not all_chunks:
                 raise RAGSystemError("No valid chunks created from documents")
 
-            # Create vector store
+            # Create vector store (one embed_documents call over all chunks,
+            # encoded EMBEDDING_BATCH_SIZE at a time)
             logger.info(f"Creating vector store with {len(all_chunks)} chunks...")
             self.vector_store = FAISS.from_documents(all_chunks, self.embeddings)
+            self._maybe_compress_index()
 
             self.documents = pdf_data_list
             logger.info(f"Vector store created successfully with {len(all_chunks)} chunks")
@@ -183,7 +260,59 @@ class RAGSystem:
             logger.error(f"Failed to process documents: {str(e)}")
             raise RAGSystemError(f"Document processing failed: {str(e)}")
 
-    def search(self, query: str, k: int = TOP_K_RETRIEVAL, filter_dict: Optional[Dict] = None) -> List[Dict]:
+    def _maybe_compress_index(self):
+        """
+        Shrink the exact flat FAISS index once it has been built or extended
+
+        - Below IVF_MIN_VECTORS: store vectors as float16 (IndexScalarQuantizer
+          QT_fp16), halving memory and scan bandwidth with near-exact distances
+        - From IVF_MIN_VECTORS: IVF-PQ with 4-bit FastScan codes, scanning only
+          IVF_NPROBE inverted lists per query
+
+        Vector order is preserved, so the docstore mapping stays valid.
+        """
+        import faiss
+
+        index = getattr(self.vector_store, "index", None)
+        if not isinstance(index, (faiss.IndexFlat, faiss.IndexScalarQuantizer)):
+            return
+
+        ntotal = index.ntotal
+        use_ivf = ntotal >= IVF_MIN_VECTORS and index.d % 8 == 0
+        if not use_ivf and (isinstance(index, faiss.IndexScalarQuantizer) or not VECTOR_STORE_FP16):
+            return
+
+        if use_ivf:
+            nlist = min(IVF_MAX_LISTS, max(1, int(4 * ntotal ** 0.5)))
+            factory = f"IVF{nlist},PQ{index.d // 8}x4fs"
+        else:
+            factory = "SQfp16"
+
+        logger.info(f"Compressing vector store ({ntotal} vectors) to {factory}...")
+        vectors = index.reconstruct_n(0, ntotal)
+
+        compressed = faiss.index_factory(index.d, factory, index.metric_type)
+        compressed.train(vectors)
+        compressed.add(vectors)
+        if use_ivf:
+            compressed.nprobe = IVF_NPROBE
+
+        self.vector_store.index = compressed
+        logger.info(f"✓ Vector store compressed to {factory}")
+
+    @property
+    def hybrid_enabled(self) -> bool:
+        """Whether get_relevant_context uses hybrid (BM25 + vector + rerank) retrieval"""
+        return bool(self.hybrid_retriever and self.hybrid_retriever.bm25 is not None)
+
+    def search(
+        self,
+        query: str,
+        k: int = TOP_K_RETRIEVAL,
+        filter_dict: Optional[Dict] = None,
+        boost_doc: Optional[str] = None,
+        boost_factor: float = 1.25
+    ) -> List[Dict]:
         """
         Search vector store for relevant chunks
 
@@ -191,6 +320,9 @@ class RAGSystem:
             query: Search query
             k: Number of results to return
             filter_dict: Optional metadata filters (e.g., {"doc_name": "summary.pdf"})
+            boost_doc: Optional document name; chunks whose doc_name contains it
+                are ranked as if their similarity were multiplied by boost_factor
+            boost_factor: Ranking multiplier for boost_doc chunks (default: 1.25)
 
         Returns:
             List of dictionaries with chunks and metadata
@@ -234,6 +366,15 @@ class RAGSystem:
 
                 formatted_results.append(result)
 
+            if boost_doc:
+                # Stable sort keeps the FAISS order among equally boosted chunks
+                formatted_results.sort(
+                    key=lambda r: r["similarity"] * (
+                        boost_factor if boost_doc in r["metadata"].get("doc_name", "") else 1.0
+                    ),
+                    reverse=True
+                )
+
             logger.debug(f"Found {len(formatted_results)} relevant chunks")
             return formatted_results
 
@@ -308,7 +449,8 @@ class RAGSystem:
         Add new documents to existing vector store (APPEND, not replace)
 
         This method is critical for adding summary PDFs to sessions that already
-        contain source PDFs in the RAG system.
+        contain source PDFs in the RAG system. Only the new chunks are embedded
+        and appended to the FAISS and BM25 indexes; existing vectors are kept.
 
         Args:
             pdf_data_list: List of PDF data dictionaries from PDFProcessor
@@ -329,70 +471,9 @@ class RAGSystem:
             chunks_before = len(self.chunks_metadata)
             doc_id_offset = len(self.documents)  # Continue doc_id sequence
 
-            all_new_chunks = []
-            new_chunks_metadata = []
-
-            for idx, pdf_data in enumerate(pdf_data_list):
-                doc_id = doc_id_offset + idx
-                doc_name = pdf_data.get("doc_name", f"Document_{doc_id}")
-                pages = pdf_data.get("pages", [])
-
-                logger.info(f"Adding document: {doc_name} ({len(pages)} pages)")
-
-                doc_chunk_count = 0
-
-                for page_data in pages:
-                    page_num = page_data.get("page_num", 0)
-                    text = page_data.get("text", "")
-                    section = page_data.get("section", "Unknown Section")
-                    images = page_data.get("images", [])
-
-                    if not text or len(text.strip()) < 50:
-                        logger.debug(f"Skipping page {page_num} (insufficient text)")
-                        continue
-
-                    # Split text into chunks
-                    page_chunks = self.text_splitter.split_text(text)
-
-                    for chunk_id, chunk_text in enumerate(page_chunks):
-                        if len(chunk_text.strip()) < 30:
-                            continue
-
-                        # Create metadata for chunk
-                        metadata = {
-                            "doc_id": doc_id,
-                            "doc_name": doc_name,
-                            "page": page_num,
-                            "chunk_id": chunk_id,
-                            "section": section,
-                            "has_images": len(images) > 0,
-                            "image_count": len(images),
-                            "source": f"{doc_name}, p.{page_num}"
-                        }
-
-                        # Store images metadata
-                        if images:
-                            metadata["images"] = [
-                                {
-                                    "path": str(img.get("image_path")),
-                                    "format": img.get("format"),
-                                    "page": img.get("page"),
-                                    "index": img.get("index")
-                                }
-                                for img in images
-                            ]
-
-                        # Create LangChain Document
-                        doc = Document(
-                            page_content=chunk_text,
-                            metadata=metadata
-                        )
-
-                        all_new_chunks.append(doc)
-                        new_chunks_metadata.append(metadata)
-                        doc_chunk_count += 1
-
-                logger.info(f"Created {doc_chunk_count} new chunks from {doc_name}")
+            all_new_chunks, new_chunks_metadata = self._chunk_documents(
+                pdf_data_list, doc_id_offset=doc_id_offset
+            )
 
             if not all_new_chunks:
                 logger.warning("No valid chunks created from new documents")
@@ -401,30 +482,17 @@ class RAGSystem:
             # Add new documents to existing vector store
             logger.info(f"Adding {len(all_new_chunks)} new chunks to vector store...")
             self.vector_store.add_documents(all_new_chunks)
+            self._maybe_compress_index()
 
             # Append metadata and documents
             self.chunks_metadata.extend(new_chunks_metadata)
+            self._index_doc_names(new_chunks_metadata, start=chunks_before)
             self.documents.extend(pdf_data_list)
 
             chunks_after = len(self.chunks_metadata)
             logger.info(f"✓ Added {len(all_new_chunks)} new chunks (total: {chunks_before} → {chunks_after})")
 
-            # Rebuild BM25 index with ALL documents (old + new)
-            if self.hybrid_retriever:
-                logger.info("Rebuilding BM25 index with all documents...")
-                # Get all chunk texts from vector store
-                all_chunk_texts = [metadata["source"] for metadata in self.chunks_metadata]
-                # Reconstruct texts from stored documents
-                all_texts = []
-                for doc_data in self.documents:
-                    for page in doc_data.get("pages", []):
-                        text = page.get("text", "")
-                        if text:
-                            all_texts.append(text)
-
-                if all_texts:
-                    self.hybrid_retriever.build_bm25_index(all_texts)
-                    logger.info("✓ BM25 index rebuilt successfully with all documents")
+            self._extend_bm25_index([chunk.page_content for chunk in all_new_chunks])
 
             return len(all_new_chunks)
 
@@ -432,9 +500,103 @@ class RAGSystem:
             logger.error(f"Failed to add documents: {str(e)}")
             raise RAGSystemError(f"Adding documents failed: {str(e)}")
 
-    def get_relevant_context(self, query: str, max_chunks: int = 5, filter_dict: Optional[Dict] = None) -> Tuple[str, List[Dict]]:
+    def add_documents_iter(self, pages: Iterable[Tuple[Dict, Dict]], batch_size: int = EMBEDDING_BATCH_SIZE) -> int:
         """
-        Get relevant context for a query using hybrid retrieval
+        Append documents to the existing vector store page by page
+
+        Streaming counterpart of add_documents for pdf_processor.process_pdfs_iter:
+        chunks are embedded and added to FAISS every batch_size chunks, and each
+        page is kept in self.documents without its in-memory images, so peak
+        memory is bounded by one page plus one batch instead of the whole PDF.
+
+        Args:
+            pages: Iterable of (document info with "doc_name", page data) tuples,
+                   with the pages of each document consecutive
+            batch_size: Chunks embedded per vector store add
+
+        Returns:
+            Number of NEW chunks created (not total)
+
+        Raises:
+            RAGSystemError: If adding documents fails
+        """
+        try:
+            if not self.vector_store:
+                raise RAGSystemError("Cannot add documents - vector store not initialized. Use process_documents() first.")
+
+            chunks_before = len(self.chunks_metadata)
+            doc_id = len(self.documents) - 1  # Continue doc_id sequence
+            current_doc = None
+            pending_chunks = []
+            new_texts = []
+
+            for doc_info, page_data in pages:
+                if current_doc is None or doc_info["doc_name"] != current_doc["doc_name"]:
+                    doc_id += 1
+                    current_doc = {**doc_info, "pages": []}
+                    self.documents.append(current_doc)
+                    logger.info(f"Streaming document into RAG: {current_doc['doc_name']}")
+
+                pending_chunks.extend(self._chunk_page(page_data, doc_id, current_doc["doc_name"]))
+                current_doc["pages"].append({
+                    **page_data,
+                    "images": [
+                        {key: value for key, value in image.items() if key != "image"}
+                        for image in page_data.get("images", [])
+                    ]
+                })
+
+                if len(pending_chunks) >= batch_size:
+                    self._append_chunks(pending_chunks)
+                    new_texts.extend(chunk.page_content for chunk in pending_chunks)
+                    pending_chunks = []
+
+            if pending_chunks:
+                self._append_chunks(pending_chunks)
+                new_texts.extend(chunk.page_content for chunk in pending_chunks)
+
+            if not new_texts:
+                logger.warning("No valid chunks created from new documents")
+                return 0
+
+            self._maybe_compress_index()
+
+            logger.info(f"✓ Added {len(new_texts)} new chunks (total: {chunks_before} → {len(self.chunks_metadata)})")
+
+            self._extend_bm25_index(new_texts)
+
+            return len(new_texts)
+
+        except Exception as e:
+            logger.error(f"Failed to add documents: {str(e)}")
+            raise RAGSystemError(f"Adding documents failed: {str(e)}")
+
+    def _append_chunks(self, chunks: List[Document]):
+        """Embed chunks into the vector store and append their metadata"""
+        start = len(self.chunks_metadata)
+        self.vector_store.add_documents(chunks)
+        new_metadata = [chunk.metadata for chunk in chunks]
+        self.chunks_metadata.extend(new_metadata)
+        self._index_doc_names(new_metadata, start=start)
+
+    def _extend_bm25_index(self, new_texts: List[str]):
+        """Extend the BM25 index with new chunk texts (same corpus as process_documents)"""
+        if not self.hybrid_retriever:
+            return
+
+        if self.hybrid_retriever.bm25 is not None:
+            self.hybrid_retriever.extend_bm25_index(new_texts)
+        else:
+            # Loaded stores have no BM25 index yet: build it over every stored chunk
+            docstore = self.vector_store.docstore
+            self.hybrid_retriever.build_bm25_index([
+                docstore.search(doc_id).page_content
+                for doc_id in self.vector_store.index_to_docstore_id.values()
+            ])
+
+    def get_relevant_chunks(self, query: str, max_chunks: int = 5, filter_dict: Optional[Dict] = None) -> List[Dict]:
+        """
+        Get the chunks most relevant to a query using hybrid retrieval
 
         Args:
             query: Search query
@@ -442,46 +604,75 @@ class RAGSystem:
             filter_dict: Optional metadata filters (e.g., {"doc_name": "summary.pdf"})
 
         Returns:
-            Tuple of (combined_context, metadata_list)
+            List of result dictionaries with 'text' and 'metadata'
         """
         try:
             # Use hybrid search if available, otherwise fall back to regular search
-            if self.hybrid_retriever and self.hybrid_retriever.bm25 is not None:
+            if self.hybrid_enabled:
                 logger.info(f"🔍 Using Hybrid Retrieval (BM25 + Vector + Reranking)")
                 results = self.hybrid_search(query, k=max_chunks, retrieve_k=20)
             else:
                 logger.info(f"🔍 Using Vector Search only")
                 results = self.search(query, k=max_chunks, filter_dict=filter_dict)
 
-            if not results:
-                return "", []
-
-            # Combine text from chunks
-            context_parts = []
-            metadata_list = []
+            logger.debug(f"Retrieved {len(results)} chunks for context")
+            return results or []
 
-            for i, result in enumerate(results):
-                text = result["text"]
-                metadata = result["metadata"]
-                similarity = result["similarity"]
+        except Exception as e:
+            logger.error(f"Failed to get relevant context: {str(e)}")
+            return []
 
-                # Add source information
-                source = metadata.get("source", "Unknown")
-                section = metadata.get("section", "Unknown Section")
+    def get_relevant_context(self, query: str, max_chunks: int = 5, filter_dict: Optional[Dict] = None) -> Tuple[str, List[Dict]]:
+        """
+        Get relevant context for a query using hybrid retrieval
 
-                context_part = f"[Source {i+1}: {source}, §{section}]\n{text}\n"
-                context_parts.append(context_part)
-                metadata_list.append(metadata)
+        Args:
+            query: Search query
+            max_chunks: Maximum number of chunks to retrieve
+            filter_dict: Optional metadata filters (e.g., {"doc_name": "summary.pdf"})
 
-            combined_context = "\n".join(context_parts)
+        Returns:
+            Tuple of (combined_context, metadata_list)
+        """
+        results = self.get_relevant_chunks(query, max_chunks=max_chunks, filter_dict=filter_dict)
+        if not results:
+            return "", []
 
-            logger.debug(f"Retrieved {len(results)} chunks for context")
-            return combined_context, metadata_list
+        try:
+            return self.format_context(results)
 
         except Exception as e:
             logger.error(f"Failed to get relevant context: {str(e)}")
             return "", []
 
+    @staticmethod
+    def format_context(results: List[Dict]) -> Tuple[str, List[Dict]]:
+        """
+        Combine search results into a source-labelled context string
+
+        Args:
+            results: Results from search or hybrid_search
+
+        Returns:
+            Tuple of (combined_context, metadata_list)
+        """
+        context_parts = []
+        metadata_list = []
+
+        for i, result in enumerate(results):
+            text = result["text"]
+            metadata = result["metadata"]
+
+            # Add source information
+            source = metadata.get("source", "Unknown")
+            section = metadata.get("section", "Unknown Section")
+
+            context_part = f"[Source {i+1}: {source}, §{section}]\n{text}\n"
+            context_parts.append(context_part)
+            metadata_list.append(metadata)
+
+        return "\n".join(context_parts), metadata_list
+
     def get_chunks_by_document(self, doc_id: int) -> List[Dict]:
         """
         Get all chunks for a specific document
@@ -497,6 +688,35 @@ class RAGSystem:
             if chunk.get("doc_id") == doc_id
         ]
 
+    def get_chunk_ids_by_doc_name(self, doc_name: str, partial: bool = False) -> List[int]:
+        """
+        Get positions in chunks_metadata of all chunks from a document
+
+        Args:
+            doc_name: Document name
+            partial: Match any document whose name contains doc_name
+
+        Returns:
+            List of chunk positions
+        """
+        if not partial:
+            return list(self.doc_name_index.get(doc_name, []))
+        return [
+            chunk_id
+            for name, chunk_ids in self.doc_name_index.items() if doc_name in name
+            for chunk_id in chunk_ids
+        ]
+
+    def _index_doc_names(self, chunks_metadata: List[Dict], start: int = 0):
+        """Add chunks (starting at position start) to the doc_name index"""
+        for offset, metadata in enumerate(chunks_metadata):
+            self.doc_name_index[metadata.get("doc_name", "")].append(start + offset)
+
+    def _rebuild_doc_name_index(self):
+        """Rebuild the doc_name index from chunks_metadata"""
+        self.doc_name_index = defaultdict(list)
+        self._index_doc_names(self.chunks_metadata)
+
     def get_chunks_by_page(self, doc_id: int, page_num: int) -> List[Dict]:
         """
         Get all chunks for a specific page
@@ -539,6 +759,41 @@ class RAGSystem:
             except:
                 return None
 
+    @staticmethod
+    def _dump_json(obj) -> bytes:
+        """
+        Serialize to JSON bytes with orjson
+
+        Extracted PDF text can contain lone surrogates, which orjson rejects;
+        those stores fall back to the stdlib encoder (escaped, as before).
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj).encode("utf-8")
+
+    @staticmethod
+    def _load_json(path: Path):
+        """
+        Load a JSON file written by _dump_json (or an older json.dump)
+
+        The file is memory-mapped and parsed in place, so it is never
+        copied into an intermediate bytes object.
+        """
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return orjson.loads(f.read())
+
+            with mapped, memoryview(mapped) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    # Escaped lone surrogates are only accepted by the stdlib decoder
+                    return json.loads(bytes(view))
+
     def save_vector_store(self, path: Path):
         """
         Save vector store to disk
@@ -555,8 +810,10 @@ class RAGSystem:
 
             path.mkdir(parents=True, exist_ok=True)
 
-            # Save FAISS index
+            # Save FAISS index. The old index file is unlinked rather than
+            # overwritten, so stores still memory-mapping it keep a valid file
             faiss_path = path / "faiss_index"
+            (faiss_path / "index.faiss").unlink(missing_ok=True)
             self.vector_store.save_local(str(faiss_path))
 
             # Make data JSON-serializable (removes PIL Images, converts Paths to strings)
@@ -565,13 +822,13 @@ class RAGSystem:
 
             # Save metadata (using JSON for security)
             metadata_path = path / "chunks_metadata.json"
-            with open(metadata_path, "w") as f:
-                json.dump(serializable_metadata, f, indent=2)
+            with open(metadata_path, "wb") as f:
+                f.write(self._dump_json(serializable_metadata))
 
             # Save documents (using JSON for security)
             docs_path = path / "documents.json"
-            with open(docs_path, "w") as f:
-                json.dump(serializable_documents, f, indent=2)
+            with open(docs_path, "wb") as f:
+                f.write(self._dump_json(serializable_documents))
 
             logger.info(f"Vector store saved to {path}")
 
@@ -579,12 +836,43 @@ class RAGSystem:
             logger.error(f"Failed to save vector store: {str(e)}")
             raise VectorStoreError(f"Save failed: {str(e)}")
 
-    def load_vector_store(self, path: Path):
+    def _load_faiss_mmap(self, faiss_path: Path) -> Optional[FAISS]:
+        """
+        Open a saved FAISS store with its index memory-mapped read-only
+
+        Vector data is paged in from the OS page cache on search instead of
+        being copied into process memory at load. Returns None if FAISS cannot
+        map this index, so the caller can fall back to a full read.
+        """
+        import faiss
+
+        try:
+            index = faiss.read_index(
+                str(faiss_path / "index.faiss"),
+                faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        except RuntimeError as e:
+            logger.debug(f"Memory-mapped index load unavailable ({str(e)}), reading into memory")
+            return None
+
+        with open(faiss_path / "index.pkl", "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id
+        )
+
+    def load_vector_store(self, path: Path, mmap: bool = False):
         """
         Load vector store from disk
 
         Args:
             path: Path to saved directory
+            mmap: Memory-map the FAISS index read-only instead of reading it
+                  into RAM (for stores that will only be searched)
 
         Raises:
             VectorStoreError: If load fails
@@ -592,33 +880,34 @@ class RAGSystem:
         try:
             # Load FAISS index
             faiss_path = path / "faiss_index"
-            self.vector_store = FAISS.load_local(
-                str(faiss_path),
-                self.embeddings,
-                allow_dangerous_deserialization=True
-            )
+            self.vector_store = self._load_faiss_mmap(faiss_path) if mmap else None
+            if self.vector_store is None:
+                self.vector_store = FAISS.load_local(
+                    str(faiss_path),
+                    self.embeddings,
+                    allow_dangerous_deserialization=True
+                )
 
             # Load metadata (try JSON first, fallback to pickle for old sessions)
             metadata_path_json = path / "chunks_metadata.json"
             metadata_path_pkl = path / "chunks_metadata.pkl"
 
             if metadata_path_json.exists():
-                with open(metadata_path_json, "r") as f:
-                    self.chunks_metadata = json.load(f)
+                self.chunks_metadata = self._load_json(metadata_path_json)
             elif metadata_path_pkl.exists():
                 logger.warning("Loading from legacy pickle format - will upgrade on next save")
                 with open(metadata_path_pkl, "rb") as f:
                     self.chunks_metadata = pickle.load(f)
             else:
                 raise FileNotFoundError("Metadata file not found")
+            self._rebuild_doc_name_index()
 
             # Load documents (try JSON first, fallback to pickle for old sessions)
             docs_path_json = path / "documents.json"
             docs_path_pkl = path / "documents.pkl"
 
             if docs_path_json.exists():
-                with open(docs_path_json, "r") as f:
-                    self.documents = json.load(f)
+                self.documents = self._load_json(docs_path_json)
             elif docs_path_pkl.exists():
                 logger.warning("Loading from legacy pickle format - will upgrade on next save")
                 with open(docs_path_pkl, "rb") as f:
@@ -22,7 +22,8 @@ from config.settings import (
     REPORT_FONT_SIZE,
     REPORT_TITLE_SIZE,
     REPORT_HEADING_SIZE,
-    OUTPUT_DIR
+    OUTPUT_DIR,
+    ensure_directories
 )
 from utils.logger import get_logger
 from utils.exceptions import ReportGenerationError
@@ -182,6 +183,7 @@ class ReportGenerator:
                 safe_title = safe_title.replace(' ', '_')[:50]
                 output_filename = f"{safe_title}_{timestamp}.pdf"
 
+            ensure_directories()
             output_path = OUTPUT_DIR / output_filename
 
             # Create PDF document
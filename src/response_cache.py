@@ -0,0 +1,148 @@
+"""
+Response Cache
+Content-addressed SQLite cache of Claude responses so re-running an
+analysis with identical prompts skips the API round-trip
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import orjson
+
+from config.settings import RESPONSE_CACHE_PATH, RESPONSE_CACHE_TTL_HOURS
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """
+    Response text keyed on a hash of everything that shapes the request
+
+    Entries older than the TTL are ignored on read and dropped on write.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path = RESPONSE_CACHE_PATH,
+        ttl_hours: float = RESPONSE_CACHE_TTL_HOURS
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            cache_path: SQLite file holding cached responses
+            ttl_hours: Hours a cached response stays valid
+        """
+        self.cache_path = Path(cache_path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.stats = {"hits": 0, "misses": 0}
+
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        messages: List[Dict],
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """
+        Build the cache key for a request
+
+        Args:
+            model: Model name
+            system_prompt: System prompt text
+            messages: Request messages
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+
+        Returns:
+            Hex digest cache key
+        """
+        payload = orjson.dumps({
+            "model": model,
+            "system": system_prompt,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response text, or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT response FROM responses WHERE key = ? AND created >= ?",
+                    (key, time.time() - self.ttl_seconds)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache unreadable: {str(e)}")
+            return None
+
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        logger.debug(f"Response cache hit {key[:12]}")
+        return row[0]
+
+    def set(self, key: str, response: str):
+        """
+        Store a response, dropping expired entries
+
+        Args:
+            key: Cache key from make_key
+            response: Response text
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                    (key, response, now)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update response cache: {str(e)}")
+
+    def clear(self):
+        """Remove all cached responses"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear response cache: {str(e)}")
+            return
+        logger.info("Response cache cleared")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Shared connection, opened and schema-checked on first use (call with the lock held)"""
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+            )
+        return self._conn
@@ -8,10 +8,10 @@ import json
 from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
-import anthropic
 import PyPDF2
 
-from config.settings import ANTHROPIC_API_KEY, MODEL_MODE, TAVILY_API_KEY
+from config.settings import MODEL_MODE, TAVILY_API_KEY, get_api_key
+from src.api_clients import get_anthropic_client
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,7 +40,7 @@ class ResumeMaker:
         self.perplexity_key = perplexity_key
 
         if self.model_mode == "api":
-            self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+            self.client = get_anthropic_client(get_api_key("api"))
             self.model = "claude-sonnet-4-20250514"
         elif self.model_mode == "grok":
             from src.grok_handler import GrokHandler
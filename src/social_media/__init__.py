@@ -4,14 +4,14 @@ LinkedIn and X (Twitter) automation for PhD students and researchers
 """
 
 from .models import (
-    User, Post, PostAnalytics, Analytics, OAuthToken,
+    User, Post, PostAnalytics, PostAnalyticsDaily, Analytics, OAuthToken,
     ContentTemplate, TrendingTopic, ContentCalendar, ABTest,
     Platform, PostStatus, ContentType,
     DatabaseManager, TokenEncryption
 )
 
 __all__ = [
-    'User', 'Post', 'PostAnalytics', 'Analytics', 'OAuthToken',
+    'User', 'Post', 'PostAnalytics', 'PostAnalyticsDaily', 'Analytics', 'OAuthToken',
     'ContentTemplate', 'TrendingTopic', 'ContentCalendar', 'ABTest',
     'Platform', 'PostStatus', 'ContentType',
     'DatabaseManager', 'TokenEncryption'
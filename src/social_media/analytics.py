@@ -17,25 +17,58 @@ References:
 - Engagement Rate Calculations: Industry standard (interactions/impressions)
 """
 
+import copy
+import hashlib
+import heapq
 import time
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from collections import OrderedDict, defaultdict
 from statistics import mean, median
+import numpy as np
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, extract, case
+from sqlalchemy.dialects import postgresql, sqlite
 
 from src.social_media.models import (
-    Post, PostAnalytics, Analytics, User, Platform, PostStatus,
+    Post, PostAnalytics, PostAnalyticsDaily, Analytics, User, Platform, PostStatus,
     DatabaseManager
 )
-from src.social_media.twitter_handler import TwitterHandler
+from src.social_media.twitter_handler import TwitterHandler, TWEET_LOOKUP_BATCH_SIZE
 from utils.logger import get_logger
 from utils.exceptions import APIError, RateLimitError
 
 logger = get_logger(__name__)
 
 
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime (matches the stored columns)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Report memoization: entries are keyed by a data version token, so any new
+# post, post edit or analytics snapshot for the user produces a new key
+REPORT_CACHE_MAXSIZE = 256
+# Weekly reports cover a sliding 7-day window, so cached ones also expire
+WEEKLY_REPORT_CACHE_TTL = timedelta(minutes=15)
+
+# Number of posts listed in the weekly report
+TOP_POSTS_LIMIT = 5
+
+# Daily rollup: default refresh window
+DAILY_ROLLUP_WINDOW = timedelta(hours=48)
+
+# Rows per INSERT ... ON CONFLICT statement
+UPSERT_BATCH_SIZE = 100
+
+# Columns refreshed when a snapshot for the same (post_id, snapshot_time) exists
+SNAPSHOT_UPSERT_COLUMNS = (
+    'impressions', 'views', 'likes', 'comments', 'shares', 'retweets', 'clicks',
+    'engagement_rate', 'weighted_engagement_score', 'hours_since_published'
+)
+
+
 class AnalyticsCollector:
     """
     Collect and analyze social media metrics with comprehensive tracking
@@ -63,6 +96,68 @@ class AnalyticsCollector:
         self.db_manager = db_manager
         self.twitter_handler = twitter_handler
         self.logger = logger
+        self._report_cache: "OrderedDict[Tuple, Tuple[datetime, Dict]]" = OrderedDict()
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        # Bulk collection outcomes: unchanged metrics, first collection, changed metrics
+        self.metric_hash_stats = {'equal_hits': 0, 'cold_misses': 0, 'misses': 0}
+        # Bumped on every snapshot upsert; in-place updates keep max(PostAnalytics.id)
+        self._snapshot_writes = 0
+
+    def _data_version_token(self, session: Session, user_id: int) -> Tuple:
+        """
+        Build a token that changes whenever the user's report inputs change
+
+        Args:
+            session: Active database session
+            user_id: User ID
+
+        Returns:
+            Tuple of (latest post update, latest post snapshot id, latest user snapshot id,
+            snapshot upserts made by this collector)
+        """
+        latest_post_update = session.query(func.max(Post.updated_at)).filter(
+            Post.user_id == user_id
+        ).scalar_subquery()
+        latest_post_snapshot = session.query(func.max(PostAnalytics.id)).select_from(
+            PostAnalytics
+        ).join(Post, PostAnalytics.post_id == Post.id).filter(
+            Post.user_id == user_id
+        ).scalar_subquery()
+        latest_user_snapshot = session.query(func.max(Analytics.id)).filter(
+            Analytics.user_id == user_id
+        ).scalar_subquery()
+
+        return tuple(
+            session.query(latest_post_update, latest_post_snapshot, latest_user_snapshot).one()
+        ) + (self._snapshot_writes,)
+
+    def _get_cached_report(self, key: Tuple, ttl: Optional[timedelta] = None) -> Optional[Dict]:
+        """Return a copy of a cached report, or None on miss or expiry"""
+        entry = self._report_cache.get(key)
+        if entry is not None:
+            cached_at, report = entry
+            if ttl is None or _utcnow() - cached_at < ttl:
+                self._report_cache.move_to_end(key)
+                self.cache_stats['hits'] += 1
+                return copy.deepcopy(report)
+            del self._report_cache[key]
+
+        self.cache_stats['misses'] += 1
+        return None
+
+    def _store_cached_report(self, key: Tuple, report: Dict):
+        """Cache a report, evicting the least recently used entry when full"""
+        if 'error' in report:
+            return
+
+        self._report_cache[key] = (_utcnow(), copy.deepcopy(report))
+        self._report_cache.move_to_end(key)
+        while len(self._report_cache) > REPORT_CACHE_MAXSIZE:
+            self._report_cache.popitem(last=False)
+
+    def clear_report_cache(self):
+        """Drop all memoized summaries and weekly reports"""
+        self._report_cache.clear()
 
     def collect_post_metrics(self, post_id: int) -> Dict:
         """
@@ -144,7 +239,7 @@ class AnalyticsCollector:
                 return {
                     'success': True,
                     'metrics': metrics,
-                    'collected_at': datetime.utcnow()
+                    'collected_at': _utcnow()
                 }
 
             except RateLimitError as e:
@@ -187,39 +282,70 @@ class AnalyticsCollector:
             Engagement rate as percentage (0.0 - 100.0)
             Returns 0.0 if no impressions or analytics data
         """
+        return self.calculate_engagement_rates([post_id]).get(post_id, 0.0)
+
+    def calculate_engagement_rates(self, post_ids: List[int]) -> Dict[int, float]:
+        """
+        Calculate engagement rates for many posts from their latest snapshots
+
+        Loads every latest snapshot in one query and computes all rates
+        with a single vectorized NumPy expression.
+
+        Args:
+            post_ids: Internal database post IDs
+
+        Returns:
+            Dict mapping post ID to engagement rate (percentage, 2 decimals).
+            Posts without analytics or impressions map to 0.0.
+        """
+        if not post_ids:
+            return {}
+
         session = self.db_manager.get_session()
 
         try:
-            # Get latest analytics for post
-            analytics = session.query(PostAnalytics).filter(
-                PostAnalytics.post_id == post_id
-            ).order_by(PostAnalytics.snapshot_time.desc()).first()
-
-            if not analytics or not analytics.impressions or analytics.impressions == 0:
-                self.logger.debug(f"No analytics or zero impressions for post {post_id}")
-                return 0.0
-
-            # Calculate total engagements
-            total_engagements = (
-                analytics.likes +
-                analytics.comments +  # replies
-                analytics.retweets +
-                analytics.shares  # quotes/retweets
-            )
+            latest_snapshot = self._latest_snapshot_subquery(session)
+
+            rows = session.query(
+                PostAnalytics.post_id,
+                PostAnalytics.likes,
+                PostAnalytics.comments,  # replies
+                PostAnalytics.retweets,
+                PostAnalytics.shares,  # quotes/retweets
+                PostAnalytics.impressions
+            ).join(
+                latest_snapshot,
+                and_(
+                    PostAnalytics.post_id == latest_snapshot.c.post_id,
+                    PostAnalytics.snapshot_time == latest_snapshot.c.snapshot_time
+                )
+            ).filter(PostAnalytics.post_id.in_(post_ids)).all()
 
-            # Calculate rate
-            engagement_rate = (total_engagements / analytics.impressions) * 100
+            rates = dict.fromkeys(post_ids, 0.0)
+            if not rows:
+                self.logger.debug(f"No analytics found for {len(post_ids)} posts")
+                return rates
 
-            self.logger.debug(
-                f"Post {post_id}: {total_engagements} engagements / "
-                f"{analytics.impressions} impressions = {engagement_rate:.2f}%"
+            metrics = np.array(
+                [[value or 0 for value in row[1:]] for row in rows],
+                dtype=np.int64
             )
+            impressions = metrics[:, 4]
+            engagements = metrics[:, :4].sum(axis=1)
+            computed = np.where(
+                impressions > 0,
+                engagements / np.maximum(impressions, 1) * 100.0,
+                0.0
+            )
+
+            for row, rate in zip(rows, computed.tolist()):
+                rates[row.post_id] = round(rate, 2)
 
-            return round(engagement_rate, 2)
+            return rates
 
         except Exception as e:
-            self.logger.error(f"Error calculating engagement rate: {str(e)}")
-            return 0.0
+            self.logger.error(f"Error calculating engagement rates: {str(e)}")
+            return {}
         finally:
             session.close()
 
@@ -257,47 +383,10 @@ class AnalyticsCollector:
                 self.logger.error(f"Post {post_id} not found or not published")
                 return None
 
-            hours_since_published = int(
-                (datetime.utcnow() - post.published_time).total_seconds() / 3600
-            )
-
-            # Calculate engagement rate
-            impressions = metrics.get('impressions', 0)
-            total_engagements = (
-                metrics.get('likes', 0) +
-                metrics.get('retweets', 0) +
-                metrics.get('replies', 0) +
-                metrics.get('quotes', 0)
-            )
-
-            engagement_rate = 0.0
-            if impressions > 0:
-                engagement_rate = (total_engagements / impressions) * 100
-
-            # Calculate weighted engagement score
-            # Weight: likes=1, retweets=2, replies=3, quotes=2
-            weighted_score = (
-                metrics.get('likes', 0) * 1.0 +
-                metrics.get('retweets', 0) * 2.0 +
-                metrics.get('replies', 0) * 3.0 +
-                metrics.get('quotes', 0) * 2.0
-            )
-
-            # Create analytics snapshot
-            analytics = PostAnalytics(
-                post_id=post_id,
-                impressions=metrics.get('impressions', 0),
-                views=metrics.get('impressions', 0),  # Use impressions as views
-                likes=metrics.get('likes', 0),
-                comments=metrics.get('replies', 0),
-                shares=metrics.get('quotes', 0),
-                retweets=metrics.get('retweets', 0),
-                clicks=metrics.get('url_clicks', 0),
-                engagement_rate=engagement_rate,
-                weighted_engagement_score=weighted_score,
-                snapshot_time=datetime.utcnow(),
-                hours_since_published=hours_since_published
+            fields = self._build_snapshot_fields(
+                post_id, metrics, post.published_time, _utcnow()
             )
+            analytics = PostAnalytics(**fields)
 
             session.add(analytics)
             session.commit()
@@ -305,7 +394,7 @@ class AnalyticsCollector:
 
             self.logger.info(
                 f"Created analytics snapshot for post {post_id}: "
-                f"{total_engagements} engagements, {engagement_rate:.2f}% rate"
+                f"{analytics.engagement_rate:.2f}% engagement rate"
             )
 
             return analytics
@@ -317,6 +406,158 @@ class AnalyticsCollector:
         finally:
             session.close()
 
+    def update_post_analytics_bulk(self, post_ids: List[int]) -> int:
+        """
+        Fetch latest metrics for many posts and store snapshots in one write
+
+        Tweet metrics are looked up TWEET_LOOKUP_BATCH_SIZE ids per Twitter
+        API call and snapshots are written with batched INSERT ... ON
+        CONFLICT (post_id, snapshot_time) statements, instead of one API
+        call and one commit per post as in update_post_analytics. Posts
+        whose metrics hash matches Post.last_metric_hash get no new
+        snapshot (counted in metric_hash_stats).
+
+        Args:
+            post_ids: Internal database post IDs
+
+        Returns:
+            Number of PostAnalytics snapshots created
+        """
+        if not post_ids:
+            return 0
+
+        if not self.twitter_handler:
+            self.logger.warning("No Twitter handler configured, skipping bulk analytics update")
+            return 0
+
+        session = self.db_manager.get_session()
+
+        try:
+            posts = session.query(Post).filter(
+                Post.id.in_(post_ids),
+                Post.status == PostStatus.PUBLISHED,
+                Post.external_post_id.isnot(None),
+                Post.published_time.isnot(None)
+            ).all()
+
+            posts_by_tweet_id = {str(post.external_post_id): post for post in posts}
+            tweet_ids = list(posts_by_tweet_id)
+
+            now = _utcnow()
+            rows = []
+            for start in range(0, len(tweet_ids), TWEET_LOOKUP_BATCH_SIZE):
+                batch = tweet_ids[start:start + TWEET_LOOKUP_BATCH_SIZE]
+                metrics_by_tweet_id = self.twitter_handler.get_tweets_metrics(batch)
+
+                for tweet_id, metrics in metrics_by_tweet_id.items():
+                    post = posts_by_tweet_id.get(tweet_id)
+                    if post is None:
+                        continue
+
+                    metric_hash = self._metric_hash(metrics)
+                    if post.last_metric_hash is None:
+                        self.metric_hash_stats['cold_misses'] += 1
+                    elif post.last_metric_hash == metric_hash:
+                        # Nothing changed since the last snapshot
+                        self.metric_hash_stats['equal_hits'] += 1
+                        continue
+                    else:
+                        self.metric_hash_stats['misses'] += 1
+
+                    post.last_metric_hash = metric_hash
+                    rows.append(
+                        self._build_snapshot_fields(post.id, metrics, post.published_time, now)
+                    )
+
+            if rows:
+                # Flushes the last_metric_hash updates in the same transaction
+                self._upsert_rows(
+                    session, PostAnalytics, rows,
+                    ('post_id', 'snapshot_time'), SNAPSHOT_UPSERT_COLUMNS
+                )
+                session.commit()
+                self._snapshot_writes += 1
+
+            self.logger.info(
+                f"Created {len(rows)} analytics snapshots for {len(post_ids)} requested posts"
+            )
+
+            return len(rows)
+
+        except Exception as e:
+            self.logger.error(f"Error bulk updating post analytics: {str(e)}")
+            session.rollback()
+            return 0
+        finally:
+            session.close()
+
+    @staticmethod
+    def _metric_hash(metrics: Dict) -> str:
+        """Stable 64-bit hex digest of a raw metrics dict"""
+        return hashlib.blake2b(
+            orjson.dumps(metrics, option=orjson.OPT_SORT_KEYS), digest_size=8
+        ).hexdigest()
+
+    @staticmethod
+    def _build_snapshot_fields(
+        post_id: int,
+        metrics: Dict,
+        published_time: datetime,
+        snapshot_time: datetime
+    ) -> Dict:
+        """
+        Derive PostAnalytics column values from raw tweet metrics
+
+        Args:
+            post_id: Internal database post ID
+            metrics: Metrics dict from TwitterHandler
+            published_time: When the post was published
+            snapshot_time: Timestamp for the snapshot
+
+        Returns:
+            Dict of PostAnalytics column values
+        """
+        hours_since_published = int(
+            (snapshot_time - published_time).total_seconds() / 3600
+        )
+
+        # Calculate engagement rate
+        impressions = metrics.get('impressions', 0)
+        total_engagements = (
+            metrics.get('likes', 0) +
+            metrics.get('retweets', 0) +
+            metrics.get('replies', 0) +
+            metrics.get('quotes', 0)
+        )
+
+        engagement_rate = 0.0
+        if impressions > 0:
+            engagement_rate = (total_engagements / impressions) * 100
+
+        # Calculate weighted engagement score
+        # Weight: likes=1, retweets=2, replies=3, quotes=2
+        weighted_score = (
+            metrics.get('likes', 0) * 1.0 +
+            metrics.get('retweets', 0) * 2.0 +
+            metrics.get('replies', 0) * 3.0 +
+            metrics.get('quotes', 0) * 2.0
+        )
+
+        return {
+            'post_id': post_id,
+            'impressions': impressions,
+            'views': impressions,  # Use impressions as views
+            'likes': metrics.get('likes', 0),
+            'comments': metrics.get('replies', 0),
+            'shares': metrics.get('quotes', 0),
+            'retweets': metrics.get('retweets', 0),
+            'clicks': metrics.get('url_clicks', 0),
+            'engagement_rate': engagement_rate,
+            'weighted_engagement_score': weighted_score,
+            'snapshot_time': snapshot_time,
+            'hours_since_published': hours_since_published
+        }
+
     def get_user_analytics_summary(
         self,
         user_id: int,
@@ -325,6 +566,9 @@ class AnalyticsCollector:
         """
         Get aggregated analytics for user in date range
 
+        Summaries for an explicit date_range are memoized until the user's
+        posts or analytics snapshots change.
+
         Args:
             user_id: User ID
             date_range: Optional tuple of (start_date, end_date)
@@ -345,158 +589,410 @@ class AnalyticsCollector:
 
         try:
             # Set default date range (last 30 days)
+            explicit_range = date_range is not None
             if not date_range:
-                end_date = datetime.utcnow()
+                end_date = _utcnow()
                 start_date = end_date - timedelta(days=30)
                 date_range = (start_date, end_date)
 
             start_date, end_date = date_range
 
-            # Get all published posts in date range
-            posts = session.query(Post).filter(
-                and_(
-                    Post.user_id == user_id,
-                    Post.status == PostStatus.PUBLISHED,
-                    Post.published_time >= start_date,
-                    Post.published_time <= end_date
+            cache_key = None
+            if explicit_range:
+                cache_key = (
+                    'summary', user_id, start_date.isoformat(), end_date.isoformat(),
+                    self._data_version_token(session, user_id)
                 )
-            ).all()
+                cached = self._get_cached_report(cache_key)
+                if cached is not None:
+                    return cached
+
+            # Get all published posts in date range with their latest snapshots
+            post_snapshots = self._latest_post_snapshots(session, user_id, start_date, end_date)
 
-            if not posts:
+            summary = self._summarize_post_snapshots(post_snapshots, start_date, end_date)
+
+            if summary['total_posts'] == 0:
                 self.logger.info(f"No published posts found for user {user_id} in date range")
-                return {
-                    'total_posts': 0,
-                    'total_impressions': 0,
-                    'total_engagements': 0,
-                    'avg_engagement_rate': 0.0,
-                    'time_range': {
-                        'start': start_date.isoformat(),
-                        'end': end_date.isoformat()
-                    }
-                }
+                return summary
 
-            # Aggregate metrics
-            total_posts = len(posts)
-            total_impressions = 0
-            total_engagements = 0
-            engagement_rates = []
-            engagement_by_type = defaultdict(lambda: {'posts': 0, 'engagements': 0, 'impressions': 0})
-
-            post_scores = []  # (post, score) tuples
-
-            for post in posts:
-                # Get latest analytics for each post
-                analytics = session.query(PostAnalytics).filter(
-                    PostAnalytics.post_id == post.id
-                ).order_by(PostAnalytics.snapshot_time.desc()).first()
-
-                if analytics:
-                    impressions = analytics.impressions or 0
-                    engagements = (
-                        (analytics.likes or 0) +
-                        (analytics.retweets or 0) +
-                        (analytics.comments or 0) +
-                        (analytics.shares or 0)
-                    )
+            self.logger.info(
+                f"User {user_id} analytics: {summary['total_posts']} posts, "
+                f"{summary['total_engagements']} engagements, "
+                f"{summary['avg_engagement_rate']:.2f}% avg rate"
+            )
 
-                    total_impressions += impressions
-                    total_engagements += engagements
-
-                    if impressions > 0:
-                        eng_rate = (engagements / impressions) * 100
-                        engagement_rates.append(eng_rate)
-
-                    # Track by content type
-                    if post.content_type:
-                        content_type = post.content_type.value
-                        engagement_by_type[content_type]['posts'] += 1
-                        engagement_by_type[content_type]['engagements'] += engagements
-                        engagement_by_type[content_type]['impressions'] += impressions
-
-                    # Track for best/worst
-                    post_scores.append((post, analytics.weighted_engagement_score or 0))
-
-            # Calculate averages
-            avg_engagement_rate = mean(engagement_rates) if engagement_rates else 0.0
-
-            # Find best and worst posts
-            best_post_data = None
-            worst_post_data = None
-
-            if post_scores:
-                post_scores.sort(key=lambda x: x[1], reverse=True)
-
-                best_post, best_score = post_scores[0]
-                best_analytics = session.query(PostAnalytics).filter(
-                    PostAnalytics.post_id == best_post.id
-                ).order_by(PostAnalytics.snapshot_time.desc()).first()
-
-                if best_analytics:
-                    best_post_data = {
-                        'post_id': best_post.id,
-                        'content': best_post.content[:100] + '...' if len(best_post.content) > 100 else best_post.content,
-                        'impressions': best_analytics.impressions,
-                        'engagements': (
-                            (best_analytics.likes or 0) +
-                            (best_analytics.retweets or 0) +
-                            (best_analytics.comments or 0) +
-                            (best_analytics.shares or 0)
-                        ),
-                        'engagement_rate': best_analytics.engagement_rate,
-                        'score': best_score
-                    }
+            if cache_key is not None:
+                self._store_cached_report(cache_key, summary)
 
-                # Worst post (last in sorted list)
-                worst_post, worst_score = post_scores[-1]
-                worst_analytics = session.query(PostAnalytics).filter(
-                    PostAnalytics.post_id == worst_post.id
-                ).order_by(PostAnalytics.snapshot_time.desc()).first()
-
-                if worst_analytics:
-                    worst_post_data = {
-                        'post_id': worst_post.id,
-                        'content': worst_post.content[:100] + '...' if len(worst_post.content) > 100 else worst_post.content,
-                        'impressions': worst_analytics.impressions,
-                        'engagements': (
-                            (worst_analytics.likes or 0) +
-                            (worst_analytics.retweets or 0) +
-                            (worst_analytics.comments or 0) +
-                            (worst_analytics.shares or 0)
-                        ),
-                        'engagement_rate': worst_analytics.engagement_rate,
-                        'score': worst_score
-                    }
+            return summary
 
-            # Calculate engagement rate by content type
-            for content_type, data in engagement_by_type.items():
-                if data['impressions'] > 0:
-                    data['engagement_rate'] = (data['engagements'] / data['impressions']) * 100
-                else:
-                    data['engagement_rate'] = 0.0
-
-            summary = {
-                'total_posts': total_posts,
-                'total_impressions': total_impressions,
-                'total_engagements': total_engagements,
-                'avg_engagement_rate': round(avg_engagement_rate, 2),
-                'best_post': best_post_data,
-                'worst_post': worst_post_data,
-                'engagement_by_type': dict(engagement_by_type),
-                'time_range': {
-                    'start': start_date.isoformat(),
-                    'end': end_date.isoformat()
-                }
+        except Exception as e:
+            self.logger.error(f"Error getting user analytics summary: {str(e)}")
+            return {
+                'error': str(e),
+                'total_posts': 0,
+                'total_impressions': 0,
+                'total_engagements': 0,
+                'avg_engagement_rate': 0.0
+            }
+        finally:
+            session.close()
+
+    @staticmethod
+    def _latest_snapshot_subquery(session: Session):
+        """Subquery of (post_id, snapshot_time) for each post's latest analytics snapshot"""
+        return session.query(
+            PostAnalytics.post_id,
+            func.max(PostAnalytics.snapshot_time).label('snapshot_time')
+        ).group_by(PostAnalytics.post_id).subquery()
+
+    def _latest_post_snapshots(
+        self,
+        session: Session,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Tuple[Post, Optional[PostAnalytics]]]:
+        """
+        Load published posts in a date range with their latest snapshot in one query
+
+        Args:
+            session: Active database session
+            user_id: User ID
+            start_date: Range start (inclusive)
+            end_date: Range end (inclusive)
+
+        Returns:
+            List of (post, latest analytics or None) tuples
+        """
+        latest_snapshot = self._latest_snapshot_subquery(session)
+
+        return session.query(Post, PostAnalytics).outerjoin(
+            latest_snapshot, latest_snapshot.c.post_id == Post.id
+        ).outerjoin(
+            PostAnalytics,
+            and_(
+                PostAnalytics.post_id == Post.id,
+                PostAnalytics.snapshot_time == latest_snapshot.c.snapshot_time
+            )
+        ).filter(
+            and_(
+                Post.user_id == user_id,
+                Post.status == PostStatus.PUBLISHED,
+                Post.published_time >= start_date,
+                Post.published_time <= end_date
+            )
+        ).all()
+
+    @staticmethod
+    def _summarize_post_snapshots(
+        post_snapshots: List[Tuple[Post, Optional[PostAnalytics]]],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict:
+        """
+        Aggregate (post, latest analytics) pairs into a summary dict
+
+        Args:
+            post_snapshots: Pairs from _latest_post_snapshots
+            start_date: Range start, reported in time_range
+            end_date: Range end, reported in time_range
+
+        Returns:
+            Summary dict in the get_user_analytics_summary format
+        """
+        time_range = {
+            'start': start_date.isoformat(),
+            'end': end_date.isoformat()
+        }
+
+        if not post_snapshots:
+            return {
+                'total_posts': 0,
+                'total_impressions': 0,
+                'total_engagements': 0,
+                'avg_engagement_rate': 0.0,
+                'time_range': time_range
+            }
+
+        # Aggregate metrics
+        total_posts = len(post_snapshots)
+        total_impressions = 0
+        total_engagements = 0
+        engagement_rates = []
+        engagement_by_type = defaultdict(lambda: {'posts': 0, 'engagements': 0, 'impressions': 0})
+
+        post_scores = []  # (post, analytics, engagements, score) tuples
+
+        for post, analytics in post_snapshots:
+            if analytics:
+                impressions = analytics.impressions or 0
+                engagements = (
+                    (analytics.likes or 0) +
+                    (analytics.retweets or 0) +
+                    (analytics.comments or 0) +
+                    (analytics.shares or 0)
+                )
+
+                total_impressions += impressions
+                total_engagements += engagements
+
+                if impressions > 0:
+                    eng_rate = (engagements / impressions) * 100
+                    engagement_rates.append(eng_rate)
+
+                # Track by content type
+                if post.content_type:
+                    content_type = post.content_type.value
+                    engagement_by_type[content_type]['posts'] += 1
+                    engagement_by_type[content_type]['engagements'] += engagements
+                    engagement_by_type[content_type]['impressions'] += impressions
+
+                # Track for best/worst
+                post_scores.append(
+                    (post, analytics, engagements, analytics.weighted_engagement_score or 0)
+                )
+
+        # Calculate averages
+        avg_engagement_rate = mean(engagement_rates) if engagement_rates else 0.0
+
+        def post_data(post, analytics, engagements, score):
+            return {
+                'post_id': post.id,
+                'content': post.content[:100] + '...' if len(post.content) > 100 else post.content,
+                'impressions': analytics.impressions,
+                'engagements': engagements,
+                'engagement_rate': analytics.engagement_rate,
+                'score': score
             }
 
+        # Find best and worst posts
+        best_post_data = None
+        worst_post_data = None
+
+        if post_scores:
+            best_post_data = post_data(*max(post_scores, key=lambda x: x[3]))
+            # Worst post (last lowest score, matching a stable descending sort)
+            worst_post_data = post_data(*min(reversed(post_scores), key=lambda x: x[3]))
+
+        # Calculate engagement rate by content type
+        for content_type, data in engagement_by_type.items():
+            if data['impressions'] > 0:
+                data['engagement_rate'] = (data['engagements'] / data['impressions']) * 100
+            else:
+                data['engagement_rate'] = 0.0
+
+        return {
+            'total_posts': total_posts,
+            'total_impressions': total_impressions,
+            'total_engagements': total_engagements,
+            'avg_engagement_rate': round(avg_engagement_rate, 2),
+            'best_post': best_post_data,
+            'worst_post': worst_post_data,
+            'engagement_by_type': dict(engagement_by_type),
+            'time_range': time_range
+        }
+
+    def refresh_daily_rollup(self, since: Optional[datetime] = None) -> int:
+        """
+        Recompute PostAnalyticsDaily rows for recently published posts
+
+        Aggregates each post's latest snapshot by user and publish day and
+        upserts the result. Whole days are recomputed, starting at the
+        beginning of the day containing `since`.
+
+        Args:
+            since: Recompute days from this time on (default: last 48 hours)
+
+        Returns:
+            Number of daily rows written
+        """
+        if since is None:
+            since = _utcnow() - DAILY_ROLLUP_WINDOW
+        day_start = datetime.combine(since.date(), dt_time.min)
+
+        session = self.db_manager.get_session()
+
+        try:
+            latest_snapshot = self._latest_snapshot_subquery(session)
+
+            impressions = func.coalesce(PostAnalytics.impressions, 0)
+            engagements = (
+                func.coalesce(PostAnalytics.likes, 0) +
+                func.coalesce(PostAnalytics.retweets, 0) +
+                func.coalesce(PostAnalytics.comments, 0) +
+                func.coalesce(PostAnalytics.shares, 0)
+            )
+            engagement_rate = case(
+                (PostAnalytics.impressions > 0, engagements * 100.0 / PostAnalytics.impressions),
+                else_=None
+            )
+            publish_day = func.date(Post.published_time)
+
+            rows = session.query(
+                Post.user_id,
+                publish_day.label('day'),
+                func.count(Post.id).label('posts_count'),
+                func.sum(impressions).label('impressions_sum'),
+                func.sum(engagements).label('engagements_sum'),
+                func.sum(engagement_rate).label('engagement_rate_sum'),
+                func.count(engagement_rate).label('engagement_rate_count')
+            ).outerjoin(
+                latest_snapshot, latest_snapshot.c.post_id == Post.id
+            ).outerjoin(
+                PostAnalytics,
+                and_(
+                    PostAnalytics.post_id == Post.id,
+                    PostAnalytics.snapshot_time == latest_snapshot.c.snapshot_time
+                )
+            ).filter(
+                and_(
+                    Post.status == PostStatus.PUBLISHED,
+                    Post.published_time >= day_start
+                )
+            ).group_by(Post.user_id, publish_day).all()
+
+            now = _utcnow()
+            mappings = [
+                {
+                    'user_id': row.user_id,
+                    # SQLite returns DATE() as an ISO string
+                    'day': date.fromisoformat(row.day) if isinstance(row.day, str) else row.day,
+                    'posts_count': row.posts_count,
+                    'impressions_sum': int(row.impressions_sum or 0),
+                    'engagements_sum': int(row.engagements_sum or 0),
+                    'engagement_rate_sum': float(row.engagement_rate_sum or 0.0),
+                    'engagement_rate_count': row.engagement_rate_count,
+                    'updated_at': now
+                }
+                for row in rows
+            ]
+
+            self._upsert_daily_rollup(session, mappings)
+            session.commit()
+
             self.logger.info(
-                f"User {user_id} analytics: {total_posts} posts, "
-                f"{total_engagements} engagements, {avg_engagement_rate:.2f}% avg rate"
+                f"Refreshed {len(mappings)} daily rollup rows since {day_start.date().isoformat()}"
             )
 
-            return summary
+            return len(mappings)
 
         except Exception as e:
-            self.logger.error(f"Error getting user analytics summary: {str(e)}")
+            self.logger.error(f"Error refreshing daily rollup: {str(e)}")
+            session.rollback()
+            return 0
+        finally:
+            session.close()
+
+    @staticmethod
+    def _upsert_daily_rollup(session: Session, mappings: List[Dict]):
+        """Insert or update PostAnalyticsDaily rows keyed by (user_id, day)"""
+        AnalyticsCollector._upsert_rows(
+            session, PostAnalyticsDaily, mappings, ('user_id', 'day'),
+            ('posts_count', 'impressions_sum', 'engagements_sum',
+             'engagement_rate_sum', 'engagement_rate_count', 'updated_at')
+        )
+
+    @staticmethod
+    def _upsert_rows(
+        session: Session,
+        model,
+        mappings: List[Dict],
+        key_columns: Tuple[str, ...],
+        update_columns: Tuple[str, ...]
+    ):
+        """
+        Insert rows, updating existing ones that match on key_columns
+
+        SQLite and PostgreSQL get one INSERT ... ON CONFLICT DO UPDATE per
+        UPSERT_BATCH_SIZE rows; other dialects delete matching rows and
+        bulk insert.
+
+        Args:
+            session: Database session
+            model: Mapped class whose table has a unique key on key_columns
+            mappings: Column values per row
+            key_columns: Columns of the unique key
+            update_columns: Columns overwritten on conflict
+        """
+        if not mappings:
+            return
+
+        dialect = session.get_bind().dialect.name
+        dialect_insert = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}.get(dialect)
+
+        if dialect_insert is None:
+            # Portable fallback: replace the conflicting rows
+            for mapping in mappings:
+                session.query(model).filter_by(
+                    **{column: mapping[column] for column in key_columns}
+                ).delete(synchronize_session=False)
+            session.bulk_insert_mappings(model, mappings)
+            return
+
+        for start in range(0, len(mappings), UPSERT_BATCH_SIZE):
+            stmt = dialect_insert(model).values(mappings[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={column: stmt.excluded[column] for column in update_columns}
+            )
+            session.execute(stmt)
+
+    def get_daily_rollup_summary(
+        self,
+        user_id: int,
+        start_day: date,
+        end_day: date
+    ) -> Dict:
+        """
+        Get summary totals for a user from the daily rollup table
+
+        Reads at most one row per day instead of every post and snapshot.
+        Figures are as fresh as the last refresh_daily_rollup run.
+
+        Args:
+            user_id: User ID
+            start_day: First publish day (inclusive)
+            end_day: Last publish day (inclusive)
+
+        Returns:
+            Dict with total_posts, total_impressions, total_engagements,
+            avg_engagement_rate and time_range
+        """
+        session = self.db_manager.get_session()
+
+        try:
+            totals = session.query(
+                func.coalesce(func.sum(PostAnalyticsDaily.posts_count), 0),
+                func.coalesce(func.sum(PostAnalyticsDaily.impressions_sum), 0),
+                func.coalesce(func.sum(PostAnalyticsDaily.engagements_sum), 0),
+                func.sum(PostAnalyticsDaily.engagement_rate_sum),
+                func.sum(PostAnalyticsDaily.engagement_rate_count)
+            ).filter(
+                and_(
+                    PostAnalyticsDaily.user_id == user_id,
+                    PostAnalyticsDaily.day >= start_day,
+                    PostAnalyticsDaily.day <= end_day
+                )
+            ).one()
+
+            total_posts, total_impressions, total_engagements, rate_sum, rate_count = totals
+            avg_engagement_rate = (rate_sum / rate_count) if rate_count else 0.0
+
+            return {
+                'total_posts': int(total_posts),
+                'total_impressions': int(total_impressions),
+                'total_engagements': int(total_engagements),
+                'avg_engagement_rate': round(avg_engagement_rate, 2),
+                'time_range': {
+                    'start': start_day.isoformat(),
+                    'end': end_day.isoformat()
+                }
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error reading daily rollup summary: {str(e)}")
             return {
                 'error': str(e),
                 'total_posts': 0,
@@ -530,91 +1026,73 @@ class AnalyticsCollector:
 
         try:
             # Get all published posts from last 90 days
-            cutoff_date = datetime.utcnow() - timedelta(days=90)
+            cutoff_date = _utcnow() - timedelta(days=90)
 
-            posts = session.query(Post).filter(
+            # Latest analytics snapshot per post
+            latest_snapshot = self._latest_snapshot_subquery(session)
+
+            engagements = (
+                func.coalesce(PostAnalytics.likes, 0) +
+                func.coalesce(PostAnalytics.retweets, 0) +
+                func.coalesce(PostAnalytics.comments, 0) +
+                func.coalesce(PostAnalytics.shares, 0)
+            )
+            # EXTRACT(dow) is 0=Sunday on both SQLite and PostgreSQL
+            dow = extract('dow', Post.published_time)
+            hour = extract('hour', Post.published_time)
+
+            # Group by day of week and hour in a single aggregate query
+            rows = session.query(
+                dow.label('dow'),
+                hour.label('hour'),
+                func.avg(engagements * 100.0 / PostAnalytics.impressions).label('avg_engagement_rate'),
+                func.count(Post.id).label('posts_count'),
+                func.sum(PostAnalytics.impressions).label('total_impressions'),
+                func.sum(engagements).label('total_engagements')
+            ).join(
+                latest_snapshot, latest_snapshot.c.post_id == Post.id
+            ).join(
+                PostAnalytics,
+                and_(
+                    PostAnalytics.post_id == Post.id,
+                    PostAnalytics.snapshot_time == latest_snapshot.c.snapshot_time
+                )
+            ).filter(
                 and_(
                     Post.user_id == user_id,
                     Post.status == PostStatus.PUBLISHED,
-                    Post.published_time >= cutoff_date
+                    Post.published_time >= cutoff_date,
+                    PostAnalytics.impressions > 0
                 )
-            ).all()
-
-            if not posts:
-                self.logger.info(f"No published posts found for user {user_id}")
+            ).group_by(
+                dow, hour
+            ).having(
+                func.count(Post.id) >= 2  # Require at least 2 posts for statistical relevance
+            ).order_by(
+                func.avg(engagements * 100.0 / PostAnalytics.impressions).desc()
+            ).limit(10).all()
+
+            if not rows:
+                self.logger.info(f"No posting time data found for user {user_id}")
                 return []
 
-            # Group by day of week and hour
-            time_slot_metrics = defaultdict(lambda: {
-                'engagement_rates': [],
-                'impressions': [],
-                'engagements': [],
-                'posts': []
-            })
-
-            for post in posts:
-                if not post.published_time:
-                    continue
-
-                # Get analytics
-                analytics = session.query(PostAnalytics).filter(
-                    PostAnalytics.post_id == post.id
-                ).order_by(PostAnalytics.snapshot_time.desc()).first()
-
-                if not analytics or not analytics.impressions:
-                    continue
-
-                # Extract time components
-                pub_time = post.published_time
-                day_of_week = pub_time.weekday()  # 0=Monday, 6=Sunday
-                hour = pub_time.hour
-
-                time_slot = (day_of_week, hour)
-
-                # Calculate metrics
-                impressions = analytics.impressions or 0
-                engagements = (
-                    (analytics.likes or 0) +
-                    (analytics.retweets or 0) +
-                    (analytics.comments or 0) +
-                    (analytics.shares or 0)
-                )
-
-                engagement_rate = 0.0
-                if impressions > 0:
-                    engagement_rate = (engagements / impressions) * 100
-
-                # Store metrics
-                time_slot_metrics[time_slot]['engagement_rates'].append(engagement_rate)
-                time_slot_metrics[time_slot]['impressions'].append(impressions)
-                time_slot_metrics[time_slot]['engagements'].append(engagements)
-                time_slot_metrics[time_slot]['posts'].append(post.id)
-
-            # Calculate averages for each time slot
             day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
             time_slot_results = []
-            for (day_of_week, hour), metrics in time_slot_metrics.items():
-                if len(metrics['posts']) >= 2:  # Require at least 2 posts for statistical relevance
-                    avg_engagement_rate = mean(metrics['engagement_rates'])
-                    total_impressions = sum(metrics['impressions'])
-                    total_engagements = sum(metrics['engagements'])
-
-                    time_slot_results.append({
-                        'day_of_week': day_of_week,
-                        'day_name': day_names[day_of_week],
-                        'hour': hour,
-                        'avg_engagement_rate': round(avg_engagement_rate, 2),
-                        'posts_count': len(metrics['posts']),
-                        'total_impressions': total_impressions,
-                        'total_engagements': total_engagements
-                    })
-
-            # Sort by engagement rate
-            time_slot_results.sort(key=lambda x: x['avg_engagement_rate'], reverse=True)
-
-            # Return top 10 time slots
-            top_times = time_slot_results[:10]
+            for row in rows:
+                day_of_week = (int(row.dow) + 6) % 7  # 0=Monday, 6=Sunday
+                time_slot_results.append({
+                    'day_of_week': day_of_week,
+                    'day_name': day_names[day_of_week],
+                    'hour': int(row.hour),
+                    'avg_engagement_rate': round(float(row.avg_engagement_rate), 2),
+                    'posts_count': row.posts_count,
+                    'total_impressions': int(row.total_impressions),
+                    'total_engagements': int(row.total_engagements)
+                })
+
+            # Top 10 time slots, already sorted by engagement rate
+            top_times = time_slot_results
 
             self.logger.info(
                 f"Identified {len(top_times)} optimal posting times for user {user_id}"
@@ -652,7 +1130,8 @@ class AnalyticsCollector:
 
         try:
             # Get analytics snapshots from last 30 days
-            cutoff_date = datetime.utcnow() - timedelta(days=30)
+            now = _utcnow()
+            cutoff_date = now - timedelta(days=30)
 
             analytics_records = session.query(Analytics).filter(
                 and_(
@@ -665,7 +1144,7 @@ class AnalyticsCollector:
             latest = analytics_records[0] if analytics_records else None
 
             # Calculate 7-day metrics
-            seven_days_ago = datetime.utcnow() - timedelta(days=7)
+            seven_days_ago = now - timedelta(days=7)
             recent_analytics = [a for a in analytics_records if a.snapshot_date >= seven_days_ago]
 
             profile_views_7d = sum(a.profile_views or 0 for a in recent_analytics)
@@ -718,7 +1197,8 @@ class AnalyticsCollector:
         Generate comprehensive weekly analytics report
 
         Combines all analytics into a single comprehensive report
-        for the past 7 days.
+        for the past 7 days. Reports are memoized until the user's data
+        changes or WEEKLY_REPORT_CACHE_TTL elapses.
 
         Args:
             user_id: User ID
@@ -736,21 +1216,35 @@ class AnalyticsCollector:
         session = self.db_manager.get_session()
 
         try:
+            cache_key = ('weekly', user_id, self._data_version_token(session, user_id))
+            cached = self._get_cached_report(cache_key, ttl=WEEKLY_REPORT_CACHE_TTL)
+            if cached is not None:
+                return cached
+
             # Define date ranges
-            end_date = datetime.utcnow()
+            end_date = _utcnow()
             start_date = end_date - timedelta(days=7)
             prev_start_date = start_date - timedelta(days=7)
 
-            # Get current week analytics
-            current_week = self.get_user_analytics_summary(
-                user_id,
-                date_range=(start_date, end_date)
+            # Load both weeks' posts with their latest snapshots in one query
+            post_snapshots = self._latest_post_snapshots(
+                session, user_id, prev_start_date, end_date
             )
+            current_posts = [
+                (post, analytics) for post, analytics in post_snapshots
+                if post.published_time >= start_date
+            ]
+            previous_posts = [
+                (post, analytics) for post, analytics in post_snapshots
+                if post.published_time <= start_date
+            ]
+
+            # Get current week analytics
+            current_week = self._summarize_post_snapshots(current_posts, start_date, end_date)
 
             # Get previous week for comparison
-            previous_week = self.get_user_analytics_summary(
-                user_id,
-                date_range=(prev_start_date, start_date)
+            previous_week = self._summarize_post_snapshots(
+                previous_posts, prev_start_date, start_date
             )
 
             # Calculate trends
@@ -772,35 +1266,27 @@ class AnalyticsCollector:
                     ) * 100
                     trends['engagement_change_pct'] = round(engagement_change_pct, 2)
 
-            # Get top 5 posts this week
-            posts = session.query(Post).filter(
-                and_(
-                    Post.user_id == user_id,
-                    Post.status == PostStatus.PUBLISHED,
-                    Post.published_time >= start_date,
-                    Post.published_time <= end_date
-                )
-            ).all()
-
-            top_posts = []
-            for post in posts:
-                analytics = session.query(PostAnalytics).filter(
-                    PostAnalytics.post_id == post.id
-                ).order_by(PostAnalytics.snapshot_time.desc()).first()
-
-                if analytics:
-                    top_posts.append({
-                        'post_id': post.id,
-                        'content': post.content[:100] + '...' if len(post.content) > 100 else post.content,
-                        'content_type': post.content_type.value if post.content_type else 'unknown',
-                        'impressions': analytics.impressions or 0,
-                        'engagement_rate': analytics.engagement_rate or 0.0,
-                        'weighted_score': analytics.weighted_engagement_score or 0.0,
-                        'published_at': post.published_time.isoformat() if post.published_time else None
-                    })
-
-            top_posts.sort(key=lambda x: x['weighted_score'], reverse=True)
-            top_posts = top_posts[:5]
+            # Get top posts this week (only the top entries are formatted)
+            scored_posts = [
+                (post, analytics) for post, analytics in current_posts if analytics
+            ]
+            top_scored = heapq.nlargest(
+                TOP_POSTS_LIMIT,
+                scored_posts,
+                key=lambda pair: pair[1].weighted_engagement_score or 0.0
+            )
+            top_posts = [
+                {
+                    'post_id': post.id,
+                    'content': post.content[:100] + '...' if len(post.content) > 100 else post.content,
+                    'content_type': post.content_type.value if post.content_type else 'unknown',
+                    'impressions': analytics.impressions or 0,
+                    'engagement_rate': analytics.engagement_rate or 0.0,
+                    'weighted_score': analytics.weighted_engagement_score or 0.0,
+                    'published_at': post.published_time.isoformat() if post.published_time else None
+                }
+                for post, analytics in top_scored
+            ]
 
             # Get best posting times
             best_times = self.identify_best_posting_times(user_id)[:5]
@@ -833,11 +1319,13 @@ class AnalyticsCollector:
                 'recruiter_metrics': recruiter_metrics,
                 'trends': trends,
                 'recommendations': recommendations,
-                'generated_at': datetime.utcnow().isoformat()
+                'generated_at': end_date.isoformat()
             }
 
             self.logger.info(f"Generated weekly report for user {user_id}")
 
+            self._store_cached_report(cache_key, report)
+
             return report
 
         except Exception as e:
@@ -845,7 +1333,7 @@ class AnalyticsCollector:
             return {
                 'error': str(e),
                 'summary': {},
-                'generated_at': datetime.utcnow().isoformat()
+                'generated_at': _utcnow().isoformat()
             }
         finally:
             session.close()
@@ -938,7 +1426,8 @@ class AnalyticsCollector:
                     self.logger.warning(f"Failed to fetch user metrics: {str(e)}")
 
             # Get posts published this week
-            week_ago = datetime.utcnow() - timedelta(days=7)
+            now = _utcnow()
+            week_ago = now - timedelta(days=7)
             posts_this_week = session.query(Post).filter(
                 and_(
                     Post.user_id == user_id,
@@ -950,14 +1439,14 @@ class AnalyticsCollector:
             # Calculate average engagement rate
             week_summary = self.get_user_analytics_summary(
                 user_id,
-                date_range=(week_ago, datetime.utcnow())
+                date_range=(week_ago, now)
             )
 
             # Create analytics snapshot
             analytics = Analytics(
                 user_id=user_id,
                 platform=platform,
-                snapshot_date=datetime.utcnow(),
+                snapshot_date=now,
                 profile_views=user_metrics.get('profile_views', 0),
                 connections_new=0,  # Not available from Twitter
                 search_appearances=0,  # Not available from Twitter
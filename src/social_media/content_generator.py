@@ -6,9 +6,9 @@ Generates authentic, recruiter-friendly content using Claude API
 import re
 from typing import Dict, List, Optional
 from datetime import datetime
-import anthropic
 
-from config.settings import ANTHROPIC_API_KEY, MODEL_MODE
+from config.settings import MODEL_MODE, get_api_key
+from src.api_clients import get_anthropic_client
 from utils.logger import get_logger
 from .models import ContentType, Platform
 
@@ -48,7 +48,7 @@ class ContentGenerator:
         self.model_mode = model_mode or MODEL_MODE
 
         if self.model_mode == "api":
-            self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+            self.client = get_anthropic_client(get_api_key("api"))
             self.model = "claude-sonnet-4-5"  # Claude Sonnet 4.5
         elif self.model_mode == "grok":
             from src.grok_handler import GrokHandler
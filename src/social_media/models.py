@@ -6,14 +6,21 @@ SQLAlchemy models for LinkedIn and X (Twitter) automation
 from datetime import datetime
 from sqlalchemy import (
     create_engine, Column, Integer, String, Text, DateTime,
-    Boolean, Float, Enum as SQLEnum, ForeignKey, JSON
+    Boolean, Float, Enum as SQLEnum, ForeignKey, JSON, Index, Date, UniqueConstraint
 )
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
 from cryptography.fernet import Fernet
 import os
 import enum
 
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 Base = declarative_base()
 
 
@@ -92,6 +99,10 @@ class OAuthToken(Base):
 class Post(Base):
     """Social media post tracking"""
     __tablename__ = "sm_posts"
+    __table_args__ = (
+        # Per-user time-window scans in analytics reports
+        Index("ix_sm_posts_user_published", "user_id", "published_time"),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("sm_users.id"), nullable=False)
@@ -112,6 +123,9 @@ class Post(Base):
     external_post_id = Column(String(255))  # Twitter ID, LinkedIn URN, etc.
     external_url = Column(String(500))
 
+    # Hash of the last collected platform metrics (skips unchanged snapshots)
+    last_metric_hash = Column(String(16))
+
     # Error handling
     error_message = Column(Text)
     retry_count = Column(Integer, default=0)
@@ -138,6 +152,10 @@ class Post(Base):
 class PostAnalytics(Base):
     """Detailed analytics for each post"""
     __tablename__ = "sm_post_analytics"
+    __table_args__ = (
+        # Latest-snapshot-per-post lookups and snapshot upserts
+        UniqueConstraint("post_id", "snapshot_time", name="uq_sm_post_analytics_post_snapshot"),
+    )
 
     id = Column(Integer, primary_key=True)
     post_id = Column(Integer, ForeignKey("sm_posts.id"), nullable=False)
@@ -168,6 +186,28 @@ class PostAnalytics(Base):
     post = relationship("Post", back_populates="analytics")
 
 
+class PostAnalyticsDaily(Base):
+    """Daily per-user rollup of latest post snapshots, keyed by publish date"""
+    __tablename__ = "sm_post_analytics_daily"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_sm_post_analytics_daily_user_day"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("sm_users.id"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    posts_count = Column(Integer, default=0)
+    impressions_sum = Column(Integer, default=0)
+    engagements_sum = Column(Integer, default=0)
+
+    # Sum and count of per-post engagement rates (posts with impressions only)
+    engagement_rate_sum = Column(Float, default=0.0)
+    engagement_rate_count = Column(Integer, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class Analytics(Base):
     """User-level analytics snapshots"""
     __tablename__ = "sm_analytics"
@@ -332,11 +372,26 @@ class OAuthState(Base):
 
 # Database utility functions
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL journaling for file-based SQLite connections"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class DatabaseManager:
     """Manages database connection and operations"""
 
-    def __init__(self, database_url: str = None):
-        """Initialize database manager"""
+    def __init__(self, database_url: str = None, **engine_kwargs):
+        """
+        Initialize database manager
+
+        In-memory SQLite databases share one connection (StaticPool) so
+        every session sees the same data. File-based SQLite databases use
+        WAL journaling with synchronous=NORMAL. Extra keyword arguments
+        are passed to create_engine and override these defaults.
+        """
         if database_url is None:
             # Default to SQLite for development
             database_url = os.getenv(
@@ -344,12 +399,73 @@ class DatabaseManager:
                 "sqlite:///social_media_automation.db"
             )
 
-        self.engine = create_engine(database_url)
+        url = make_url(database_url)
+        is_sqlite = url.get_backend_name() == "sqlite"
+        in_memory = is_sqlite and url.database in (None, "", ":memory:")
+
+        if in_memory:
+            engine_kwargs.setdefault("poolclass", StaticPool)
+            engine_kwargs.setdefault("connect_args", {"check_same_thread": False})
+
+        self.engine = create_engine(database_url, **engine_kwargs)
+
+        if is_sqlite and not in_memory:
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def create_tables(self):
-        """Create all tables"""
+        """Create all tables and bring tables from older versions up to date"""
         Base.metadata.create_all(self.engine)
+        self._migrate_schema()
+
+    def _migrate_schema(self):
+        """
+        Apply additive schema changes that create_all does not make to existing tables
+
+        Each step checks the live schema first, so running it again is a no-op.
+        """
+        inspector = inspect(self.engine)
+
+        post_columns = {column["name"] for column in inspector.get_columns("sm_posts")}
+        if "last_metric_hash" not in post_columns:
+            with self.engine.begin() as conn:
+                conn.execute(text("ALTER TABLE sm_posts ADD COLUMN last_metric_hash VARCHAR(16)"))
+
+        # create_all only indexes tables it creates
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_sm_posts_user_published ON sm_posts (user_id, published_time)"
+            ))
+
+        # Snapshot upserts use (post_id, snapshot_time) as their ON CONFLICT target
+        snapshot_key = ["post_id", "snapshot_time"]
+        has_snapshot_key = any(
+            constraint["column_names"] == snapshot_key
+            for constraint in inspector.get_unique_constraints("sm_post_analytics")
+        ) or any(
+            index["unique"] and index["column_names"] == snapshot_key
+            for index in inspector.get_indexes("sm_post_analytics")
+        )
+        if not has_snapshot_key:
+            old_indexes = {index["name"] for index in inspector.get_indexes("sm_post_analytics")}
+            logger.info("Migrating sm_post_analytics: adding unique (post_id, snapshot_time) key")
+            with self.engine.begin() as conn:
+                # Keep the newest row of any duplicated snapshot before enforcing uniqueness
+                removed = conn.execute(text(
+                    "DELETE FROM sm_post_analytics WHERE id NOT IN "
+                    "(SELECT MAX(id) FROM sm_post_analytics GROUP BY post_id, snapshot_time)"
+                )).rowcount
+                if removed:
+                    logger.warning(
+                        f"Removed {removed} duplicate analytics snapshot row(s), keeping the newest of each"
+                    )
+                if "ix_sm_post_analytics_post_snapshot" in old_indexes:
+                    conn.execute(text("DROP INDEX ix_sm_post_analytics_post_snapshot"))
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX uq_sm_post_analytics_post_snapshot "
+                    "ON sm_post_analytics (post_id, snapshot_time)"
+                ))
 
     def get_session(self):
         """Get database session"""
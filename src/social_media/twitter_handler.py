@@ -17,6 +17,9 @@ from utils.exceptions import AuthenticationError, RateLimitError
 
 logger = get_logger(__name__)
 
+# Twitter API v2 GET /2/tweets accepts at most 100 ids per request
+TWEET_LOOKUP_BATCH_SIZE = 100
+
 
 class TwitterHandler:
     """
@@ -241,6 +244,48 @@ class TwitterHandler:
             logger.error(f"Failed to get tweet metrics: {str(e)}")
             return {}
 
+    @exponential_backoff_retry(max_retries=3)
+    def get_tweets_metrics(self, tweet_ids: List[str]) -> Dict[str, Dict]:
+        """Get engagement metrics for up to 100 tweets in one request
+
+        Args:
+            tweet_ids: Twitter tweet IDs (at most TWEET_LOOKUP_BATCH_SIZE)
+
+        Returns:
+            Dict mapping tweet ID to the same metrics dict returned by
+            get_tweet_metrics. Tweets missing from the response are omitted.
+        """
+        if len(tweet_ids) > TWEET_LOOKUP_BATCH_SIZE:
+            raise ValueError(
+                f"At most {TWEET_LOOKUP_BATCH_SIZE} tweet IDs per lookup, got {len(tweet_ids)}"
+            )
+
+        try:
+            tweets = self.client.get_tweets(
+                tweet_ids,
+                tweet_fields=['public_metrics', 'created_at'],
+                user_auth=True
+            )
+
+            results = {}
+            for tweet in tweets.data or []:
+                metrics = tweet.public_metrics
+                results[str(tweet.id)] = {
+                    'tweet_id': str(tweet.id),
+                    'likes': metrics.get('like_count', 0),
+                    'retweets': metrics.get('retweet_count', 0),
+                    'replies': metrics.get('reply_count', 0),
+                    'quotes': metrics.get('quote_count', 0),
+                    'impressions': metrics.get('impression_count', 0),
+                    'created_at': tweet.created_at
+                }
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to get metrics for {len(tweet_ids)} tweets: {str(e)}")
+            return {}
+
     @exponential_backoff_retry(max_retries=3)
     def get_user_metrics(self) -> Dict:
         """Get authenticated user's profile metrics
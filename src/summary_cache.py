@@ -0,0 +1,250 @@
+"""
+Summary Cache
+Disk-backed cache of comprehensive summaries so re-processing the same
+PDF set with the same settings returns instantly instead of re-running
+the full LLM analysis
+"""
+
+import hashlib
+import json
+import pickle
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config.settings import (
+    SUMMARY_CACHE_DIR,
+    SUMMARY_CACHE_FINGERPRINT_CHARS,
+    SUMMARY_CACHE_MAX_ENTRIES,
+    SUMMARY_CACHE_SIMILARITY_THRESHOLD
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SummaryCache:
+    """
+    Two-tier cache for summary_data dictionaries
+
+    - Exact tier: keyed on the content hashes of all PDFs plus model mode,
+      report mode and focus areas
+    - Similarity tier (opt-in): entries with identical settings, the same
+      number of documents with the same page counts, and every document's
+      content fingerprint within the configured cosine threshold of one in
+      the cached set
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        cache_dir: Path = SUMMARY_CACHE_DIR,
+        max_entries: int = SUMMARY_CACHE_MAX_ENTRIES,
+        similarity_threshold: float = SUMMARY_CACHE_SIMILARITY_THRESHOLD
+    ):
+        """
+        Initialize summary cache
+
+        Args:
+            cache_dir: Directory holding cached summaries
+            max_entries: Maximum number of cached summaries to keep
+            similarity_threshold: Minimum cosine similarity for a similarity hit
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        self.index = self._load_index()
+
+    @staticmethod
+    def settings_key(model_mode: str, report_mode: str, focus_areas: Optional[List[str]]) -> str:
+        """Stable key for the analysis settings part of a cache entry"""
+        return f"{model_mode}||{report_mode}||{repr(focus_areas)}"
+
+    @staticmethod
+    def make_key(
+        documents_data: List[Dict],
+        model_mode: str,
+        report_mode: str,
+        focus_areas: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build the exact-match cache key
+
+        Args:
+            documents_data: Processed PDF data (uses 'content_hash' when present)
+            model_mode: Model mode (include the local model name for local mode)
+            report_mode: "quick" or "full"
+            focus_areas: Optional focus areas
+
+        Returns:
+            Hex digest cache key
+        """
+        doc_hashes = sorted(
+            d.get('content_hash') or f"{d.get('doc_name', '')}:{d.get('total_pages', 0)}"
+            for d in documents_data
+        )
+        hasher = hashlib.sha256()
+        hasher.update("||".join(doc_hashes).encode())
+        hasher.update(SummaryCache.settings_key(model_mode, report_mode, focus_areas).encode())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def page_counts(documents_data: List[Dict]) -> List[int]:
+        """Sorted page counts of a document set; similarity hits must match them exactly"""
+        return sorted(int(d.get('total_pages') or len(d.get('pages') or [])) for d in documents_data)
+
+    @staticmethod
+    def fingerprint_texts(documents_data: List[Dict]) -> Optional[List[str]]:
+        """
+        Per-document text for the similarity tier: title plus the start of the first page
+
+        File names are not used, since unrelated PDFs often share names like
+        "paper.pdf". Returns None when a document has no title or first-page
+        text, so such sets are only served by the exact tier.
+        """
+        texts = []
+        for doc in documents_data:
+            title = ((doc.get('metadata') or {}).get('title') or "").strip()
+            pages = doc.get('pages') or []
+            first_page = (pages[0].get('text') or "")[:SUMMARY_CACHE_FINGERPRINT_CHARS].strip() if pages else ""
+            if not first_page:
+                return None
+            texts.append(f"{title}\n{first_page}" if title else first_page)
+        return texts
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up an exact cache entry
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached summary data or None
+        """
+        if key not in self.index:
+            return None
+        return self._read_entry(key)
+
+    def find_similar(
+        self,
+        settings_key: str,
+        embeddings: List[List[float]],
+        page_counts: List[int]
+    ) -> Optional[Dict]:
+        """
+        Find the closest cached summary of a near-identical document set
+
+        A cached set matches only with identical settings and page counts, and
+        when every document on either side has a counterpart at or above the
+        threshold; the set's score is its weakest such match.
+
+        Args:
+            settings_key: Key from settings_key()
+            embeddings: Normalized per-document fingerprint embeddings
+            page_counts: Sorted page counts from page_counts()
+
+        Returns:
+            Cached summary data or None if nothing is above the threshold
+        """
+        query = np.asarray(embeddings, dtype=np.float32)
+        best_key, best_score = None, self.similarity_threshold
+
+        for key, entry in self.index.items():
+            if (entry.get('settings') != settings_key or not entry.get('embeddings')
+                    or entry.get('page_counts') != page_counts):
+                continue
+            sims = query @ np.asarray(entry['embeddings'], dtype=np.float32).T
+            score = float(min(sims.max(axis=1).min(), sims.max(axis=0).min()))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        logger.info(f"Summary cache similarity hit ({best_score:.3f})")
+        return self._read_entry(best_key)
+
+    def set(
+        self,
+        key: str,
+        summary_data: Dict,
+        settings_key: str = None,
+        embeddings: Optional[List[List[float]]] = None,
+        page_counts: Optional[List[int]] = None
+    ):
+        """
+        Store a summary
+
+        Args:
+            key: Cache key from make_key
+            summary_data: Summary dictionary to cache
+            settings_key: Key from settings_key() (enables the similarity tier)
+            embeddings: Normalized per-document fingerprint embeddings
+            page_counts: Sorted page counts from page_counts()
+        """
+        try:
+            with open(self._entry_path(key), 'wb') as f:
+                pickle.dump(summary_data, f)
+
+            self.index[key] = {
+                'created': time.time(),
+                'settings': settings_key,
+                'embeddings': [[float(x) for x in e] for e in embeddings] if embeddings is not None else None,
+                'page_counts': page_counts
+            }
+            self._cull()
+            self._save_index()
+            logger.info(f"Cached summary {key[:12]}")
+
+        except Exception as e:
+            logger.warning(f"Failed to cache summary: {str(e)}")
+
+    def clear(self):
+        """Remove all cached summaries"""
+        for key in list(self.index):
+            self._entry_path(key).unlink(missing_ok=True)
+        self.index = {}
+        self._save_index()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def _read_entry(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._entry_path(key), 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable summary cache entry {key[:12]}: {str(e)}")
+            self.index.pop(key, None)
+            self._save_index()
+            return None
+
+    def _cull(self):
+        """Evict the oldest entries beyond max_entries"""
+        excess = len(self.index) - self.max_entries
+        if excess <= 0:
+            return
+        oldest = sorted(self.index, key=lambda k: self.index[k].get('created', 0))[:excess]
+        for key in oldest:
+            self._entry_path(key).unlink(missing_ok=True)
+            del self.index[key]
+
+    def _load_index(self) -> Dict:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Summary cache index unreadable, starting fresh: {str(e)}")
+            return {}
+
+    def _save_index(self):
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
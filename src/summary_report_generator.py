@@ -18,7 +18,7 @@ from reportlab.platypus import (
 )
 from reportlab.pdfgen import canvas as pdf_canvas
 
-from config.settings import OUTPUT_DIR
+from config.settings import OUTPUT_DIR, ensure_directories
 from utils.logger import get_logger
 from utils.exceptions import ReportGenerationError
 
@@ -397,6 +397,7 @@ class SummaryReportGenerator:
                 safe_title = safe_title.replace(' ', '_')[:50]
                 output_filename = f"Summary_{safe_title}_{timestamp}.pdf"
 
+            ensure_directories()
             output_path = OUTPUT_DIR / output_filename
 
             # Create PDF document
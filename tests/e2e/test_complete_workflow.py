@@ -13,7 +13,7 @@ import shutil
 class TestCompleteResearchWorkflow:
     """Test complete end-to-end research workflow"""
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     @patch('src.rag_system.FAISS')
     @patch('src.rag_system.HuggingFaceEmbeddings')
     @patch('src.web_search.TavilyClient')
@@ -65,7 +65,7 @@ class TestCompleteResearchWorkflow:
 
         assert final_result is not None
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     @patch('src.rag_system.FAISS')
     @patch('src.rag_system.HuggingFaceEmbeddings')
     @patch('src.web_search.TavilyClient')
@@ -221,7 +221,7 @@ class TestCompleteResearchWorkflow:
         bib = mgr.generate_bibliography()
         assert len(bib) >= 2
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     @patch('src.rag_system.FAISS')
     @patch('src.rag_system.HuggingFaceEmbeddings')
     def test_report_generation_workflow(
@@ -272,7 +272,7 @@ class TestCompleteResearchWorkflow:
         assert 'title' in report_data
         assert 'content' in report_data
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_error_recovery_in_workflow(self, mock_anthropic):
         """Test system handles errors gracefully"""
         from src.multi_agent_system import MultiAgentOrchestrator
@@ -383,7 +383,7 @@ class TestPerformance:
 
         assert num_chunks > 100  # Should create many chunks
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_concurrent_agent_execution(self, mock_anthropic):
         """Test multiple agents can work concurrently"""
         import time
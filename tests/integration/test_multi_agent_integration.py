@@ -13,7 +13,7 @@ from src.multi_agent_system import MultiAgentOrchestrator, WorkerAgent
 class TestMultiAgentOrchestrator:
     """Test multi-agent orchestration"""
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_orchestrator_initialization(self, mock_anthropic):
         """Test orchestrator initialization"""
         mock_client = Mock()
@@ -25,7 +25,7 @@ class TestMultiAgentOrchestrator:
         assert len(orchestrator.workers) == 4
         assert orchestrator.lead_agent_client is not None
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_plan_research_workflow(self, mock_anthropic):
         """Test research workflow planning"""
         mock_client = Mock()
@@ -50,7 +50,7 @@ class TestMultiAgentOrchestrator:
         assert 'subtasks' in plan
         mock_client.messages.create.assert_called_once()
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_distribute_work_to_agents(self, mock_anthropic):
         """Test work distribution to workers"""
         mock_client = Mock()
@@ -72,7 +72,7 @@ class TestMultiAgentOrchestrator:
         assert len(results) == 2
         assert all('result' in r for r in results)
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_synthesize_results(self, mock_anthropic):
         """Test result synthesis by lead agent"""
         mock_client = Mock()
@@ -95,7 +95,7 @@ class TestMultiAgentOrchestrator:
         assert isinstance(final_result, str)
         assert len(final_result) > 0
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_error_handling_in_worker(self, mock_anthropic):
         """Test error handling when worker fails"""
         mock_client = Mock()
@@ -116,7 +116,7 @@ class TestMultiAgentOrchestrator:
 class TestWorkerAgent:
     """Test individual worker agent behavior"""
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_worker_execute_task(self, mock_anthropic):
         """Test worker task execution"""
         mock_client = Mock()
@@ -139,7 +139,7 @@ class TestWorkerAgent:
         assert 'result' in result
         assert isinstance(result['result'], str)
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_worker_retry_on_failure(self, mock_anthropic):
         """Test worker retry logic"""
         mock_client = Mock()
@@ -163,11 +163,50 @@ class TestWorkerAgent:
         assert result is not None
         assert mock_client.messages.create.call_count >= 1
 
+    def test_subtasks_overlap_when_gathered(self):
+        """Test that gathered execute_subtask calls run their blocking LLM calls concurrently"""
+        import asyncio
+        import threading
+        from src.multi_agent_system import ResearchSubtask
+
+        # Every call must be in flight at once to get past the barrier; run
+        # one after another, the first call times out and breaks it
+        all_in_flight = threading.Barrier(4, timeout=5)
+
+        def slow_route_task(**kwargs):
+            all_in_flight.wait()
+            return {
+                "response": "Findings",
+                "cost_info": {"input_tokens": 50, "output_tokens": 25, "total_cost": 0.001}
+            }
+
+        router = Mock()
+        router.route_task.side_effect = slow_route_task
+        rag_system = Mock()
+        rag_system.get_relevant_context.return_value = ("PDF context", [{"doc_name": "paper.pdf"}])
+
+        workers = [WorkerAgent(worker_id=i, router=router, client=Mock()) for i in range(1, 5)]
+        subtasks = [
+            ResearchSubtask(id=i, query=f"Query {i}", focus=f"Focus {i}", required_depth="deep", estimated_tokens=500)
+            for i in range(1, 5)
+        ]
+
+        async def run_all():
+            return await asyncio.gather(*(
+                worker.execute_subtask(subtask, rag_system, [])
+                for worker, subtask in zip(workers, subtasks)
+            ))
+
+        results = asyncio.run(run_all())
+
+        assert [r.findings for r in results] == ["Findings"] * 4
+        assert not all_in_flight.broken
+
 
 class TestEndToEndMultiAgentWorkflow:
     """Test complete multi-agent workflow"""
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     @patch('src.rag_system.RAGSystem')
     def test_full_research_workflow(self, mock_rag, mock_anthropic):
         """Test complete research workflow from query to synthesis"""
@@ -208,7 +247,7 @@ class TestEndToEndMultiAgentWorkflow:
             assert final_result is not None
             assert len(final_result) > 0
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_agent_coordination_with_dependencies(self, mock_anthropic):
         """Test agent coordination when tasks have dependencies"""
         mock_client = Mock()
@@ -232,7 +271,7 @@ class TestEndToEndMultiAgentWorkflow:
         # All tasks should complete
         assert len(results) == 3
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_parallel_processing_performance(self, mock_anthropic):
         """Test that parallel processing is faster than sequential"""
         import time
@@ -268,7 +307,7 @@ class TestEndToEndMultiAgentWorkflow:
 class TestAgentCommunication:
     """Test communication between agents"""
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_context_passing_between_agents(self, mock_anthropic):
         """Test that context is properly passed between agents"""
         mock_client = Mock()
@@ -301,7 +340,7 @@ class TestAgentCommunication:
                 message_text = str(response)
                 assert len(message_text) > 0
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_result_aggregation(self, mock_anthropic):
         """Test proper aggregation of worker results"""
         mock_client = Mock()
@@ -329,7 +368,7 @@ class TestAgentCommunication:
 class TestLoadBalancing:
     """Test load balancing across workers"""
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_even_workload_distribution(self, mock_anthropic):
         """Test that work is evenly distributed"""
         mock_client = Mock()
@@ -358,7 +397,7 @@ class TestLoadBalancing:
         # All tasks should complete
         assert len(results) == 12
 
-    @patch('src.multi_agent_system.anthropic.Anthropic')
+    @patch('src.multi_agent_system.get_anthropic_client')
     def test_handling_worker_failure(self, mock_anthropic):
         """Test system continues when one worker fails"""
         mock_client = Mock()
@@ -387,3 +426,70 @@ class TestLoadBalancing:
 
         # Should have some results despite one failure
         assert len(results) >= 3  # At least 3 out of 4 should succeed
+
+
+class TestStreamingSummaryRouting:
+    """Test incremental (streaming) summary routing"""
+
+    def test_single_agent_stream_yields_sections_before_summary(self):
+        """Test that single-agent streaming yields each section then the final summary"""
+        from src.comprehensive_analyzer import ComprehensiveAnalyzer
+        from src.multi_agent_integration import create_comprehensive_summary_with_routing_stream
+
+        analyzer = ComprehensiveAnalyzer.__new__(ComprehensiveAnalyzer)
+        analyzer._generate_executive_summary = Mock(return_value="Exec summary")
+        analyzer._synthesize_text_only = Mock(side_effect=lambda topic, *args: f"Analysis of {topic}")
+
+        mock_rag = Mock()
+        mock_rag.get_relevant_context.return_value = ("context", [{"doc_name": "a.pdf", "page": 1}])
+
+        events = list(create_comprehensive_summary_with_routing_stream(
+            model_mode="grok",
+            comprehensive_analyzer=analyzer,
+            multi_agent_orchestrator=None,
+            rag_system=mock_rag,
+            documents_data=[{"doc_name": "a.pdf", "pages": [{}]}],
+            focus_areas=["Topic A", "Topic B"]
+        ))
+
+        kinds = [event['kind'] for event in events]
+        assert kinds == ['executive_summary', 'section', 'section', 'summary']
+        assert events[1]['data']['content'] == "Analysis of Topic A"
+
+        summary = events[-1]['data']
+        assert summary['executive_summary'] == "Exec summary"
+        assert [s['title'] for s in summary['detailed_sections']] == ["Topic A", "Topic B"]
+
+    @patch('src.multi_agent_integration._generate_executive_summary_multi_agent')
+    @patch('src.multi_agent_integration.should_use_multi_agent')
+    def test_multi_agent_stream_yields_sections_incrementally(self, mock_should_use, mock_exec_summary):
+        """Test that multi-agent streaming yields one section per focus area"""
+        from src.multi_agent_integration import create_comprehensive_summary_with_routing_stream
+
+        mock_should_use.return_value = True
+        mock_exec_summary.return_value = "Exec summary"
+
+        async def fake_research(query, rag_system, documents_data):
+            return {
+                'synthesis': f"Synthesis for {query}",
+                'sources': [],
+                'total_cost': 0.01,
+                'cost_breakdown': {'planning': 0.0, 'execution': 0.01, 'synthesis': 0.0}
+            }
+
+        orchestrator = Mock()
+        orchestrator.research = fake_research
+
+        events = list(create_comprehensive_summary_with_routing_stream(
+            model_mode="api",
+            comprehensive_analyzer=None,
+            multi_agent_orchestrator=orchestrator,
+            rag_system=Mock(),
+            documents_data=[{"doc_name": "a.pdf", "pages": []}],
+            focus_areas=["Q1", "Q2", "Q3"]
+        ))
+
+        sections = [e['data'] for e in events if e['kind'] == 'section']
+        assert [s['content'] for s in sections] == ["Synthesis for Q1", "Synthesis for Q2", "Synthesis for Q3"]
+        assert events[-1]['kind'] == 'summary'
+        assert events[-1]['data']['total_cost'] == pytest.approx(0.03)
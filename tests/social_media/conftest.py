@@ -186,8 +186,8 @@ def mock_tweepy():
 
 @pytest.fixture
 def mock_anthropic():
-    """Mock Anthropic Claude client"""
-    with patch('anthropic.Anthropic') as mock_client:
+    """Mock the shared Anthropic Claude client used by ContentGenerator"""
+    with patch('src.social_media.content_generator.get_anthropic_client') as mock_client:
         mock_response = MagicMock()
         mock_response.content = [
             MagicMock(text="Here's a tweet about your project:\n\nJust shipped a RAG system with 80% cost savings using prompt caching. Game changer for production AI.")
@@ -24,7 +24,7 @@ from sqlalchemy.orm import Session
 
 from src.social_media.analytics import AnalyticsCollector
 from src.social_media.models import (
-    Post, PostAnalytics, Analytics, User, Platform,
+    Post, PostAnalytics, PostAnalyticsDaily, Analytics, User, Platform,
     PostStatus, ContentType, DatabaseManager
 )
 from src.social_media.twitter_handler import TwitterHandler
@@ -257,6 +257,36 @@ class TestAnalyticsCollector:
 
         assert engagement_rate == 0.0
 
+    def test_calculate_engagement_rates_batch(self, sm_db_manager, sm_session, test_sm_user):
+        """Test batch engagement rates use each post's latest snapshot"""
+        posts = []
+        for i in range(3):
+            post = Post(
+                user_id=test_sm_user.id,
+                platform=Platform.TWITTER,
+                content=f"Test {i}",
+                status=PostStatus.PUBLISHED
+            )
+            sm_session.add(post)
+            posts.append(post)
+        sm_session.flush()
+
+        now = datetime.utcnow()
+        sm_session.add_all([
+            PostAnalytics(post_id=posts[0].id, impressions=1000, likes=5,
+                          snapshot_time=now - timedelta(hours=2)),
+            PostAnalytics(post_id=posts[0].id, impressions=1000, likes=40, comments=5,
+                          retweets=3, shares=2, snapshot_time=now),
+            PostAnalytics(post_id=posts[1].id, impressions=0, likes=10, snapshot_time=now),
+        ])
+        sm_session.commit()
+
+        collector = AnalyticsCollector(sm_db_manager)
+        rates = collector.calculate_engagement_rates([p.id for p in posts])
+
+        # (40 + 5 + 3 + 2) / 1000 * 100 = 5.0; zero impressions and no analytics give 0.0
+        assert rates == {posts[0].id: 5.0, posts[1].id: 0.0, posts[2].id: 0.0}
+
     def test_update_post_analytics_success(self, sm_db_manager, sm_session, test_sm_user):
         """Test successful post analytics update"""
         # Create published post
@@ -322,6 +352,142 @@ class TestAnalyticsCollector:
 
         assert analytics is None
 
+    def test_update_post_analytics_bulk(self, sm_db_manager, sm_session, test_sm_user):
+        """Test bulk analytics update batches API lookups and inserts snapshots"""
+        posts = []
+        for i in range(3):
+            post = Post(
+                user_id=test_sm_user.id,
+                platform=Platform.TWITTER,
+                content=f"Test tweet {i}",
+                status=PostStatus.PUBLISHED,
+                external_post_id=f"10000{i}",
+                published_time=datetime.utcnow() - timedelta(hours=2)
+            )
+            sm_session.add(post)
+            posts.append(post)
+        draft = Post(
+            user_id=test_sm_user.id,
+            platform=Platform.TWITTER,
+            content="Draft tweet",
+            status=PostStatus.DRAFT
+        )
+        sm_session.add(draft)
+        sm_session.commit()
+
+        mock_handler = MagicMock(spec=TwitterHandler)
+        mock_handler.get_tweets_metrics.side_effect = lambda ids: {
+            tweet_id: {'impressions': 1000, 'likes': 10, 'retweets': 5, 'replies': 2, 'quotes': 1}
+            for tweet_id in ids
+        }
+
+        collector = AnalyticsCollector(sm_db_manager, twitter_handler=mock_handler)
+        with patch('src.social_media.analytics.TWEET_LOOKUP_BATCH_SIZE', 2):
+            updated = collector.update_post_analytics_bulk([p.id for p in posts] + [draft.id])
+
+        assert updated == 3
+        assert mock_handler.get_tweets_metrics.call_count == 2
+        mock_handler.get_tweet_metrics.assert_not_called()
+
+        snapshots = sm_session.query(PostAnalytics).all()
+        assert sorted(s.post_id for s in snapshots) == sorted(p.id for p in posts)
+        for snapshot in snapshots:
+            # (10 + 5 + 2 + 1) / 1000 * 100 = 1.8%
+            assert snapshot.engagement_rate == pytest.approx(1.8)
+            # 10*1 + 5*2 + 2*3 + 1*2 = 28
+            assert snapshot.weighted_engagement_score == 28.0
+            assert snapshot.hours_since_published == 2
+
+    def test_update_post_analytics_bulk_upserts_same_snapshot(self, sm_db_manager, sm_session, test_sm_user):
+        """Test re-running bulk update at the same snapshot time updates in place"""
+        post = Post(
+            user_id=test_sm_user.id,
+            platform=Platform.TWITTER,
+            content="Test tweet",
+            status=PostStatus.PUBLISHED,
+            external_post_id="200001",
+            published_time=datetime.utcnow() - timedelta(hours=2)
+        )
+        sm_session.add(post)
+        sm_session.commit()
+
+        mock_handler = MagicMock(spec=TwitterHandler)
+        collector = AnalyticsCollector(sm_db_manager, twitter_handler=mock_handler)
+        snapshot_time = datetime.utcnow()
+
+        with patch('src.social_media.analytics._utcnow', return_value=snapshot_time):
+            for likes in (10, 25):
+                mock_handler.get_tweets_metrics.return_value = {
+                    "200001": {'impressions': 1000, 'likes': likes, 'retweets': 0, 'replies': 0, 'quotes': 0}
+                }
+                assert collector.update_post_analytics_bulk([post.id]) == 1
+
+        snapshots = sm_session.query(PostAnalytics).filter_by(post_id=post.id).all()
+        assert len(snapshots) == 1
+        assert snapshots[0].likes == 25
+        assert snapshots[0].engagement_rate == pytest.approx(2.5)
+
+    def test_in_place_upsert_changes_data_version_token(self, sm_db_manager, sm_session, test_sm_user):
+        """Test cached reports are invalidated when a snapshot is updated in place"""
+        post = Post(
+            user_id=test_sm_user.id,
+            platform=Platform.TWITTER,
+            content="Test tweet",
+            status=PostStatus.PUBLISHED,
+            external_post_id="200002",
+            published_time=datetime.utcnow() - timedelta(hours=2)
+        )
+        sm_session.add(post)
+        sm_session.commit()
+
+        mock_handler = MagicMock(spec=TwitterHandler)
+        collector = AnalyticsCollector(sm_db_manager, twitter_handler=mock_handler)
+        snapshot_time = datetime.utcnow()
+        tokens = []
+
+        with patch('src.social_media.analytics._utcnow', return_value=snapshot_time):
+            for likes in (10, 25):
+                mock_handler.get_tweets_metrics.return_value = {
+                    "200002": {'impressions': 1000, 'likes': likes, 'retweets': 0, 'replies': 0, 'quotes': 0}
+                }
+                collector.update_post_analytics_bulk([post.id])
+                session = sm_db_manager.get_session()
+                tokens.append(collector._data_version_token(session, test_sm_user.id))
+                session.close()
+
+        assert tokens[0] != tokens[1]
+
+    def test_update_post_analytics_bulk_skips_unchanged_metrics(self, sm_db_manager, sm_session, test_sm_user):
+        """Test bulk update writes no snapshot when metrics are unchanged"""
+        post = Post(
+            user_id=test_sm_user.id,
+            platform=Platform.TWITTER,
+            content="Test tweet",
+            status=PostStatus.PUBLISHED,
+            external_post_id="300001",
+            published_time=datetime.utcnow() - timedelta(hours=2)
+        )
+        sm_session.add(post)
+        sm_session.commit()
+
+        mock_handler = MagicMock(spec=TwitterHandler)
+        mock_handler.get_tweets_metrics.return_value = {
+            "300001": {'impressions': 1000, 'likes': 10, 'retweets': 5, 'replies': 2, 'quotes': 1}
+        }
+        collector = AnalyticsCollector(sm_db_manager, twitter_handler=mock_handler)
+
+        assert collector.update_post_analytics_bulk([post.id]) == 1
+        assert collector.update_post_analytics_bulk([post.id]) == 0
+
+        assert sm_session.query(PostAnalytics).filter_by(post_id=post.id).count() == 1
+        assert collector.metric_hash_stats == {'equal_hits': 1, 'cold_misses': 1, 'misses': 0}
+
+    def test_update_post_analytics_bulk_no_handler(self, sm_db_manager):
+        """Test bulk analytics update without Twitter handler"""
+        collector = AnalyticsCollector(sm_db_manager)
+
+        assert collector.update_post_analytics_bulk([1, 2, 3]) == 0
+
     def test_get_user_analytics_summary_no_posts(self, sm_db_manager, test_sm_user):
         """Test analytics summary with no posts"""
         collector = AnalyticsCollector(sm_db_manager)
@@ -413,6 +579,75 @@ class TestAnalyticsCollector:
         # Should only include post2
         assert summary['total_posts'] == 1
 
+    def test_get_user_analytics_summary_memoized_until_new_snapshot(self, sm_db_manager, sm_session, test_sm_user):
+        """Test summary is served from cache until a new analytics snapshot lands"""
+        post = Post(
+            user_id=test_sm_user.id,
+            platform=Platform.TWITTER,
+            content="Cached tweet",
+            status=PostStatus.PUBLISHED,
+            published_time=datetime.utcnow() - timedelta(days=2)
+        )
+        sm_session.add(post)
+        sm_session.commit()
+        sm_session.add(PostAnalytics(post_id=post.id, impressions=100, likes=5))
+        sm_session.commit()
+
+        end_date = datetime.utcnow()
+        date_range = (end_date - timedelta(days=7), end_date)
+
+        collector = AnalyticsCollector(sm_db_manager)
+        first = collector.get_user_analytics_summary(test_sm_user.id, date_range=date_range)
+        second = collector.get_user_analytics_summary(test_sm_user.id, date_range=date_range)
+
+        assert second == first
+        assert collector.cache_stats == {'hits': 1, 'misses': 1}
+
+        # A new snapshot changes the version token and bypasses the cache
+        sm_session.add(PostAnalytics(post_id=post.id, impressions=300, likes=9))
+        sm_session.commit()
+        third = collector.get_user_analytics_summary(test_sm_user.id, date_range=date_range)
+
+        assert third['total_impressions'] == 300
+        assert collector.cache_stats == {'hits': 1, 'misses': 2}
+
+    def test_daily_rollup_matches_summary(self, sm_db_manager, sm_session, test_sm_user):
+        """Test rollup totals match the raw summary and refresh upserts in place"""
+        published = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        for impressions, likes in [(1000, 40), (500, 10), (0, 3)]:
+            post = Post(
+                user_id=test_sm_user.id,
+                platform=Platform.TWITTER,
+                content="Rollup tweet",
+                status=PostStatus.PUBLISHED,
+                published_time=published
+            )
+            sm_session.add(post)
+            sm_session.flush()
+            sm_session.add(PostAnalytics(post_id=post.id, impressions=impressions, likes=likes))
+        sm_session.commit()
+
+        collector = AnalyticsCollector(sm_db_manager)
+        assert collector.refresh_daily_rollup(since=published) == 1
+
+        rollup = collector.get_daily_rollup_summary(
+            test_sm_user.id, published.date(), published.date()
+        )
+        summary = collector.get_user_analytics_summary(
+            test_sm_user.id,
+            date_range=(published - timedelta(hours=1), published + timedelta(hours=1))
+        )
+
+        for key in ('total_posts', 'total_impressions', 'total_engagements', 'avg_engagement_rate'):
+            assert rollup[key] == summary[key]
+        assert rollup['total_posts'] == 3
+        # Only posts with impressions count toward the rate: (4% + 2%) / 2
+        assert rollup['avg_engagement_rate'] == 3.0
+
+        # Re-running updates the existing row instead of adding another
+        assert collector.refresh_daily_rollup(since=published) == 1
+        assert sm_session.query(PostAnalyticsDaily).count() == 1
+
     def test_identify_best_posting_times_no_posts(self, sm_db_manager, test_sm_user):
         """Test best posting times with no posts"""
         collector = AnalyticsCollector(sm_db_manager)
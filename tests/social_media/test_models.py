@@ -15,6 +15,8 @@ Coverage targets:
 import pytest
 from datetime import datetime, timedelta
 from cryptography.fernet import Fernet
+from unittest.mock import patch
+from sqlalchemy import inspect, text
 
 from src.social_media.models import (
     User, Post, PostStatus, Platform, ContentType,
@@ -708,6 +710,60 @@ class TestDatabaseManager:
         assert session is not None
         session.close()
 
+    def test_create_tables_adds_missing_columns(self, sm_temp_db):
+        """Test create_tables upgrades sm_posts columns and indexes from older versions"""
+        manager = DatabaseManager(database_url=sm_temp_db)
+        manager.create_tables()
+        with manager.engine.begin() as conn:
+            conn.execute(text("ALTER TABLE sm_posts DROP COLUMN last_metric_hash"))
+            conn.execute(text("DROP INDEX ix_sm_posts_user_published"))
+
+        manager.create_tables()
+        manager.create_tables()
+
+        session = manager.get_session()
+        assert session.query(Post).count() == 0
+        session.close()
+        index_names = {index["name"] for index in inspect(manager.engine).get_indexes("sm_posts")}
+        assert "ix_sm_posts_user_published" in index_names
+
+    def test_create_tables_dedupes_and_adds_snapshot_key(self, sm_temp_db):
+        """Test create_tables adds the snapshot unique key to older analytics tables"""
+        manager = DatabaseManager(database_url=sm_temp_db)
+        manager.create_tables()
+        with manager.engine.begin() as conn:
+            # Schema of sm_post_analytics before the unique key existed
+            conn.execute(text("DROP TABLE sm_post_analytics"))
+            conn.execute(text(
+                "CREATE TABLE sm_post_analytics (id INTEGER PRIMARY KEY, post_id INTEGER NOT NULL, "
+                "impressions INTEGER, views INTEGER, likes INTEGER, comments INTEGER, shares INTEGER, "
+                "retweets INTEGER, clicks INTEGER, profile_views_after INTEGER, "
+                "connection_requests INTEGER, recruiter_engagements INTEGER, engagement_rate FLOAT, "
+                "weighted_engagement_score FLOAT, snapshot_time DATETIME, hours_since_published INTEGER)"
+            ))
+            conn.execute(text(
+                "INSERT INTO sm_post_analytics (post_id, likes, snapshot_time) VALUES "
+                "(1, 1, '2025-01-01 00:00:00'), (1, 2, '2025-01-01 00:00:00'), (1, 3, '2025-01-02 00:00:00')"
+            ))
+
+        with patch("src.social_media.models.logger") as mock_logger:
+            manager.create_tables()
+            manager.create_tables()
+
+        mock_logger.warning.assert_called_once()
+        assert "Removed 1 duplicate" in mock_logger.warning.call_args.args[0]
+
+        with manager.engine.begin() as conn:
+            likes = conn.execute(text("SELECT likes FROM sm_post_analytics ORDER BY id")).scalars().all()
+            assert likes == [2, 3]
+            conn.execute(text(
+                "INSERT INTO sm_post_analytics (post_id, likes, snapshot_time) "
+                "VALUES (1, 9, '2025-01-02 00:00:00') "
+                "ON CONFLICT (post_id, snapshot_time) DO UPDATE SET likes = excluded.likes"
+            ))
+            likes = conn.execute(text("SELECT likes FROM sm_post_analytics ORDER BY id")).scalars().all()
+        assert likes == [2, 9]
+
     def test_get_session(self, sm_db_manager):
         """Test getting database session"""
         session = sm_db_manager.get_session()
@@ -724,6 +780,26 @@ class TestDatabaseManager:
         session1.close()
         session2.close()
 
+    def test_in_memory_database_shares_connection(self):
+        """Test in-memory SQLite data is visible across sessions"""
+        manager = DatabaseManager(database_url='sqlite://')
+        manager.create_tables()
+
+        session1 = manager.get_session()
+        session1.add(User(username="memory_user", email="memory@example.com"))
+        session1.commit()
+        session1.close()
+
+        session2 = manager.get_session()
+        assert session2.query(User).filter_by(username="memory_user").count() == 1
+        session2.close()
+
+    def test_file_database_uses_wal(self, sm_db_manager):
+        """Test file-based SQLite connections enable WAL journaling"""
+        with sm_db_manager.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
 
 # ==================== TokenEncryption Tests ====================
 
@@ -0,0 +1,39 @@
+"""
+Unit Tests for Shared API Clients
+Tests that Anthropic clients are reused per API key and timeout
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.api_clients import get_anthropic_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Isolate the process-wide client cache"""
+    get_anthropic_client.cache_clear()
+    yield
+    get_anthropic_client.cache_clear()
+
+
+class TestGetAnthropicClient:
+    """Test suite for get_anthropic_client"""
+
+    @patch('src.api_clients.anthropic.Anthropic')
+    def test_same_settings_share_one_client(self, mock_anthropic):
+        """Repeated calls with the same key and timeout construct one client"""
+        first = get_anthropic_client("key", 30)
+        second = get_anthropic_client("key", 30)
+
+        assert first is second
+        mock_anthropic.assert_called_once_with(api_key="key", timeout=30)
+
+    @patch('src.api_clients.anthropic.Anthropic')
+    def test_different_settings_get_separate_clients(self, mock_anthropic):
+        """A different key or timeout gets its own client"""
+        get_anthropic_client("key")
+        get_anthropic_client("other-key")
+        get_anthropic_client("key", 30)
+
+        assert mock_anthropic.call_count == 3
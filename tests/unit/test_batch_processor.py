@@ -0,0 +1,264 @@
+"""
+Unit Tests for Batch Processor
+Tests adaptive polling while waiting for a batch to finish
+"""
+
+import anthropic
+import orjson
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.batch_processor import BatchProcessor
+from utils.exceptions import ClaudeAPIError
+
+
+def _status(state, succeeded=0, errored=0, processing=5):
+    return {
+        "status": state,
+        "request_counts": {
+            "processing": processing,
+            "succeeded": succeeded,
+            "errored": errored,
+            "canceled": 0,
+            "expired": 0
+        }
+    }
+
+
+class FakeClock:
+    """Monotonic clock that only advances when sleep is called"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def processor():
+    """BatchProcessor without a real API client"""
+    with patch("src.batch_processor.get_anthropic_client", return_value=MagicMock()):
+        return BatchProcessor()
+
+
+class TestCreateBatch:
+    """Test suite for BatchProcessor.create_batch"""
+
+    def test_streams_generator_to_jsonl(self, processor, temp_dir):
+        """A generator of requests is written to JSONL and sent to the API once"""
+        processor.client.messages.batches.create.return_value.id = "batch_1"
+        requests = (
+            {"custom_id": f"req_{i}", "params": {"messages": [{"role": "user", "content": str(i)}]}}
+            for i in range(3)
+        )
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir):
+            batch_id = processor.create_batch(requests, "Generated batch")
+
+        assert batch_id == "batch_1"
+        sent = processor.client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in sent] == ["req_0", "req_1", "req_2"]
+
+        jsonl_file = next(temp_dir.glob("batch_requests_*.jsonl"))
+        assert len(jsonl_file.read_text().splitlines()) == 3
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir):
+            assert processor._load_num_requests("batch_1") == 3
+
+    def test_identical_requests_reuse_saved_file(self, processor, temp_dir):
+        """Resubmitting the same requests writes no second JSONL file"""
+        processor.client.messages.batches.create.side_effect = [
+            MagicMock(id="batch_1"), MagicMock(id="batch_2")
+        ]
+        requests = [{"custom_id": "req_0", "params": {"messages": []}}]
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir):
+            processor.create_batch(requests)
+            processor.create_batch(list(requests))
+
+        assert len(list(temp_dir.glob("batch_requests_*.jsonl"))) == 1
+        assert not list(temp_dir.glob("*.tmp"))
+        first = orjson.loads((temp_dir / "batch_metadata_batch_1.json").read_bytes())
+        second = orjson.loads((temp_dir / "batch_metadata_batch_2.json").read_bytes())
+        assert first["content_hash"] == second["content_hash"]
+        assert first["requests_file"] == second["requests_file"]
+
+    def test_failed_serialization_removes_temp_file(self, processor, temp_dir):
+        """A request that cannot be serialized leaves no partial file behind"""
+        requests = [{"custom_id": "req_0", "params": {}}, {"custom_id": "req_1", "params": object()}]
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir):
+            with pytest.raises(ClaudeAPIError):
+                processor.create_batch(requests)
+
+        assert list(temp_dir.iterdir()) == []
+        processor.client.messages.batches.create.assert_not_called()
+
+
+class TestGetBatchStatus:
+    """Test suite for BatchProcessor.get_batch_status"""
+
+    def _batch(self, processing_status):
+        batch = MagicMock()
+        batch.processing_status = processing_status
+        batch.request_counts.processing = 0 if processing_status == "ended" else 1
+        batch.request_counts.succeeded = 1
+        batch.request_counts.errored = 0
+        batch.request_counts.canceled = 0
+        batch.request_counts.expired = 0
+        return batch
+
+    def test_ended_status_served_from_cache(self, processor):
+        """Once a batch has ended its status is not fetched again"""
+        processor.client.messages.batches.retrieve.side_effect = [
+            self._batch("in_progress"), self._batch("ended")
+        ]
+
+        assert processor.get_batch_status("batch_1")["status"] == "in_progress"
+        assert processor.get_batch_status("batch_1")["status"] == "ended"
+        cached = processor.get_batch_status("batch_1")
+        cached["request_counts"]["succeeded"] = 99
+
+        assert processor.get_batch_status("batch_1")["request_counts"]["succeeded"] == 1
+        assert processor.client.messages.batches.retrieve.call_count == 2
+        assert processor.status_cache_stats == {"hits": 2, "misses": 2}
+
+
+class TestGetBatchResults:
+    """Test suite for BatchProcessor.get_batch_results"""
+
+    def _mock_results(self, processor, count):
+        items = []
+        for i in range(count):
+            item = MagicMock()
+            item.model_dump.return_value = {"custom_id": f"req_{i}", "result": {"type": "succeeded"}}
+            items.append(item)
+        processor.client.messages.batches.results.return_value = iter(items)
+
+    def test_results_saved_as_jsonl(self, processor, temp_dir):
+        """Results are returned as a list and written one per line"""
+        self._mock_results(processor, 3)
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir), \
+             patch.object(processor, "get_batch_status", return_value=_status("ended", processing=0)):
+            results = processor.get_batch_results("batch_1")
+
+        assert [r["custom_id"] for r in results] == ["req_0", "req_1", "req_2"]
+        lines = (temp_dir / "batch_results_batch_1.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+
+    def test_stream_yields_lazily(self, processor, temp_dir):
+        """With stream=True nothing is fetched until the iterator is consumed"""
+        self._mock_results(processor, 2)
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir), \
+             patch.object(processor, "get_batch_status", return_value=_status("ended", processing=0)):
+            results = processor.get_batch_results("batch_1", save_to_file=False, stream=True)
+            processor.client.messages.batches.results.assert_not_called()
+
+            assert [r["custom_id"] for r in results] == ["req_0", "req_1"]
+
+        assert not (temp_dir / "batch_results_batch_1.jsonl").exists()
+
+    def test_skip_status_check_fetches_directly(self, processor, temp_dir):
+        """skip_status_check avoids the status call and treats not-ended as no results"""
+        processor.client.messages.batches.results.side_effect = anthropic.AnthropicError(
+            "No `results_url` for the given batch; Has it finished processing? in_progress"
+        )
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir), \
+             patch.object(processor, "get_batch_status") as get_status:
+            results = processor.get_batch_results("batch_1", skip_status_check=True)
+
+        assert results == []
+        get_status.assert_not_called()
+        assert not (temp_dir / "batch_results_batch_1.jsonl").exists()
+
+
+class TestWaitForCompletion:
+    """Test suite for BatchProcessor.wait_for_completion"""
+
+    def test_backs_off_and_resets_on_progress(self, processor):
+        """Delay doubles while nothing finishes and resets when requests complete"""
+        clock = FakeClock()
+        statuses = [
+            _status("in_progress"),
+            _status("in_progress"),
+            _status("in_progress"),
+            _status("in_progress", succeeded=3, processing=2),
+            _status("ended", succeeded=5, processing=0),
+        ]
+
+        with patch.object(processor, "get_batch_status", side_effect=statuses), \
+             patch("src.batch_processor.time", clock):
+            result = processor.wait_for_completion(
+                "batch_1", min_interval=5, max_interval=300, jitter=0
+            )
+
+        assert result["status"] == "ended"
+        assert clock.sleeps == [5, 10, 20, 5]
+
+    def test_interval_capped_and_deadline_respected(self, processor):
+        """Delays never exceed max_interval and polling stops at the deadline"""
+        clock = FakeClock()
+
+        with patch.object(processor, "get_batch_status", return_value=_status("in_progress")), \
+             patch("src.batch_processor.time", clock):
+            result = processor.wait_for_completion(
+                "batch_1", max_wait_hours=1, min_interval=5, max_interval=300, jitter=0
+            )
+
+        assert result["status"] == "in_progress"
+        assert max(clock.sleeps) == 300
+        assert clock.now == pytest.approx(3600)
+
+    def test_polls_quickly_until_ended_once_counts_show_all_finished(self, processor, temp_dir):
+        """Finished counts switch to min_interval polling but only "ended" returns"""
+        clock = FakeClock()
+        (temp_dir / "batch_metadata_batch_1.json").write_text('{"num_requests": 5}')
+        statuses = [
+            _status("in_progress"),
+            _status("in_progress"),
+            _status("in_progress", succeeded=2, errored=3, processing=0),
+            _status("in_progress", succeeded=2, errored=3, processing=0),
+            _status("ended", succeeded=2, errored=3, processing=0),
+        ]
+
+        with patch("src.batch_processor.BATCH_DIR", temp_dir), \
+             patch.object(processor, "get_batch_status", side_effect=statuses) as get_status, \
+             patch("src.batch_processor.time", clock):
+            result = processor.wait_for_completion("batch_1", jitter=0)
+
+        assert result["status"] == "ended"
+        assert get_status.call_count == 5
+        assert clock.sleeps == [5, 10, 5, 5]
+
+    def test_check_interval_is_deprecated_alias(self, processor):
+        """The old positional check_interval still sets the shortest delay"""
+        clock = FakeClock()
+        statuses = [_status("in_progress"), _status("ended", succeeded=5, processing=0)]
+
+        with patch.object(processor, "get_batch_status", side_effect=statuses), \
+             patch("src.batch_processor.time", clock), \
+             pytest.warns(DeprecationWarning):
+            processor.wait_for_completion("batch_1", 60, jitter=0)
+
+        assert clock.sleeps == [60]
+
+    def test_delays_are_jittered(self, processor):
+        """Each delay lands within the jitter band around the backoff interval"""
+        clock = FakeClock()
+        statuses = [_status("in_progress")] * 4 + [_status("ended", succeeded=5, processing=0)]
+
+        with patch.object(processor, "get_batch_status", side_effect=statuses), \
+             patch("src.batch_processor.time", clock):
+            processor.wait_for_completion("batch_1", min_interval=10, jitter=0.2)
+
+        for delay, interval in zip(clock.sleeps, [10, 20, 40, 80]):
+            assert interval * 0.8 <= delay <= interval * 1.2
@@ -63,6 +63,41 @@ class TestCitationManager:
         assert len(mgr.citations) == 2
         assert mgr.next_id == 3
 
+    def test_add_citations_from_metadata(self):
+        """Test adding citations in bulk from RAG metadata"""
+        mgr = CitationManager()
+        mgr.add_citation(doc_id=9, doc_name='Existing.pdf', page_num=1)
+
+        ids = mgr.add_citations_from_metadata([
+            {"doc_id": 1, "doc_name": "Paper1.pdf", "page": 3, "section": "Intro", "source": "Paper1.pdf, p.3"},
+            "not metadata",
+            {"doc_name": "Paper2.pdf"}
+        ])
+
+        assert ids == [2, 3]
+        assert mgr.next_id == 4
+        assert mgr.get_citation(2)['section_name'] == 'Intro'
+        assert mgr.get_citation(2)['context'] == 'Paper1.pdf, p.3'
+        assert mgr.get_citation(3)['doc_id'] == 0
+        assert mgr.get_citation(3)['page'] == 0
+        assert mgr.get_citation_statistics()['total_citations'] == 3
+
+    def test_dedupe_returns_existing_citation_id(self, sample_citation_data):
+        """Test that a deduplicating manager reuses IDs for repeated citations"""
+        mgr = CitationManager(dedupe=True)
+
+        first = mgr.add_citation(**sample_citation_data)
+        second = mgr.add_citation(**sample_citation_data)
+        ids = mgr.add_citations_from_metadata([
+            {"doc_id": 3, "doc_name": "Paper3.pdf", "page": 2, "section": "Intro"},
+            {"doc_id": 3, "doc_name": "Paper3.pdf", "page": 2, "section": "Intro"},
+        ])
+
+        assert first == second == 1
+        assert ids == [2, 2]
+        assert len(mgr.citations) == 2
+        assert mgr.next_id == 3
+
     def test_get_citation(self, sample_citation_data):
         """Test retrieving a citation by ID"""
         mgr = CitationManager()
@@ -111,6 +146,18 @@ class TestCitationManager:
         assert 'Paper1.pdf' in formatted
         assert 'Paper2.pdf' in formatted
 
+    def test_format_citation_inline_groups_pages_and_sections(self):
+        """Test inline formatting merges pages and names the first-cited section"""
+        mgr = CitationManager()
+
+        ids = [
+            mgr.add_citation(doc_id=1, doc_name='Paper1.pdf', page_num=7, section_name='Results'),
+            mgr.add_citation(doc_id=1, doc_name='Paper1.pdf', page_num=3, section_name='Intro'),
+            mgr.add_citation(doc_id=1, doc_name='Paper1.pdf', page_num=5),
+        ]
+
+        assert mgr.format_citation(ids, style="inline") == "[Paper1.pdf, pp.3-7, §Results et al.]"
+
     def test_format_citation_footnote(self, sample_citation_data):
         """Test footnote citation formatting"""
         mgr = CitationManager()
@@ -194,6 +241,21 @@ class TestCitationManager:
         assert 'Paper1.pdf' in bib_str
         assert 'Paper2.pdf' in bib_str
 
+    def test_generate_bibliography_selected_ids(self):
+        """Test bibliography for selected IDs matches grouping from the document index"""
+        mgr = CitationManager()
+        mgr.add_citation(doc_id=2, doc_name='Paper2.pdf', page_num=4)
+        mgr.add_citation(doc_id=1, doc_name='Paper1.pdf', page_num=3)
+        mgr.add_citation(doc_id=2, doc_name='Paper2.pdf', page_num=1)
+
+        assert mgr.generate_bibliography() == [
+            {"doc_id": 1, "doc_name": "Paper1.pdf", "pages_cited": [3], "citation_count": 1},
+            {"doc_id": 2, "doc_name": "Paper2.pdf", "pages_cited": [1, 4], "citation_count": 2},
+        ]
+        assert mgr.generate_bibliography([3, 99]) == [
+            {"doc_id": 2, "doc_name": "Paper2.pdf", "pages_cited": [1], "citation_count": 1},
+        ]
+
     def test_get_citations_by_document(self):
         """Test retrieving citations by document ID"""
         mgr = CitationManager()
@@ -216,6 +278,73 @@ class TestCitationManager:
         assert len(doc1_cits) == 2
         assert all(c['doc_id'] == 1 for c in doc1_cits)
 
+    def test_loaded_citations_share_names_and_index_by_document(self, temp_dir):
+        """Test reloaded citations reuse one name object and keep the document index"""
+        mgr = CitationManager()
+        for page in range(3):
+            mgr.add_citation(doc_id=1, doc_name='Paper1.pdf', page_num=page, section_name='Intro')
+
+        save_path = temp_dir / "citations.json"
+        mgr.save_citations(save_path)
+        mgr2 = CitationManager()
+        mgr2.load_citations(save_path)
+
+        doc1_cits = mgr2.get_citations_by_document(1)
+        assert [c['page'] for c in doc1_cits] == [0, 1, 2]
+        assert doc1_cits[0]['doc_name'] is doc1_cits[2]['doc_name']
+        assert doc1_cits[0]['section'] is doc1_cits[1]['section_name']
+
+    def test_format_citation_cached_until_citations_change(self):
+        """Test known IDs are memoized across additions and unknown IDs are never cached"""
+        mgr = CitationManager()
+        id1 = mgr.add_citation(1, "Doc1.pdf", 5)
+
+        mgr.format_citation([id1], style="footnote")
+        mgr.format_citation([id1], style="footnote")
+        assert mgr._format_cached.cache_info().hits == 1
+
+        assert mgr.format_citation([id1, 2], style="footnote") == "[1: Doc1.pdf, p.5]"
+        assert mgr._format_cached.cache_info().currsize == 1
+
+        mgr.add_citation(2, "Doc2.pdf", 7)
+        assert mgr.format_citation([id1], style="footnote") == "[1: Doc1.pdf, p.5]"
+        assert mgr._format_cached.cache_info().hits == 2
+        assert mgr.format_citation([id1, 2], style="footnote") == "[1: Doc1.pdf, p.5; 2: Doc2.pdf, p.7]"
+        assert mgr.format_citation([2, id1], style="footnote") == "[2: Doc2.pdf, p.7; 1: Doc1.pdf, p.5]"
+
+        mgr.clear()
+        assert mgr.format_citation([id1], style="footnote") == ""
+
+    def test_saved_file_is_standard_json(self, temp_dir):
+        """Test saved citations stay readable by the standard json module"""
+        mgr = CitationManager()
+        mgr.add_citation(1, "Doc1.pdf", 5, section_name="§ Intro", quote="naïve")
+
+        save_path = temp_dir / "citations.json"
+        mgr.save_citations(save_path)
+
+        data = json.loads(save_path.read_text(encoding="utf-8"))
+        assert data["next_id"] == 2
+        assert data["citations"][0]["quote"] == "naïve"
+
+    def test_load_renumbers_non_sequential_ids(self, temp_dir):
+        """Test legacy files with gaps in citation IDs are renumbered on load"""
+        save_path = temp_dir / "citations.json"
+        save_path.write_text(json.dumps({
+            "citations": [
+                {"id": 4, "doc_id": 1, "doc_name": "A.pdf", "page": 1},
+                {"id": 9, "doc_id": 2, "doc_name": "B.pdf", "page": 2},
+            ],
+            "next_id": 10
+        }))
+
+        mgr = CitationManager()
+        mgr.load_citations(save_path)
+
+        assert mgr.get_citation(2)['doc_name'] == 'B.pdf'
+        assert mgr.get_citation(9) is None
+        assert mgr.next_id == 3
+
     def test_get_citations_by_document_empty(self):
         """Test getting citations for non-existent document"""
         mgr = CitationManager()
@@ -258,6 +387,29 @@ class TestCitationManager:
         assert stats['unique_documents'] == 2
         assert stats['citations_with_quotes'] == 2
 
+    def test_citation_statistics_survive_load_and_clear(self, temp_dir):
+        """Running statistics match after reload and reset on clear"""
+        mgr = CitationManager()
+        for doc_id, name in [(1, 'A.pdf'), (2, 'B.pdf'), (2, 'B.pdf'), (1, 'A.pdf')]:
+            mgr.add_citation(doc_id=doc_id, doc_name=name, page_num=doc_id)
+
+        stats = mgr.get_citation_statistics()
+        # Tied counts go to the document cited first
+        assert stats['most_cited_document'] == 'A.pdf'
+        assert stats['most_cited_count'] == 2
+
+        save_path = temp_dir / "citations.json"
+        mgr.save_citations(save_path)
+        mgr2 = CitationManager()
+        mgr2.load_citations(save_path)
+        assert mgr2.get_citation_statistics() == stats
+
+        mgr2.clear()
+        assert mgr2.get_citation_statistics() == {
+            'total_citations': 0, 'unique_documents': 0,
+            'unique_pages': 0, 'citations_with_quotes': 0
+        }
+
     def test_save_and_load_citations(self, temp_dir, sample_citation_data):
         """Test saving and loading citations"""
         mgr = CitationManager()
@@ -280,6 +432,7 @@ class TestCitationManager:
         assert len(mgr2.citations) == 2
         assert mgr2.citations[0]['doc_name'] == sample_citation_data['doc_name']
         assert mgr2.next_id == 3
+        assert mgr2.get_citation(2)['doc_name'] == 'Paper2.pdf'
 
     def test_save_citations_creates_directory(self, temp_dir):
         """Test that save creates directory if needed"""
@@ -319,6 +472,7 @@ class TestCitationManager:
 
         assert len(mgr.citations) == 0
         assert mgr.next_id == 1
+        assert mgr.get_citation(1) is None
 
     def test_citation_with_missing_optional_fields(self):
         """Test citation with only required fields"""
@@ -0,0 +1,292 @@
+"""
+Unit Tests for Claude Analyzer
+Tests retry and backoff behaviour of the sync and async API calls
+"""
+
+import asyncio
+
+import anthropic
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from PIL import Image
+
+from src.claude_analyzer import ClaudeAnalyzer
+from src.response_cache import ResponseCache
+from utils.exceptions import AuthenticationError, ClaudeAPIError, RateLimitError
+
+
+def _response(text):
+    response = MagicMock()
+    response.content = [MagicMock(text=text)]
+    return response
+
+
+def _rate_limit_error():
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    return anthropic.RateLimitError(
+        "rate limited", response=httpx.Response(429, request=request), body=None
+    )
+
+
+@pytest.fixture
+def analyzer():
+    """ClaudeAnalyzer without real API clients"""
+    with patch("src.claude_analyzer.get_api_key", return_value="key"), \
+         patch("src.claude_analyzer.get_anthropic_client", return_value=MagicMock()):
+        analyzer = ClaudeAnalyzer()
+    analyzer._aclient = MagicMock()
+    analyzer._aclient.messages.create = AsyncMock()
+    analyzer._aclient.close = AsyncMock()
+    analyzer.response_cache = None
+    return analyzer
+
+
+class TestRetryDelay:
+    """Test suite for ClaudeAnalyzer._retry_delay"""
+
+    def test_backoff_is_exponential_jittered_and_capped(self):
+        """Delays double per attempt within the jitter band and never pass the cap"""
+        with patch("src.claude_analyzer.CLAUDE_MAX_RETRIES", 10), \
+             patch("src.claude_analyzer.CLAUDE_RETRY_DELAY", 2), \
+             patch("src.claude_analyzer.CLAUDE_RETRY_MAX_DELAY", 10):
+            delays = [ClaudeAnalyzer._retry_delay(_rate_limit_error(), attempt) for attempt in range(4)]
+
+        for delay, ceiling in zip(delays, [2, 4, 8, 10]):
+            assert ceiling * 0.5 <= delay <= ceiling
+
+    def test_last_attempt_raises(self):
+        """Retryable errors are raised as RateLimitError once retries run out"""
+        with patch("src.claude_analyzer.CLAUDE_MAX_RETRIES", 3):
+            with pytest.raises(RateLimitError):
+                ClaudeAnalyzer._retry_delay(_rate_limit_error(), 2)
+
+
+class TestMakeApiCall:
+    """Test suite for the sync and async API calls"""
+
+    def test_sync_retries_then_succeeds(self, analyzer):
+        """A rate-limited call is retried after a jittered sleep"""
+        analyzer.client.messages.create.side_effect = [_rate_limit_error(), _response("ok")]
+
+        with patch("src.claude_analyzer.time.sleep") as sleep:
+            assert analyzer._make_api_call([], "system") == "ok"
+
+        sleep.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_retries_then_succeeds(self, analyzer):
+        """The async call retries with asyncio.sleep instead of blocking"""
+        analyzer._aclient.messages.create.side_effect = [_rate_limit_error(), _response("ok")]
+
+        with patch("src.claude_analyzer.asyncio.sleep", new_callable=AsyncMock) as sleep, \
+             patch("src.claude_analyzer.time.sleep") as blocking_sleep:
+            assert await analyzer._make_api_call_async([], "system") == "ok"
+
+        sleep.assert_awaited_once()
+        blocking_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_authentication_error_not_retried(self, analyzer):
+        """Authentication failures surface immediately"""
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        analyzer._aclient.messages.create.side_effect = anthropic.AuthenticationError(
+            "bad key", response=httpx.Response(401, request=request), body=None
+        )
+
+        with pytest.raises(AuthenticationError):
+            await analyzer._make_api_call_async([], "system")
+
+        assert analyzer._aclient.messages.create.await_count == 1
+
+
+class TestResponseCaching:
+    """Test suite for response caching in the API calls"""
+
+    def test_identical_request_served_from_cache(self, analyzer, temp_dir):
+        """A repeated prompt is answered without a second API call"""
+        analyzer.response_cache = ResponseCache(temp_dir / "responses.sqlite3")
+        analyzer.client.messages.create.return_value = _response("answer")
+        messages = [{"role": "user", "content": "Summarize"}]
+
+        assert analyzer._make_api_call(messages, "system") == "answer"
+        assert analyzer._make_api_call(messages, "system") == "answer"
+        analyzer._make_api_call(messages, "other system")
+
+        assert analyzer.client.messages.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_shares_cache_and_can_bypass(self, analyzer, temp_dir):
+        """The async call reads sync results, and cache=False forces a fresh call"""
+        analyzer.response_cache = ResponseCache(temp_dir / "responses.sqlite3")
+        analyzer.client.messages.create.return_value = _response("sync answer")
+        analyzer._aclient.messages.create.return_value = _response("fresh answer")
+        messages = [{"role": "user", "content": "Summarize"}]
+
+        analyzer._make_api_call(messages, "system")
+
+        assert await analyzer._make_api_call_async(messages, "system") == "sync answer"
+        assert await analyzer._make_api_call_async(messages, "system", cache=False) == "fresh answer"
+
+        analyzer.clear_cache()
+        assert await analyzer._make_api_call_async(messages, "system") == "fresh answer"
+        assert analyzer._aclient.messages.create.await_count == 2
+
+
+class TestAnalyzeWithRag:
+    """Test suite for concurrent RAG analysis"""
+
+    def _rag_system(self, contexts):
+        rag_system = MagicMock()
+        rag_system.get_relevant_chunks.side_effect = (
+            lambda query, max_chunks: [{"text": contexts[query], "metadata": {"doc_name": "Doc.pdf"}}]
+            if contexts[query] else []
+        )
+        return rag_system
+
+    def test_results_keep_query_order_and_skip_failures(self, analyzer):
+        """Queries run concurrently; empty or failed queries are left out"""
+        rag_system = self._rag_system({"q1": "ctx1", "q2": "", "q3": "ctx3", "q4": "ctx4"})
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            if "ctx3" in prompt:
+                raise _rate_limit_error()
+            return _response("s1" if "ctx1" in prompt else "s4")
+
+        run_client = MagicMock()
+        run_client.messages.create = AsyncMock(side_effect=create)
+        run_client.close = AsyncMock()
+        shared_client = analyzer._aclient
+
+        with patch("src.claude_analyzer.CLAUDE_MAX_RETRIES", 1), \
+             patch.object(ClaudeAnalyzer, "_new_async_client", return_value=run_client):
+            results = analyzer.analyze_with_rag(rag_system, ["q1", "q2", "q3", "q4"])
+
+        assert [r["query"] for r in results] == ["q1", "q4"]
+        assert [r["synthesis"] for r in results] == ["s1", "s4"]
+        run_client.close.assert_awaited_once()
+        shared_client.messages.create.assert_not_called()
+        shared_client.close.assert_not_called()
+        assert analyzer._aclient is shared_client
+
+    @pytest.mark.asyncio
+    async def test_sync_entry_point_refuses_running_loop(self, analyzer):
+        """Calling analyze_with_rag from a coroutine fails clearly instead of nesting loops"""
+        with pytest.raises(ClaudeAPIError, match="analyze_with_rag_async"):
+            analyzer.analyze_with_rag(MagicMock(), ["q1"])
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, analyzer):
+        """No more than max_concurrency queries call Claude at once"""
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response("ok")
+
+        analyzer._aclient.messages.create.side_effect = create
+        rag_system = self._rag_system({f"q{i}": "ctx" for i in range(6)})
+
+        results = await analyzer.analyze_with_rag_async(
+            rag_system, [f"q{i}" for i in range(6)], max_concurrency=2
+        )
+
+        assert len(results) == 6
+        assert peak == 2
+
+    def test_all_queries_failing_raises(self, analyzer):
+        """The analysis fails when no query succeeds"""
+        rag_system = MagicMock()
+        rag_system.get_relevant_chunks.side_effect = RuntimeError("index missing")
+
+        with pytest.raises(ClaudeAPIError):
+            analyzer.analyze_with_rag(rag_system, ["q1", "q2"])
+
+
+class TestSynthesisMessages:
+    """Test suite for building synthesis prompts"""
+
+    def test_duplicate_chunks_sent_once(self):
+        """Chunks repeated across retrieval results appear once, numbered consecutively"""
+        chunk_a = {"text": "alpha", "metadata": {"source": "A.pdf", "section": "Intro"}}
+        chunk_b = {"text": "beta", "metadata": {"source": "B.pdf", "section": "Results"}}
+        same_text_other_doc = {"text": "alpha", "metadata": {"source": "C.pdf", "section": "Intro"}}
+
+        with patch("src.claude_analyzer.render_synthesis_prompt",
+                   side_effect=lambda **kwargs: kwargs["retrieved_content"]):
+            messages = ClaudeAnalyzer._synthesis_messages(
+                [chunk_a, chunk_b, dict(chunk_a), same_text_other_doc], "topic"
+            )
+
+        content = messages[0]["content"]
+        assert content.count("alpha") == 2
+        assert content.count("beta") == 1
+        assert "**Source 3**: C.pdf" in content
+        assert "**Source 4**" not in content
+
+
+class TestEncodeImage:
+    """Test suite for ClaudeAnalyzer._encode_image"""
+
+    def test_same_image_encoded_once(self, analyzer):
+        """An image shared by several chunks is only encoded the first time"""
+        image = Image.new("RGB", (4, 4))
+        analyzer.client.messages.create.return_value = _response("ok")
+        images = [{"image": image, "format": "PNG", "index": 0}]
+
+        with patch("src.claude_analyzer.image_to_base64", return_value="b64") as encode:
+            analyzer.analyze_text_chunk("text", "Doc.pdf", 1, images=images)
+            analyzer.analyze_text_chunk("more text", "Doc.pdf", 1, images=images)
+
+        encode.assert_called_once_with(image)
+
+    def test_identical_copies_share_encoding(self, analyzer):
+        """Separate image objects with the same pixels are encoded once"""
+        first = Image.new("RGB", (4, 4), "red")
+        copy = first.copy()
+        different = Image.new("RGB", (4, 4), "blue")
+
+        with patch("src.claude_analyzer.image_to_base64", side_effect=["red", "blue"]) as encode:
+            assert analyzer._encode_image(first) == "red"
+            assert analyzer._encode_image(copy) == "red"
+            assert analyzer._encode_image(different) == "blue"
+
+        assert encode.call_count == 2
+
+    def test_palette_images_with_different_palettes_differ(self, analyzer):
+        """Same palette indices with different palettes are encoded separately"""
+        red = Image.new("P", (2, 2), 0)
+        red.putpalette([255, 0, 0] * 256)
+        blue = Image.new("P", (2, 2), 0)
+        blue.putpalette([0, 0, 255] * 256)
+        transparent = Image.new("P", (2, 2), 0)
+        transparent.putpalette([255, 0, 0] * 256)
+        transparent.info["transparency"] = 0
+
+        with patch("src.claude_analyzer.image_to_base64", side_effect=["red", "blue", "clear"]):
+            assert analyzer._encode_image(red) == "red"
+            assert analyzer._encode_image(blue) == "blue"
+            assert analyzer._encode_image(transparent) == "clear"
+
+    def test_content_cache_is_bounded(self, analyzer):
+        """Only the most recent distinct images keep their encoding"""
+        with patch("src.claude_analyzer.IMAGE_ENCODING_CACHE_SIZE", 2):
+            for shade in range(3):
+                analyzer._encode_image(Image.new("L", (2, 2), shade))
+
+        assert len(analyzer._encoded_images) == 2
+
+    def test_entry_dropped_when_image_collected(self, analyzer):
+        """Encodings do not outlive their image"""
+        image = Image.new("RGB", (4, 4))
+        analyzer._encode_image(image)
+        assert len(analyzer._image_base64) == 1
+
+        del image
+        assert analyzer._image_base64 == {}
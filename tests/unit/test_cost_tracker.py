@@ -0,0 +1,40 @@
+"""
+Unit Tests for Cost Tracker
+Tests cost logging in memory and to an append-only log file
+"""
+
+from src.cost_tracker import CostTracker
+
+
+class TestCostTracker:
+    """Test suite for Cost Tracker logging"""
+
+    def test_log_cost_in_memory(self):
+        """Without a log path, entries are kept in memory"""
+        tracker = CostTracker()
+
+        tracker.log_cost("query one", {"total_cost": 0.12, "worker_count": 3})
+
+        assert len(tracker.session_costs) == 1
+        assert tracker.session_costs[0]["total_cost"] == 0.12
+        assert tracker.session_costs[0]["worker_count"] == 3
+
+    def test_log_cost_appends_to_file(self, temp_dir):
+        """With a log path, entries are appended to disk and survive a new tracker"""
+        log_path = temp_dir / "costs.jsonl"
+        tracker = CostTracker(log_path=log_path)
+
+        tracker.log_cost("query one", {"total_cost": 0.1})
+        tracker.log_cost("query two", {"total_cost": 0.2})
+
+        assert tracker._session_costs == []
+        assert len(log_path.read_text().splitlines()) == 2
+
+        reloaded = CostTracker(log_path=log_path)
+        assert [c["query"] for c in reloaded.session_costs] == ["query one", "query two"]
+
+    def test_missing_log_file_is_empty(self, temp_dir):
+        """A configured but not yet written log reads as no entries"""
+        tracker = CostTracker(log_path=temp_dir / "missing.jsonl")
+
+        assert tracker.session_costs == []
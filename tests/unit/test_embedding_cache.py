@@ -0,0 +1,64 @@
+"""
+Unit Tests for Embedding Cache
+Tests query LRU reuse and disk-cached document embeddings
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.embedding_cache import CachedEmbeddings
+
+
+@pytest.fixture
+def base_embedder():
+    """Fake embedder returning a vector derived from text length"""
+    base = Mock()
+    base.embed_query.side_effect = lambda text: [float(len(text)), 1.0]
+    base.embed_documents.side_effect = lambda texts: [[float(len(t)), 0.5] for t in texts]
+    return base
+
+
+class TestCachedEmbeddings:
+    """Test suite for CachedEmbeddings"""
+
+    def test_repeated_query_hits_memory_cache(self, base_embedder, temp_dir):
+        """Identical queries (ignoring surrounding whitespace) are embedded once"""
+        embedder = CachedEmbeddings(base_embedder, "test-model", cache_path=temp_dir / "emb.sqlite3")
+
+        first = embedder.embed_query("what is attention")
+        second = embedder.embed_query("  what is attention ")
+
+        assert first == second
+        assert base_embedder.embed_query.call_count == 1
+
+    def test_query_cache_is_bounded(self, base_embedder, temp_dir):
+        """Oldest queries are evicted beyond query_cache_size"""
+        embedder = CachedEmbeddings(
+            base_embedder, "test-model", cache_path=temp_dir / "emb.sqlite3", query_cache_size=2
+        )
+
+        for query in ["one", "two", "three", "one"]:
+            embedder.embed_query(query)
+
+        assert base_embedder.embed_query.call_count == 4
+
+    def test_documents_only_encode_uncached_chunks(self, base_embedder, temp_dir):
+        """Only new chunks reach the model, in a single batched call, across instances"""
+        cache_path = temp_dir / "emb.sqlite3"
+        embedder = CachedEmbeddings(base_embedder, "test-model", cache_path=cache_path)
+        embedder.embed_documents(["alpha", "beta"])
+
+        reloaded = CachedEmbeddings(base_embedder, "test-model", cache_path=cache_path)
+        vectors = reloaded.embed_documents(["alpha", "gamma!", "beta", "gamma!"])
+
+        assert vectors == [[5.0, 0.5], [6.0, 0.5], [4.0, 0.5], [6.0, 0.5]]
+        assert base_embedder.embed_documents.call_count == 2
+        base_embedder.embed_documents.assert_called_with(["gamma!"])
+
+    def test_model_name_is_part_of_document_key(self, base_embedder, temp_dir):
+        """A different embedding model does not reuse cached vectors"""
+        cache_path = temp_dir / "emb.sqlite3"
+        CachedEmbeddings(base_embedder, "model-a", cache_path=cache_path).embed_documents(["alpha"])
+        CachedEmbeddings(base_embedder, "model-b", cache_path=cache_path).embed_documents(["alpha"])
+
+        assert base_embedder.embed_documents.call_count == 2
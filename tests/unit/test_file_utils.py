@@ -0,0 +1,51 @@
+"""
+Unit Tests for File Utilities
+Tests that uploads saved concurrently never share a path
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from utils.file_utils import open_unique_file, save_uploaded_file_with_digest
+
+
+def _upload(name, content):
+    upload = MagicMock()
+    upload.name = name
+    upload.size = len(content)
+    upload.getbuffer.return_value = memoryview(content)
+    return upload
+
+
+class TestOpenUniqueFile:
+    """Test suite for open_unique_file"""
+
+    def test_taken_name_gets_new_path(self, temp_dir):
+        """A name claimed after the existence check is not overwritten"""
+        (temp_dir / "paper.pdf").write_bytes(b"first")
+
+        with patch("utils.file_utils.create_unique_filename", return_value=temp_dir / "paper.pdf"):
+            file_path, f = open_unique_file("paper.pdf", temp_dir)
+            f.close()
+
+        assert file_path != temp_dir / "paper.pdf"
+        assert (temp_dir / "paper.pdf").read_bytes() == b"first"
+
+
+class TestSaveUploadedFileWithDigest:
+    """Test suite for save_uploaded_file_with_digest"""
+
+    def test_parallel_same_name_uploads_kept_apart(self, temp_dir):
+        """Same-named uploads saved at once each get their own file"""
+        uploads = [_upload("paper.pdf", b"%PDF-1.4 " + bytes([i]) * 64) for i in range(8)]
+
+        with patch("utils.file_utils.validate_file"), \
+             patch("utils.file_utils.ensure_directories"):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(
+                    lambda upload: save_uploaded_file_with_digest(upload, temp_dir), uploads
+                ))
+
+        paths = [path for path, _ in results]
+        assert len(set(paths)) == 8
+        assert {path.read_bytes() for path in paths} == {bytes(u.getbuffer.return_value) for u in uploads}
@@ -0,0 +1,87 @@
+"""
+Unit Tests for LLM Request Queue
+Tests the concurrency limit and priority ordering of queued LLM calls
+"""
+
+import threading
+import time
+
+from src.llm_queue import LLMRequestQueue, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+class TestLLMRequestQueue:
+    """Test suite for LLMRequestQueue"""
+
+    def test_limits_concurrent_requests(self):
+        """No more than max_concurrent requests hold a slot at once"""
+        queue = LLMRequestQueue(max_concurrent=2)
+        peak = []
+        lock = threading.Lock()
+
+        def call():
+            with queue.slot():
+                with lock:
+                    peak.append(queue.active)
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) == 2
+        assert queue.active == 0
+        assert queue.waiting == 0
+
+    def test_interactive_requests_jump_the_queue(self):
+        """Waiting interactive requests are admitted before earlier batch requests"""
+        queue = LLMRequestQueue(max_concurrent=1)
+        release = threading.Event()
+        order = []
+
+        def blocker():
+            with queue.slot():
+                release.wait()
+
+        def call(name, priority):
+            with queue.slot(priority):
+                order.append(name)
+
+        holder = threading.Thread(target=blocker)
+        holder.start()
+        _wait_for(lambda: queue.active == 1)
+
+        waiters = [
+            threading.Thread(target=call, args=("batch-1", PRIORITY_BATCH)),
+            threading.Thread(target=call, args=("batch-2", PRIORITY_BATCH)),
+            threading.Thread(target=call, args=("chat", PRIORITY_INTERACTIVE)),
+        ]
+        for count, t in enumerate(waiters, start=1):
+            t.start()
+            _wait_for(lambda: queue.waiting == count)
+
+        release.set()
+        for t in [holder] + waiters:
+            t.join()
+
+        assert order == ["chat", "batch-1", "batch-2"]
+
+    def test_slot_released_on_error(self):
+        """An exception inside the with-block frees the slot"""
+        queue = LLMRequestQueue(max_concurrent=1)
+
+        try:
+            with queue.slot():
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert queue.active == 0
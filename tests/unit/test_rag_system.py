@@ -292,6 +292,21 @@ class TestContextRetrieval:
         assert "Hybrid result" in context
         mock_hybrid.retrieve_with_hybrid_and_rerank.assert_called_once()
 
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_get_relevant_chunks_returns_results(self, mock_embeddings, mock_vector_store):
+        """Test that raw chunks are returned with their own text and metadata"""
+        mock_embeddings.return_value = Mock()
+
+        rag = RAGSystem()
+        rag.vector_store = mock_vector_store
+        rag.hybrid_retriever = None  # Use vector search
+
+        chunks = rag.get_relevant_chunks("test query", max_chunks=2)
+
+        assert len(chunks) == 2
+        assert all("text" in c and "metadata" in c for c in chunks)
+        assert "[Source" not in chunks[0]["text"]
+
 
 class TestVectorStoreManagement:
     """Test vector store save/load"""
@@ -352,6 +367,72 @@ class TestVectorStoreManagement:
         assert len(rag.chunks_metadata) == 1
         assert len(rag.documents) == 1
 
+    @patch('src.rag_system.FAISS')
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_load_vector_store_mmap(self, mock_embeddings, mock_faiss, temp_dir):
+        """Test read-only loads memory-map the FAISS index"""
+        import pickle
+        mock_embeddings.return_value = Mock()
+        fake_faiss = Mock(IO_FLAG_MMAP=0x10, IO_FLAG_READ_ONLY=0x2)
+
+        save_path = temp_dir / "vector_store"
+        (save_path / "faiss_index").mkdir(parents=True)
+        with open(save_path / "faiss_index" / "index.pkl", "wb") as f:
+            pickle.dump(({"doc": "store"}, {0: "doc-0"}), f)
+        (save_path / "chunks_metadata.json").write_text('[{"doc_name": "paper"}]')
+        (save_path / "documents.json").write_text('[]')
+
+        rag = RAGSystem()
+        with patch.dict('sys.modules', {'faiss': fake_faiss}):
+            rag.load_vector_store(save_path, mmap=True)
+
+        fake_faiss.read_index.assert_called_once_with(str(save_path / "faiss_index" / "index.faiss"), 0x12)
+        kwargs = mock_faiss.call_args.kwargs
+        assert kwargs["index"] is fake_faiss.read_index.return_value
+        assert kwargs["index_to_docstore_id"] == {0: "doc-0"}
+        mock_faiss.load_local.assert_not_called()
+        assert rag.chunks_metadata == [{"doc_name": "paper"}]
+
+    @patch('src.rag_system.FAISS')
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_load_vector_store_mmap_falls_back(self, mock_embeddings, mock_faiss, temp_dir):
+        """Test indexes FAISS cannot map are read into memory"""
+        mock_embeddings.return_value = Mock()
+        fake_faiss = Mock(IO_FLAG_MMAP=0x10, IO_FLAG_READ_ONLY=0x2)
+        fake_faiss.read_index.side_effect = RuntimeError("mmap not supported")
+
+        save_path = temp_dir / "vector_store"
+        (save_path / "faiss_index").mkdir(parents=True)
+        (save_path / "chunks_metadata.json").write_text('[]')
+        (save_path / "documents.json").write_text('[]')
+
+        rag = RAGSystem()
+        with patch.dict('sys.modules', {'faiss': fake_faiss}):
+            rag.load_vector_store(save_path, mmap=True)
+
+        mock_faiss.load_local.assert_called_once()
+        assert rag.vector_store is mock_faiss.load_local.return_value
+
+    @patch('src.rag_system.FAISS')
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_save_load_round_trip_with_lone_surrogate(self, mock_embeddings, mock_faiss, temp_dir):
+        """Test metadata with text orjson cannot encode still round-trips"""
+        mock_embeddings.return_value = Mock()
+
+        rag = RAGSystem()
+        rag.vector_store = Mock()
+        rag.chunks_metadata = [{"doc_name": "paper", "page": 1, "section": "Bad \ud800 text"}]
+        rag.documents = [{"doc_name": "paper", "pages": []}]
+
+        save_path = temp_dir / "vector_store"
+        rag.save_vector_store(save_path)
+
+        loaded = RAGSystem()
+        loaded.load_vector_store(save_path)
+
+        assert loaded.chunks_metadata == rag.chunks_metadata
+        assert loaded.documents == rag.documents
+
 
 class TestMetadataQueries:
     """Test metadata-based queries"""
@@ -391,6 +472,95 @@ class TestMetadataQueries:
         assert chunks[0]['doc_id'] == 0
         assert chunks[0]['page'] == 1
 
+    @patch('src.rag_system.FAISS')
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_get_chunk_ids_by_doc_name(self, mock_embeddings, mock_faiss, sample_pdf_data):
+        """Test doc_name index is maintained across process_documents and add_documents"""
+        mock_embeddings.return_value = Mock()
+        mock_faiss.from_documents.return_value = Mock()
+
+        rag = RAGSystem()
+        rag.hybrid_retriever = None
+        source_count = rag.process_documents([sample_pdf_data])
+
+        summary_data = dict(sample_pdf_data, doc_name="Summary_Report.pdf")
+        summary_count = rag.add_documents([summary_data])
+
+        source_ids = rag.get_chunk_ids_by_doc_name(sample_pdf_data['doc_name'])
+        summary_ids = rag.get_chunk_ids_by_doc_name("Summary", partial=True)
+
+        assert source_ids == list(range(source_count))
+        assert summary_ids == list(range(source_count, source_count + summary_count))
+        assert rag.get_chunk_ids_by_doc_name("Summary") == []
+
+
+class TestIncrementalAdd:
+    """Test appending documents without rebuilding the indexes"""
+
+    @patch('src.rag_system.FAISS')
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_add_documents_only_indexes_new_chunks(self, mock_embeddings, mock_faiss, sample_pdf_data):
+        """New chunks are appended to the existing vector store and BM25 index"""
+        mock_embeddings.return_value = Mock()
+        mock_faiss.from_documents.return_value = Mock()
+
+        rag = RAGSystem()
+        rag.hybrid_retriever = Mock()
+        rag.process_documents([sample_pdf_data])
+
+        summary_data = dict(sample_pdf_data, doc_name="Summary_Report.pdf")
+        new_count = rag.add_documents([summary_data])
+
+        mock_faiss.from_documents.assert_called_once()
+        added_chunks = rag.vector_store.add_documents.call_args[0][0]
+        assert len(added_chunks) == new_count
+        assert all(chunk.metadata["doc_name"] == "Summary_Report.pdf" for chunk in added_chunks)
+        rag.hybrid_retriever.extend_bm25_index.assert_called_once_with(
+            [chunk.page_content for chunk in added_chunks]
+        )
+
+    @patch('src.rag_system.FAISS')
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_add_documents_iter_streams_in_batches(self, mock_embeddings, mock_faiss, sample_pdf_data):
+        """Streamed pages are embedded in batches and kept without in-memory images"""
+        mock_embeddings.return_value = Mock()
+        mock_faiss.from_documents.return_value = Mock()
+
+        rag = RAGSystem()
+        rag.hybrid_retriever = None
+        rag.process_documents([sample_pdf_data])
+        chunks_before = len(rag.chunks_metadata)
+
+        doc_info = {"doc_name": "Summary_Report", "doc_path": "/tmp/Summary_Report.pdf"}
+        pages = [dict(page, images=[dict(image, image=Mock()) for image in page["images"]])
+                 for page in sample_pdf_data["pages"]]
+        new_count = rag.add_documents_iter(((doc_info, page) for page in pages), batch_size=1)
+
+        assert new_count == len(rag.chunks_metadata) - chunks_before
+        assert rag.vector_store.add_documents.call_count == new_count
+        assert rag.get_chunk_ids_by_doc_name("Summary_Report") == list(range(chunks_before, chunks_before + new_count))
+        assert all(meta["doc_id"] == 1 for meta in rag.chunks_metadata[chunks_before:])
+        assert rag.documents[-1]["doc_name"] == "Summary_Report"
+        assert all("image" not in image for page in rag.documents[-1]["pages"] for image in page["images"])
+
+    @patch('src.hybrid_retrieval.CrossEncoder')
+    def test_extend_bm25_index_matches_full_build(self, mock_cross_encoder):
+        """Extending the BM25 index scores like building it over the whole corpus"""
+        from src.hybrid_retrieval import HybridRetriever
+
+        corpus = ["attention is all you need", "convolutional networks for vision", "attention in transformers"]
+
+        extended = HybridRetriever()
+        extended.build_bm25_index(corpus[:2])
+        extended.extend_bm25_index(corpus[2:])
+
+        full = HybridRetriever()
+        full.build_bm25_index(corpus)
+
+        assert extended.corpus_texts == corpus
+        query = ["attention", "transformers"]
+        assert list(extended.bm25.get_scores(query)) == list(full.bm25.get_scores(query))
+
 
 class TestStatistics:
     """Test RAG system statistics"""
@@ -424,3 +594,71 @@ class TestStatistics:
         assert stats['total_documents'] == 1
         assert stats['total_chunks'] > 0
         assert stats['has_vector_store'] is True
+
+
+class TestIndexCompression:
+    """Test switching large vector stores to an IVF-PQ index"""
+
+    @patch('src.rag_system.IVF_MIN_VECTORS', 1000)
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_large_flat_index_is_compressed(self, mock_embeddings):
+        """Flat index above the threshold becomes IVF-PQ with all vectors kept"""
+        import faiss
+        import numpy as np
+
+        mock_embeddings.return_value = Mock()
+        rag = RAGSystem()
+
+        flat = faiss.IndexFlatL2(64)
+        flat.add(np.random.RandomState(0).rand(2000, 64).astype('float32'))
+        rag.vector_store = Mock()
+        rag.vector_store.index = flat
+
+        rag._maybe_compress_index()
+
+        compressed = rag.vector_store.index
+        assert not isinstance(compressed, faiss.IndexFlat)
+        assert compressed.ntotal == 2000
+        assert faiss.extract_index_ivf(compressed).nprobe > 0
+
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_small_index_stored_as_fp16(self, mock_embeddings):
+        """Stores below the IVF threshold keep exact search over float16 vectors"""
+        import faiss
+        import numpy as np
+
+        mock_embeddings.return_value = Mock()
+        rag = RAGSystem()
+
+        vectors = np.random.RandomState(0).rand(100, 64).astype('float32')
+        flat = faiss.IndexFlatL2(64)
+        flat.add(vectors)
+        rag.vector_store = Mock()
+        rag.vector_store.index = flat
+
+        rag._maybe_compress_index()
+
+        compressed = rag.vector_store.index
+        assert isinstance(compressed, faiss.IndexScalarQuantizer)
+        assert compressed.ntotal == 100
+        _, ids = compressed.search(vectors[:5], 1)
+        assert ids[:, 0].tolist() == [0, 1, 2, 3, 4]
+
+    @patch('src.rag_system.VECTOR_STORE_FP16', False)
+    @patch('src.rag_system.HuggingFaceEmbeddings')
+    def test_small_index_stays_flat_without_fp16(self, mock_embeddings):
+        """With fp16 storage disabled, small stores keep the flat index"""
+        import faiss
+        import numpy as np
+
+        mock_embeddings.return_value = Mock()
+        rag = RAGSystem()
+
+        flat = faiss.IndexFlatL2(64)
+        flat.add(np.random.RandomState(0).rand(100, 64).astype('float32'))
+        rag.vector_store = Mock()
+        rag.vector_store.index = flat
+
+        rag._maybe_compress_index()
+
+        assert rag.vector_store.index is flat
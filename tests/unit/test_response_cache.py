@@ -0,0 +1,57 @@
+"""
+Unit Tests for Response Cache
+Tests key stability, expiry and clearing of cached Claude responses
+"""
+
+from unittest.mock import patch
+
+from src.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache"""
+
+    def test_key_ignores_dict_ordering(self):
+        """Messages with the same content produce the same key regardless of key order"""
+        first = ResponseCache.make_key("model", "sys", [{"role": "user", "content": "hi"}], 100, 0.7)
+        second = ResponseCache.make_key("model", "sys", [{"content": "hi", "role": "user"}], 100, 0.7)
+        other = ResponseCache.make_key("model", "sys", [{"role": "user", "content": "hi"}], 200, 0.7)
+
+        assert first == second
+        assert first != other
+
+    def test_round_trip_and_stats(self, temp_dir):
+        """Stored responses are returned and hits and misses are counted"""
+        cache = ResponseCache(temp_dir / "responses.sqlite3")
+
+        assert cache.get("k") is None
+        cache.set("k", "response")
+
+        assert cache.get("k") == "response"
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_expired_entries_ignored(self, temp_dir):
+        """Entries older than the TTL are treated as missing"""
+        cache = ResponseCache(temp_dir / "responses.sqlite3", ttl_hours=1)
+
+        with patch("src.response_cache.time.time", return_value=1000.0):
+            cache.set("k", "response")
+        with patch("src.response_cache.time.time", return_value=1000.0 + 3601):
+            assert cache.get("k") is None
+
+    def test_clear_removes_entries(self, temp_dir):
+        """clear() drops every cached response"""
+        cache = ResponseCache(temp_dir / "responses.sqlite3")
+        cache.set("k", "response")
+
+        cache.clear()
+
+        assert cache.get("k") is None
+
+    def test_clear_survives_unusable_database(self, temp_dir):
+        """clear() logs and returns when the cache file cannot be opened"""
+        cache_path = temp_dir / "responses.sqlite3"
+        cache_path.mkdir()
+        cache = ResponseCache(cache_path)
+
+        cache.clear()
@@ -0,0 +1,104 @@
+"""
+Unit Tests for Summary Cache
+Tests exact-key lookups, similarity hits, and eviction
+"""
+
+import pytest
+
+from src.summary_cache import SummaryCache
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """Summary cache backed by a temporary directory"""
+    return SummaryCache(cache_dir=temp_dir, max_entries=2, similarity_threshold=0.97)
+
+
+@pytest.fixture
+def documents():
+    """Minimal processed PDF data"""
+    return [
+        {"doc_name": "paper_a", "content_hash": "aaa", "metadata": {"title": "Paper A"},
+         "pages": [{"text": "Abstract A"}, {"text": "Body"}], "total_pages": 2},
+        {"doc_name": "paper_b", "content_hash": "bbb", "metadata": {"title": "Paper B"},
+         "pages": [{"text": "Abstract B"}], "total_pages": 1},
+    ]
+
+
+class TestSummaryCacheKeys:
+    """Test cache key construction"""
+
+    def test_key_is_order_independent(self, documents):
+        """Test that document order does not change the key"""
+        key1 = SummaryCache.make_key(documents, "api", "quick")
+        key2 = SummaryCache.make_key(list(reversed(documents)), "api", "quick")
+
+        assert key1 == key2
+
+    def test_key_depends_on_settings(self, documents):
+        """Test that model mode, report mode and focus areas change the key"""
+        base = SummaryCache.make_key(documents, "api", "quick")
+
+        assert base != SummaryCache.make_key(documents, "grok", "quick")
+        assert base != SummaryCache.make_key(documents, "api", "full")
+        assert base != SummaryCache.make_key(documents, "api", "quick", ["Topic"])
+
+    def test_fingerprints_use_title_and_first_page(self, documents):
+        """Test that each document is fingerprinted by its title and opening text"""
+        assert SummaryCache.fingerprint_texts(documents) == ["Paper A\nAbstract A", "Paper B\nAbstract B"]
+        assert SummaryCache.page_counts(documents) == [1, 2]
+
+    def test_no_fingerprint_without_content(self, documents):
+        """Test that file names alone never fingerprint a document"""
+        documents[1]["pages"] = []
+
+        assert SummaryCache.fingerprint_texts(documents) is None
+
+
+class TestSummaryCacheStorage:
+    """Test storing and retrieving summaries"""
+
+    def test_exact_hit_round_trip(self, cache, documents):
+        """Test that a stored summary is returned for the same key"""
+        key = SummaryCache.make_key(documents, "api", "quick")
+        summary = {"executive_summary": "Summary", "detailed_sections": [{"title": "T"}]}
+
+        cache.set(key, summary)
+
+        assert cache.get(key) == summary
+        assert cache.get("missing") is None
+
+    def test_entries_persist_across_instances(self, temp_dir, documents):
+        """Test that the index is reloaded from disk"""
+        key = SummaryCache.make_key(documents, "api", "quick")
+        SummaryCache(cache_dir=temp_dir).set(key, {"executive_summary": "Saved"})
+
+        assert SummaryCache(cache_dir=temp_dir).get(key) == {"executive_summary": "Saved"}
+
+    def test_similarity_hit_requires_matching_settings(self, cache):
+        """Test that similarity lookups only match identical settings above threshold"""
+        settings = SummaryCache.settings_key("api", "quick", None)
+        cache.set("k1", {"executive_summary": "Cached"}, settings, [[1.0, 0.0]], [3])
+
+        assert cache.find_similar(settings, [[0.99, 0.141]], [3]) == {"executive_summary": "Cached"}
+        assert cache.find_similar(settings, [[0.0, 1.0]], [3]) is None
+        assert cache.find_similar(SummaryCache.settings_key("api", "full", None), [[1.0, 0.0]], [3]) is None
+
+    def test_similarity_hit_requires_same_documents_shape(self, cache):
+        """Test that page counts and every document must match, not just the closest one"""
+        settings = SummaryCache.settings_key("api", "quick", None)
+        cache.set("k1", {"executive_summary": "Cached"}, settings, [[1.0, 0.0], [0.0, 1.0]], [3, 5])
+
+        assert cache.find_similar(settings, [[0.0, 1.0], [1.0, 0.0]], [3, 5]) == {"executive_summary": "Cached"}
+        assert cache.find_similar(settings, [[1.0, 0.0], [0.0, 1.0]], [3, 6]) is None
+        assert cache.find_similar(settings, [[1.0, 0.0]], [3]) is None
+        assert cache.find_similar(settings, [[1.0, 0.0], [1.0, 0.0]], [3, 5]) is None
+
+    def test_oldest_entries_are_culled(self, cache, temp_dir):
+        """Test that the cache is bounded by max_entries"""
+        for i in range(3):
+            cache.set(f"key{i}", {"n": i})
+
+        assert cache.get("key0") is None
+        assert cache.get("key2") == {"n": 2}
+        assert not (temp_dir / "key0.pkl").exists()
@@ -5,8 +5,9 @@ Provides functions for file validation, sanitization, and management
 
 import re
 import hashlib
+import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Tuple
 from datetime import datetime
 
 from config.settings import (
@@ -14,13 +15,16 @@ from config.settings import (
     MAX_UPLOAD_SIZE_BYTES,
     SANITIZE_FILENAMES,
     UPLOAD_DIR,
-    TEMP_DIR
+    TEMP_DIR,
+    ensure_directories
 )
 from utils.exceptions import FileSizeError, FileFormatError
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -140,6 +144,29 @@ def create_unique_filename(original_name: str, base_dir: Path) -> Path:
     return file_path
 
 
+def open_unique_file(original_name: str, base_dir: Path) -> Tuple[Path, BinaryIO]:
+    """
+    Create and open a new file named like create_unique_filename
+
+    The file is created with exclusive mode, so concurrent saves of the same
+    name can never share (and overwrite) one path.
+
+    Args:
+        original_name: Original filename
+        base_dir: Directory where file will be saved
+
+    Returns:
+        Tuple of (file path, file opened for binary writing)
+    """
+    file_path = create_unique_filename(original_name, base_dir)
+    try:
+        return file_path, open(file_path, "xb")
+    except FileExistsError:
+        # Another save claimed the name after the existence check
+        file_path = file_path.with_name(f"{file_path.stem}_{uuid.uuid4().hex[:8]}{file_path.suffix}")
+        return file_path, open(file_path, "xb")
+
+
 def save_uploaded_file(uploaded_file, destination_dir: Path = UPLOAD_DIR) -> Path:
     """
     Save uploaded file to disk
@@ -151,6 +178,28 @@ def save_uploaded_file(uploaded_file, destination_dir: Path = UPLOAD_DIR) -> Pat
     Returns:
         Path to saved file
 
+    Raises:
+        FileSizeError: If file is too large
+        FileFormatError: If file format is invalid
+    """
+    file_path, _ = save_uploaded_file_with_digest(uploaded_file, destination_dir)
+    return file_path
+
+
+def save_uploaded_file_with_digest(uploaded_file, destination_dir: Path = UPLOAD_DIR) -> Tuple[Path, str]:
+    """
+    Save uploaded file to disk, hashing it while it is written
+
+    The SHA256 digest matches get_file_hash() for the saved file, so it can be
+    used to detect duplicate uploads without re-reading the file.
+
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        destination_dir: Directory to save file
+
+    Returns:
+        Tuple of (path to saved file, SHA256 hex digest)
+
     Raises:
         FileSizeError: If file is too large
         FileFormatError: If file format is invalid
@@ -164,22 +213,30 @@ def save_uploaded_file(uploaded_file, destination_dir: Path = UPLOAD_DIR) -> Pat
             f"maximum size ({max_mb:.2f} MB)"
         )
 
-    # Create unique filename
-    file_path = create_unique_filename(uploaded_file.name, destination_dir)
+    # Create unique file (reserved atomically so parallel saves cannot collide)
+    ensure_directories()
+    file_path, f = open_unique_file(uploaded_file.name, destination_dir)
 
     # Save file
     try:
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        sha256_hash = hashlib.sha256()
+        buffer = uploaded_file.getbuffer()
+        with f:
+            # Write and hash in 1 MiB slices of the upload buffer (no extra copy)
+            for offset in range(0, len(buffer), HASH_CHUNK_SIZE):
+                chunk = buffer[offset:offset + HASH_CHUNK_SIZE]
+                sha256_hash.update(chunk)
+                f.write(chunk)
 
         # Validate saved file
         validate_file(file_path, check_size=False)
 
         logger.info(f"File saved: {file_path.name} ({uploaded_file.size / 1024:.2f} KB)")
-        return file_path
+        return file_path, sha256_hash.hexdigest()
 
     except Exception as e:
-        # Clean up if save failed
+        # Clean up if save failed (the path was created by this call)
+        f.close()
         if file_path.exists():
             file_path.unlink()
         raise